@@ -5,6 +5,10 @@ Allows users to upload consulting project deliverables and generate templated ca
 
 import os
 import json
+import hashlib
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from flask import Flask, request, jsonify, send_file
 from flask_cors import CORS
@@ -12,7 +16,10 @@ from werkzeug.utils import secure_filename
 import openai
 from dotenv import load_dotenv
 from case_study_generator import CaseStudyGenerator
-from file_processor import FileProcessor
+from file_processor import FileProcessor, extract_many
+from jobs import JobQueue
+from text_store import TextStore, file_digest
+from token_budget import context_limit, count_tokens
 
 # Load environment variables
 load_dotenv()
@@ -25,6 +32,12 @@ UPLOAD_FOLDER = 'uploads'
 OUTPUT_FOLDER = 'outputs'
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'txt', 'xlsx', 'xls'}
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+EXTRACTION_WORKERS = int(os.getenv('EXTRACTION_WORKERS', '0')) or None  # 0 = one per CPU
+EXTRACTION_TIMEOUT = float(os.getenv('EXTRACTION_TIMEOUT', '60'))  # seconds per file
+EXCEL_MAX_ROWS = int(os.getenv('EXCEL_MAX_ROWS', '100'))  # rows shown per sheet
+EXCEL_MAX_COLUMNS = int(os.getenv('EXCEL_MAX_COLUMNS', '20'))  # columns shown per sheet
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '2'))  # case studies generated at once
+TEXT_STORE_PATH = os.getenv('TEXT_STORE_PATH', os.path.join(UPLOAD_FOLDER, 'extracted_text.db'))
 
 # Create folders if they don't exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
@@ -36,7 +49,21 @@ app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
 # Initialize services
 openai.api_key = os.getenv('OPENAI_API_KEY')
 generator = CaseStudyGenerator()
-processor = FileProcessor()
+processor = FileProcessor(excel_max_rows=EXCEL_MAX_ROWS, excel_max_columns=EXCEL_MAX_COLUMNS)
+text_store = TextStore(TEXT_STORE_PATH)
+
+# Extraction settings that change the extracted text, and so the store key
+PROCESSOR_OPTIONS = {'excel_max_rows': EXCEL_MAX_ROWS, 'excel_max_columns': EXCEL_MAX_COLUMNS}
+STORE_SETTINGS = dict(PROCESSOR_OPTIONS, model=generator.model)
+
+# Uploads are extracted in the background; generation waits for a file's
+# pending extraction instead of starting a second one
+prefill_executor = ThreadPoolExecutor(max_workers=2)
+pending_extractions = {}
+pending_lock = threading.Lock()
+
+# Generation runs as background jobs, so requests never wait on extraction or the LLM
+job_queue = JobQueue(max_workers=JOB_WORKERS)
 
 
 def allowed_file(filename):
@@ -44,6 +71,167 @@ def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def _extract_and_store(entries, on_done=None):
+    """
+    Extract files in parallel and keep the successful results in the text store
+    
+    Args:
+        entries: List of dictionaries with filepath, digest, max_tokens and name
+        on_done: Optional callable receiving the index of each finished entry
+    
+    Returns:
+        List of tuples (content, error) in the order of entries
+    """
+    results = extract_many(
+        [entry['filepath'] for entry in entries],
+        max_workers=EXTRACTION_WORKERS,
+        timeout=EXTRACTION_TIMEOUT,
+        max_tokens=[entry['max_tokens'] for entry in entries],
+        model=generator.model,
+        processor_options=PROCESSOR_OPTIONS,
+        on_done=on_done
+    )
+    
+    for entry, (content, error) in zip(entries, results):
+        if error is not None:
+            continue
+        # Text shorter than its limit is complete, whatever limit was asked for
+        limit = entry['max_tokens']
+        if limit is not None and count_tokens(content, generator.model) < limit:
+            limit = None
+        text_store.put(
+            entry['digest'], content, STORE_SETTINGS, token_limit=limit,
+            filename=entry['name'], size=os.path.getsize(entry['filepath'])
+        )
+    
+    return results
+
+
+def prefill_text_store(file_infos):
+    """
+    Start extracting uploaded files into the text store in the background
+    
+    Files are extracted up to the most tokens any generation can use, so
+    later generations read them from the store instead of parsing them.
+    
+    Args:
+        file_infos: List of uploaded file info dictionaries with a digest
+    """
+    max_tokens = context_limit(generator.model) - generator.max_tokens
+    
+    with pending_lock:
+        entries = []
+        for file_info in file_infos:
+            digest = file_info['digest']
+            if digest in pending_extractions or any(entry['digest'] == digest for entry in entries):
+                continue
+            if text_store.get(digest, STORE_SETTINGS, max_tokens) is not None:
+                continue
+            entries.append({
+                'filepath': file_info['filepath'],
+                'digest': digest,
+                'max_tokens': max_tokens,
+                'name': file_info['original_name']
+            })
+        
+        if not entries:
+            return
+        
+        future = prefill_executor.submit(_extract_and_store, entries)
+        for entry in entries:
+            pending_extractions[entry['digest']] = future
+    
+    def finished(_):
+        with pending_lock:
+            for entry in entries:
+                if pending_extractions.get(entry['digest']) is future:
+                    del pending_extractions[entry['digest']]
+    
+    future.add_done_callback(finished)
+
+
+def extract_file_contents(files, template_files, content_budget=None, template_budget=None, report=None):
+    """
+    Get the content of deliverable and template files
+    
+    Content comes from the text store when the file was extracted before,
+    for example at upload time; remaining files are extracted in parallel
+    and added to the store.
+    
+    Args:
+        files: List of uploaded deliverable file info dictionaries
+        template_files: List of uploaded template file info dictionaries
+        content_budget: Optional token limit for each deliverable; extraction
+            of longer files stops early
+        template_budget: Optional token limit for each template file
+        report: Optional job progress callback, called with the number of
+            files done as extraction proceeds
+    
+    Returns:
+        Tuple of (deliverable contents, template contents), each a dictionary
+        keyed by original file name in upload order; files that fail to
+        extract get an error message as their content
+    """
+    entries = [
+        (is_template, {
+            'filepath': file_info['filepath'],
+            'digest': file_digest(file_info['filepath']),
+            'max_tokens': template_budget if is_template else content_budget,
+            'name': file_info.get('original_name')
+        })
+        for is_template, group in ((False, files), (True, template_files))
+        for file_info in group
+        if file_info.get('filepath') and os.path.exists(file_info.get('filepath'))
+    ]
+    
+    done = 0
+    done_lock = threading.Lock()
+    
+    def file_done(_=None):
+        nonlocal done
+        with done_lock:
+            done += 1
+            if report:
+                report('extracting', done=done, total=len(entries))
+    
+    if report:
+        report('extracting', done=0, total=len(entries))
+    
+    results = [None] * len(entries)
+    missing = []
+    for index, (_, entry) in enumerate(entries):
+        with pending_lock:
+            pending = pending_extractions.get(entry['digest'])
+        if pending is not None:
+            try:
+                pending.result()
+            except Exception:
+                pass  # Extracted again below
+        
+        content = text_store.get(entry['digest'], STORE_SETTINGS, entry['max_tokens'])
+        if content is None:
+            missing.append(index)
+        else:
+            results[index] = (content, None)
+            file_done()
+    
+    if missing:
+        extracted = _extract_and_store(
+            [entries[index][1] for index in missing],
+            on_done=file_done
+        )
+        for index, result in zip(missing, extracted):
+            results[index] = result
+    
+    extracted_content = {}
+    template_content = {}
+    for (is_template, entry), (content, error) in zip(entries, results):
+        target = template_content if is_template else extracted_content
+        target[entry['name']] = content if error is None else f"Error processing: {error}"
+    
+    return extracted_content, template_content
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -97,6 +285,7 @@ def upload_files():
                     'saved_name': unique_filename,
                     'filepath': filepath,
                     'size': os.path.getsize(filepath),
+                    'digest': file_digest(filepath),
                     'type': 'deliverable'
                 })
             except Exception as e:
@@ -123,6 +312,7 @@ def upload_files():
                     'saved_name': unique_filename,
                     'filepath': filepath,
                     'size': os.path.getsize(filepath),
+                    'digest': file_digest(filepath),
                     'type': 'template'
                 })
             except Exception as e:
@@ -131,6 +321,9 @@ def upload_files():
         if not uploaded_files:
             return jsonify({'error': 'No files uploaded successfully', 'details': errors}), 400
 
+        # Extract text now so that generating (and regenerating) skips parsing
+        prefill_text_store(uploaded_files + uploaded_templates)
+
         return jsonify({
             'success': True,
             'uploaded_files': uploaded_files,
@@ -148,10 +341,52 @@ def upload_files():
         return jsonify({'error': f'Upload failed: {str(e)}'}), 500
 
 
+def run_case_study_job(files, template_files, project_name, client_name, industry, additional_context, report):
+    """Extract, generate and render one case study. Runs on the job pool."""
+    # No single file can use more than the prompt has room for, so stop
+    # extracting long documents once they reach that
+    content_budget, template_budget = generator.content_budgets(
+        project_name, client_name, industry, additional_context, bool(template_files)
+    )
+    
+    # Extract content from deliverables and templates in one parallel pass
+    extracted_content, template_content = extract_file_contents(
+        files, template_files, content_budget + template_budget, template_budget, report=report
+    )
+    
+    # Generate case study with template reference
+    report('generating')
+    case_study = generator.generate(
+        project_name=project_name,
+        client_name=client_name,
+        industry=industry,
+        extracted_content=extracted_content,
+        template_content=template_content if template_content else None,
+        additional_context=additional_context
+    )
+    
+    # Save case study
+    report('rendering')
+    # The random suffix keeps jobs finishing in the same second apart
+    output_filename = f"case_study_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}.docx"
+    output_path = os.path.join(OUTPUT_FOLDER, output_filename)
+    
+    generator.save_to_docx(case_study, output_path)
+    
+    return {
+        'case_study': case_study,
+        'output_file': output_filename,
+        'output_path': output_path,
+        'generated_at': datetime.now().isoformat()
+    }
+
+
 @app.route('/api/generate-case-study', methods=['POST'])
 def generate_case_study():
     """
-    Generate a templated case study from uploaded files and optional template references
+    Submit a case study generation job for uploaded files and optional template references
+    
+    Returns 202 with a job ID; poll /api/jobs/<job_id> for progress and the result.
     """
     try:
         data = request.get_json()
@@ -171,56 +406,39 @@ def generate_case_study():
         industry = data.get('industry', 'General')
         additional_context = data.get('additionalContext', '')
 
-        # Extract content from project deliverable files
-        extracted_content = {}
-        for file_info in files:
-            filepath = file_info.get('filepath')
-            if filepath and os.path.exists(filepath):
-                try:
-                    content = processor.extract_content(filepath)
-                    extracted_content[file_info.get('original_name')] = content
-                except Exception as e:
-                    extracted_content[file_info.get('original_name')] = f"Error processing: {str(e)}"
-
-        # Extract content from template files (for reference)
-        template_content = {}
-        for file_info in template_files:
-            filepath = file_info.get('filepath')
-            if filepath and os.path.exists(filepath):
-                try:
-                    content = processor.extract_content(filepath)
-                    template_content[file_info.get('original_name')] = content
-                except Exception as e:
-                    template_content[file_info.get('original_name')] = f"Error processing: {str(e)}"
-
-        # Generate case study with template reference
-        case_study = generator.generate(
-            project_name=project_name,
-            client_name=client_name,
-            industry=industry,
-            extracted_content=extracted_content,
-            template_content=template_content if template_content else None,
-            additional_context=additional_context
-        )
-
-        # Save case study
-        output_filename = f"case_study_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx"
-        output_path = os.path.join(OUTPUT_FOLDER, output_filename)
+        # Identical requests in flight share one job
+        dedupe_key = hashlib.sha256(json.dumps(
+            [files, template_files, project_name, client_name, industry, additional_context],
+            sort_keys=True
+        ).encode('utf-8')).hexdigest()
         
-        generator.save_to_docx(case_study, output_path)
+        job_id = job_queue.submit(
+            run_case_study_job,
+            files, template_files, project_name, client_name, industry, additional_context,
+            dedupe_key=dedupe_key
+        )
 
         return jsonify({
             'success': True,
-            'case_study': case_study,
-            'output_file': output_filename,
-            'output_path': output_path,
-            'generated_at': datetime.now().isoformat()
-        }), 200
+            'job_id': job_id,
+            'status_url': f'/api/jobs/{job_id}'
+        }), 202
 
     except Exception as e:
         return jsonify({'error': f'Case study generation failed: {str(e)}'}), 500
 
 
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Report the status, stage progress and result of a case study job"""
+    job = job_queue.get(job_id)
+    
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    return jsonify(job), 200
+
+
 @app.route('/api/download/<filename>', methods=['GET'])
 def download_file(filename):
     """Download generated case study"""
@@ -5,16 +5,27 @@ Generates templated case studies using OpenAI API
 
 import json
 import openai
+from token_budget import context_limit, count_message_tokens, count_tokens, fit_sources
 from docx import Document
 from docx.shared import Pt, RGBColor, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 
+SYSTEM_PROMPT = """You are an expert business consultant specializing in creating 
+                    compelling case studies. Generate a structured one-page case study that clearly 
+                    articulates the problem, solution, and quantifiable impact. Use professional language 
+                    and focus on business value."""
+
+# Share of the input budget given to template examples when both are provided
+TEMPLATE_BUDGET_SHARE = 0.25
+
+
 class CaseStudyGenerator:
     """Generates case studies from project content"""
 
     def __init__(self):
         self.model = "gpt-4"
+        self.max_tokens = 2000
         self.template = self._get_template()
 
     def _get_template(self):
@@ -45,9 +56,12 @@ class CaseStudyGenerator:
             Dictionary containing the structured case study
         """
         
-        # Prepare content for LLM
-        content_summary = self._prepare_content_summary(extracted_content)
-        template_summary = self._prepare_content_summary(template_content) if template_content else None
+        # Prepare content for LLM within the tokens the prompt leaves free
+        content_budget, template_budget = self.content_budgets(
+            project_name, client_name, industry, additional_context, bool(template_content)
+        )
+        content_summary = self._prepare_content_summary(extracted_content, content_budget)
+        template_summary = self._prepare_content_summary(template_content, template_budget) if template_content else None
         
         # Create prompt for case study generation
         prompt = self._create_prompt(
@@ -65,10 +79,7 @@ class CaseStudyGenerator:
             messages=[
                 {
                     "role": "system",
-                    "content": """You are an expert business consultant specializing in creating 
-                    compelling case studies. Generate a structured one-page case study that clearly 
-                    articulates the problem, solution, and quantifiable impact. Use professional language 
-                    and focus on business value."""
+                    "content": SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
@@ -76,7 +87,7 @@ class CaseStudyGenerator:
                 }
             ],
             temperature=0.7,
-            max_tokens=2000
+            max_tokens=self.max_tokens
         )
 
         # Parse response
@@ -93,17 +104,63 @@ class CaseStudyGenerator:
 
         return case_study
 
-    def _prepare_content_summary(self, extracted_content):
-        """Prepare a summary of extracted content"""
-        summary = ""
-        for filename, content in extracted_content.items():
-            summary += f"\n=== {filename} ===\n"
-            # Limit content to first 1000 characters to avoid token limits
-            if isinstance(content, str):
-                summary += content[:1000] + ("..." if len(content) > 1000 else "")
-            else:
-                summary += str(content)[:1000]
-        return summary
+    def content_budgets(self, project_name, client_name, industry, additional_context, has_templates):
+        """
+        Split the tokens left for file content between project files and templates
+        
+        The model's context window, minus the completion and the prompt
+        without any file content, is what the files may use.
+        
+        Returns:
+            Tuple of (project content budget, template budget)
+        
+        Raises:
+            ValueError: If the prompt alone leaves no room for file content
+        """
+        empty_prompt = self._create_prompt(
+            project_name=project_name,
+            client_name=client_name,
+            industry=industry,
+            content_summary="",
+            template_summary=" " if has_templates else None,
+            additional_context=additional_context
+        )
+        prompt_tokens = count_message_tokens([
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": empty_prompt}
+        ], self.model)
+        budget = context_limit(self.model) - self.max_tokens - prompt_tokens
+        
+        if budget < 1:
+            raise ValueError(f"Project details are too long for the {context_limit(self.model)}-token context of {self.model}")
+        
+        if not has_templates:
+            return budget, 0
+        
+        template_budget = int(budget * TEMPLATE_BUDGET_SHARE)
+        return budget - template_budget, template_budget
+
+    def _prepare_content_summary(self, extracted_content, budget):
+        """
+        Prepare a summary of extracted content
+        
+        Args:
+            extracted_content: Dictionary of extracted file contents
+            budget: Tokens the summary may use; each file gets a fair share
+        
+        Returns:
+            Combined content with a header per file
+        """
+        headers = {filename: f"\n=== {filename} ===\n" for filename in extracted_content}
+        header_tokens = sum(count_tokens(header, self.model) for header in headers.values())
+        
+        texts = {
+            filename: content if isinstance(content, str) else str(content)
+            for filename, content in extracted_content.items()
+        }
+        fitted = fit_sources(texts, budget - header_tokens, self.model)
+        
+        return "".join(headers[filename] + fitted[filename] for filename in texts)
 
     def _create_prompt(self, project_name, client_name, industry, content_summary, additional_context, template_summary=None):
         """Create the prompt for case study generation"""
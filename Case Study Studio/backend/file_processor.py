@@ -3,55 +3,141 @@ File Processor Module
 Handles extraction of content from various file formats
 """
 
+import atexit
+import itertools
+import multiprocessing
 import os
+import queue
+import signal
+import threading
+import time
 from pathlib import Path
+from spreadsheet import DEFAULT_MAX_COLUMNS, DEFAULT_MAX_ROWS, iter_xls_sheets, iter_xlsx_sheets, summarize_sheet
+from token_budget import count_tokens
+
+
+# Seconds a single file may take to extract before it is abandoned
+DEFAULT_EXTRACTION_TIMEOUT = 60
+
+# Extra seconds a started file is waited for before the backstop gives up
+# on it, and how often waiting callers check their files
+EXTRACTION_TIMEOUT_GRACE = 5
+POLL_INTERVAL = 0.05
+
+# Worker processes shared by every extraction, started on first use
+_pool = None
+_pool_size = None
+_pool_lock = threading.Lock()
+
+# Workers report (task ID, time.time()) here when they start a file, so a
+# file's deadline never includes time spent queued behind other callers
+_started_queue = None
+_started_times = {}
+_started_lock = threading.Lock()
+_task_ids = itertools.count()
 
 
 class FileProcessor:
     """Processes and extracts content from various file formats"""
-
-    def extract_content(self, filepath):
+    
+    def __init__(self, excel_max_rows=DEFAULT_MAX_ROWS, excel_max_columns=DEFAULT_MAX_COLUMNS):
+        """
+        Args:
+            excel_max_rows: Rows shown per spreadsheet sheet
+            excel_max_columns: Columns shown per spreadsheet sheet
+        """
+        self.excel_max_rows = excel_max_rows
+        self.excel_max_columns = excel_max_columns
+    
+    def extract_content(self, filepath, max_chars=None, max_tokens=None, model="gpt-4"):
         """
         Extract content from a file based on its type
         
+        Extraction stops as soon as the optional limits are met, so only
+        the part of a large document that will be used is parsed.
+        
         Args:
             filepath: Path to the file
+            max_chars: Optional maximum number of characters to return
+            max_tokens: Optional number of tokens after which extraction stops;
+                the result may run past it by part of a page
+            model: Model whose tokenizer counts max_tokens
         
         Returns:
             Extracted content as string
         """
+        pieces = []
+        chars = 0
+        tokens = 0
+        
+        for piece in self.iter_content(filepath):
+            pieces.append(piece)
+            chars += len(piece) + 1
+            if max_tokens is not None:
+                tokens += count_tokens(piece, model)
+            
+            if (max_chars is not None and chars >= max_chars) or (max_tokens is not None and tokens >= max_tokens):
+                break
+        
+        content = '\n'.join(pieces)
+        return content[:max_chars] if max_chars is not None else content
+    
+    def iter_content(self, filepath):
+        """
+        Lazily extract content from a file based on its type
+        
+        PDFs are yielded one page at a time; other formats are yielded
+        as a single piece.
+        
+        Args:
+            filepath: Path to the file
+        
+        Yields:
+            Extracted text pieces in document order
+        """
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"File not found: {filepath}")
         
         file_ext = Path(filepath).suffix.lower()
         
         if file_ext == '.pdf':
-            return self._extract_pdf(filepath)
+            yield from self.iter_pdf_pages(filepath)
         elif file_ext == '.docx':
-            return self._extract_docx(filepath)
+            yield self._extract_docx(filepath)
         elif file_ext == '.txt':
-            return self._extract_txt(filepath)
+            yield self._extract_txt(filepath)
         elif file_ext in ['.xlsx', '.xls']:
-            return self._extract_excel(filepath)
+            yield self._extract_excel(filepath)
         else:
             raise ValueError(f"Unsupported file format: {file_ext}")
-
-    def _extract_pdf(self, filepath):
-        """Extract text from PDF file"""
+    
+    def iter_pdf_pages(self, filepath):
+        """
+        Extract text from a PDF file one page at a time
+        
+        Pages are only parsed when the caller asks for them, so stopping
+        early skips the remaining pages entirely.
+        
+        Args:
+            filepath: Path to the PDF file
+        
+        Yields:
+            Text of each page in page order
+        """
         try:
             import PyPDF2
-            content = []
+        except ImportError:
+            yield "PyPDF2 not available. Install it to process PDF files."
+            return
+        
+        try:
             with open(filepath, 'rb') as f:
                 pdf_reader = PyPDF2.PdfReader(f)
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    content.append(page.extract_text())
-            return '\n'.join(content)
-        except ImportError:
-            return "PyPDF2 not available. Install it to process PDF files."
+                for page in pdf_reader.pages:
+                    yield page.extract_text()
         except Exception as e:
             raise Exception(f"Error extracting PDF: {str(e)}")
-
+    
     def _extract_docx(self, filepath):
         """Extract text from DOCX file"""
         try:
@@ -74,7 +160,7 @@ class FileProcessor:
             return "python-docx not available. Install it to process DOCX files."
         except Exception as e:
             raise Exception(f"Error extracting DOCX: {str(e)}")
-
+    
     def _extract_txt(self, filepath):
         """Extract text from TXT file"""
         try:
@@ -86,28 +172,31 @@ class FileProcessor:
                 return f.read()
         except Exception as e:
             raise Exception(f"Error extracting TXT: {str(e)}")
-
+    
     def _extract_excel(self, filepath):
-        """Extract data from Excel file"""
+        """
+        Summarize an Excel workbook sheet by sheet
+        
+        Workbooks are streamed rather than loaded, and each sheet becomes
+        its shape, headers, numeric column statistics and a sample of rows
+        within the processor's row and column budget.
+        """
         try:
-            import openpyxl
-            content = []
-            workbook = openpyxl.load_workbook(filepath)
+            if Path(filepath).suffix.lower() == '.xls':
+                sheets = iter_xls_sheets(filepath)
+            else:
+                sheets = iter_xlsx_sheets(filepath)
             
-            for sheet in workbook.sheetnames:
-                ws = workbook[sheet]
-                content.append(f"\n=== Sheet: {sheet} ===\n")
-                
-                for row in ws.iter_rows(values_only=True):
-                    row_content = [str(cell) if cell is not None else "" for cell in row]
-                    content.append(' | '.join(row_content))
+            content = []
+            for name, rows in sheets:
+                content.append(summarize_sheet(name, rows, self.excel_max_rows, self.excel_max_columns))
             
             return '\n'.join(content)
         except ImportError:
             return "openpyxl not available. Install it to process Excel files."
         except Exception as e:
             raise Exception(f"Error extracting Excel: {str(e)}")
-
+    
     def validate_file(self, filepath, allowed_extensions=None):
         """
         Validate if file is acceptable
@@ -135,3 +224,193 @@ class FileProcessor:
             return False, "File size exceeds 50MB limit"
         
         return True, "Valid"
+
+
+def _alarm(signum, frame):
+    raise TimeoutError("Extraction timed out")
+
+
+def _init_worker(started_queue):
+    global _started_queue
+    _started_queue = started_queue
+
+
+def _extract_in_worker(filepath, timeout, max_tokens, model, processor_options, task_id=None):
+    """
+    Extract one file inside a pool worker
+    
+    Returns:
+        Tuple (extracted content, None) on success or (None, error message)
+    """
+    if task_id is not None and _started_queue is not None:
+        _started_queue.put((task_id, time.time()))
+    
+    # Pool workers run tasks on their main thread, so an alarm can interrupt
+    # a parser stuck in CPU-bound work (not available on Windows)
+    use_alarm = hasattr(signal, 'SIGALRM') and timeout and threading.current_thread() is threading.main_thread()
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return FileProcessor(**processor_options).extract_content(filepath, max_tokens=max_tokens, model=model), None
+    except TimeoutError:
+        return None, f"Extraction timed out after {timeout:g} seconds"
+    except Exception as e:
+        return None, str(e)
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _pool_context():
+    """Start method for pool workers that never inherits the server's threads"""
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def get_extraction_pool(max_workers=None):
+    """
+    Return the process-wide extraction pool, creating it on first use
+    
+    Workers are started with forkserver, or spawn where forkserver is not
+    available, so they never inherit the web server's threads, locks or
+    sockets, and they stay alive between requests instead of being forked
+    for every call. The pool is shut down when the interpreter exits.
+    
+    Args:
+        max_workers: Number of worker processes if this call creates the
+            pool (default: CPU count)
+    
+    Returns:
+        Tuple (pool, number of worker processes)
+    """
+    global _pool, _pool_size, _started_queue
+    with _pool_lock:
+        if _pool is None:
+            context = _pool_context()
+            if _started_queue is None:
+                _started_queue = context.Queue()
+            _pool_size = max(1, max_workers or os.cpu_count() or 1)
+            _pool = context.Pool(processes=_pool_size, initializer=_init_worker, initargs=(_started_queue,))
+        return _pool, _pool_size
+
+
+def _start_times():
+    """Start time of every file a worker has picked up, by task ID"""
+    with _started_lock:
+        while _started_queue is not None:
+            try:
+                task_id, started = _started_queue.get_nowait()
+            except queue.Empty:
+                break
+            _started_times[task_id] = started
+        return dict(_started_times)
+
+
+def shutdown_extraction_pool(pool=None):
+    """
+    Stop the shared pool's workers; the next extraction starts a new pool
+    
+    Args:
+        pool: Only shut down if this is still the shared pool
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or (pool is not None and pool is not _pool):
+            return
+        pool, _pool = _pool, None
+    
+    pool.terminate()
+    pool.join()
+
+
+atexit.register(shutdown_extraction_pool)
+
+
+def extract_many(filepaths, max_workers=None, timeout=DEFAULT_EXTRACTION_TIMEOUT, max_tokens=None, model="gpt-4", processor_options=None, on_done=None):
+    """
+    Extract content from several files in parallel worker processes
+    
+    PDF and spreadsheet parsing is CPU-bound, so files are spread over the
+    shared extraction pool (see get_extraction_pool()) and the total time
+    approaches that of the slowest file. A file that fails or runs longer
+    than the timeout only affects its own result.
+    
+    Args:
+        filepaths: List of file paths
+        max_workers: Number of worker processes if the shared pool does not
+            exist yet (default: CPU count)
+        timeout: Seconds each file may take to extract, counted from when
+            a worker starts it
+        max_tokens: Optional token limit after which a file's extraction
+            stops, either one value for all files or a list with one per file
+        model: Model whose tokenizer counts max_tokens
+        processor_options: Optional FileProcessor keyword arguments, such as
+            excel_max_rows
+        on_done: Optional callable receiving the index of each file as its
+            extraction finishes, in completion order
+    
+    Returns:
+        List of tuples (content, error) in the order of filepaths, where
+        exactly one of content and error is None
+    """
+    if not filepaths:
+        return []
+    
+    if not isinstance(max_tokens, (list, tuple)):
+        max_tokens = [max_tokens] * len(filepaths)
+    
+    pool, _ = get_extraction_pool(max_workers)
+    results = [(None, "Extraction did not finish")] * len(filepaths)
+    timed_out = False
+    
+    pending = {}
+    for index, (filepath, limit) in enumerate(zip(filepaths, max_tokens)):
+        task_id = next(_task_ids)
+        pending[index] = (task_id, pool.apply_async(
+            _extract_in_worker,
+            (filepath, timeout, limit, model, processor_options or {}, task_id),
+            callback=(lambda _, index=index: on_done(index)) if on_done else None
+        ))
+    task_ids = [task_id for task_id, _ in pending.values()]
+    
+    # Backstop for platforms without alarms and for workers that died: a
+    # file is given up on once it has run for longer than its timeout.
+    # Files still queued behind other callers' work have no deadline yet.
+    while pending:
+        started = _start_times()
+        now = time.time()
+        for index, (task_id, result) in list(pending.items()):
+            try:
+                results[index] = result.get(timeout=0)
+            except multiprocessing.TimeoutError:
+                if not timeout or task_id not in started:
+                    continue
+                if now - started[task_id] <= timeout + EXTRACTION_TIMEOUT_GRACE:
+                    continue
+                results[index] = (None, f"Extraction timed out after {timeout:g} seconds")
+                timed_out = True
+            except Exception as e:
+                results[index] = (None, str(e))
+            del pending[index]
+        
+        if not pending:
+            break
+        if _pool is not pool:
+            # Another caller replaced the pool, so the remaining files never run
+            for index in pending:
+                results[index] = (None, "Extraction was cancelled because the worker pool was restarted")
+            break
+        next(iter(pending.values()))[1].wait(POLL_INTERVAL)
+    
+    with _started_lock:
+        for task_id in task_ids:
+            _started_times.pop(task_id, None)
+    
+    # Without alarms a stuck parser cannot be interrupted, so its worker is
+    # only freed by replacing the pool
+    if timed_out and not hasattr(signal, 'SIGALRM'):
+        shutdown_extraction_pool(pool)
+    
+    return results
@@ -0,0 +1,115 @@
+"""
+Jobs Module
+Runs case study generation in the background and tracks its progress
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class JobQueue:
+    """
+    Runs jobs on a bounded worker pool and keeps their records in memory
+    
+    A job function receives a ``report`` keyword argument it can call with
+    a stage name and optional details to publish progress. Submissions
+    with the same dedupe key share one job while it is queued or running,
+    so a double-clicked generate button costs one LLM call, while a later
+    resubmission still generates a fresh case study.
+    """
+    
+    def __init__(self, max_workers=2, ttl=3600):
+        """
+        Args:
+            max_workers: Number of jobs run at once
+            ttl: Seconds a finished job is kept before it is discarded
+        """
+        self.ttl = ttl
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="case-study-job")
+        self._jobs = {}
+        self._dedupe = {}
+        self._lock = threading.Lock()
+    
+    def submit(self, fn, *args, dedupe_key=None, **kwargs):
+        """
+        Submit a job
+        
+        Args:
+            fn: Job function; its return value becomes the job result
+            *args: Positional arguments for fn
+            dedupe_key: Submissions with the same key share one job while it
+                is in flight
+            **kwargs: Keyword arguments for fn
+        
+        Returns:
+            The job identifier to poll with get()
+        """
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        
+        with self._lock:
+            self._purge(now)
+            
+            if dedupe_key is not None:
+                existing = self._jobs.get(self._dedupe.get(dedupe_key))
+                if existing is not None and existing['status'] in (QUEUED, RUNNING):
+                    return existing['job_id']
+                self._dedupe[dedupe_key] = job_id
+            
+            self._jobs[job_id] = {
+                'job_id': job_id,
+                'status': QUEUED,
+                'stage': QUEUED,
+                'progress': {},
+                'result': None,
+                'error': None,
+                'created_at': now,
+                'updated_at': now
+            }
+        
+        self.executor.submit(self._run, job_id, fn, args, kwargs)
+        return job_id
+    
+    def get(self, job_id):
+        """Get a copy of a job record, or None if it is unknown"""
+        with self._lock:
+            record = self._jobs.get(job_id)
+            return dict(record) if record is not None else None
+    
+    def _update(self, job_id, **fields):
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields, updated_at=time.time())
+    
+    def _run(self, job_id, fn, args, kwargs):
+        """Execute a job and record its outcome"""
+        def report(stage, **progress):
+            self._update(job_id, stage=stage, progress=progress)
+        
+        self._update(job_id, status=RUNNING, stage=RUNNING)
+        
+        try:
+            result = fn(*args, report=report, **kwargs)
+        except Exception as e:
+            self._update(job_id, status=FAILED, stage=FAILED, error=str(e))
+        else:
+            self._update(job_id, status=SUCCEEDED, stage=SUCCEEDED, result=result)
+    
+    def _purge(self, now):
+        """Discard finished jobs older than the TTL (lock held)"""
+        expired = [
+            job_id for job_id, record in self._jobs.items()
+            if record['status'] in (SUCCEEDED, FAILED) and now - record['updated_at'] > self.ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        for key in [key for key, job_id in self._dedupe.items() if job_id not in self._jobs]:
+            del self._dedupe[key]
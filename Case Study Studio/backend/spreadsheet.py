@@ -0,0 +1,247 @@
+"""
+Spreadsheet Module
+Summarizes workbook sheets as compact tables without loading every cell
+"""
+
+import random
+from datetime import date, datetime
+import numpy as np
+
+
+# Rows kept per sheet; half from the top, the rest sampled from below
+DEFAULT_MAX_ROWS = 100
+
+# Columns shown per sheet
+DEFAULT_MAX_COLUMNS = 20
+
+# Rows searched for a header row
+HEADER_SEARCH_ROWS = 10
+
+# Rows buffered before numeric statistics are updated
+STATS_BLOCK_ROWS = 4096
+
+
+def iter_xlsx_sheets(filepath):
+    """
+    Stream the sheets of an .xlsx workbook
+    
+    The workbook is opened read-only, so rows are parsed as they are
+    iterated instead of materializing every cell up front.
+    
+    Args:
+        filepath: Path to the workbook
+    
+    Yields:
+        Tuples (sheet name, iterator of row value tuples)
+    """
+    import openpyxl
+    
+    workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        for worksheet in workbook.worksheets:
+            yield worksheet.title, worksheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def iter_xls_sheets(filepath):
+    """
+    Stream the sheets of a legacy .xls workbook with xlrd
+    
+    Args:
+        filepath: Path to the workbook
+    
+    Yields:
+        Tuples (sheet name, iterator of row value tuples)
+    
+    Raises:
+        ValueError: If xlrd is not installed
+    """
+    try:
+        import xlrd
+    except ImportError:
+        raise ValueError("Reading .xls workbooks requires xlrd; install it or save the file as .xlsx")
+    
+    workbook = xlrd.open_workbook(filepath, on_demand=True)
+    try:
+        for index in range(workbook.nsheets):
+            sheet = workbook.sheet_by_index(index)
+            yield sheet.name, (tuple(sheet.row_values(row)) for row in range(sheet.nrows))
+            workbook.unload_sheet(index)
+    finally:
+        workbook.release_resources()
+
+
+def _is_empty(value):
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _format_cell(value):
+    if _is_empty(value):
+        return ""
+    if isinstance(value, float):
+        if value.is_integer() and abs(value) < 1e15:
+            return f"{int(value):,}"
+        return f"{value:,.2f}" if abs(value) < 1e15 else f"{value:.6g}"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return " ".join(str(value).split())
+
+
+def _find_header(rows):
+    """Index of the header row among the first rows, or None"""
+    widths = [sum(not _is_empty(value) for value in row) for row in rows]
+    if not widths or max(widths) == 0:
+        return None
+    
+    for index, row in enumerate(rows):
+        values = [value for value in row if not _is_empty(value)]
+        if len(values) >= max(2, max(widths) / 2) and all(isinstance(value, str) for value in values):
+            return index
+    return None
+
+
+class ColumnStats:
+    """Running count, min, max and sum of the numeric cells of each column"""
+    
+    def __init__(self, columns):
+        self.count = np.zeros(columns, dtype=np.int64)
+        self.minimum = np.full(columns, np.inf)
+        self.maximum = np.full(columns, -np.inf)
+        self.total = np.zeros(columns)
+    
+    def update(self, block):
+        """Fold a block of rows (NaN for non-numeric cells) into the statistics"""
+        table = np.asarray(block, dtype=float)
+        present = ~np.isnan(table)
+        self.count += present.sum(axis=0)
+        self.minimum = np.fmin(self.minimum, np.where(present, table, np.inf).min(axis=0))
+        self.maximum = np.fmax(self.maximum, np.where(present, table, -np.inf).max(axis=0))
+        self.total += np.where(present, table, 0.0).sum(axis=0)
+    
+    def describe(self, index):
+        """Statistics of one column, or None if it has no numeric cells"""
+        if not self.count[index]:
+            return None
+        return {
+            'count': int(self.count[index]),
+            'min': float(self.minimum[index]),
+            'max': float(self.maximum[index]),
+            'mean': float(self.total[index] / self.count[index]),
+            'sum': float(self.total[index])
+        }
+
+
+def summarize_sheet(name, rows, max_rows=DEFAULT_MAX_ROWS, max_columns=DEFAULT_MAX_COLUMNS, seed=0):
+    """
+    Summarize one sheet as its shape, headers, numeric column statistics
+    and a sample of rows
+    
+    Rows are consumed one at a time. The first half of the row budget is
+    kept from the top of the sheet and the rest is a uniform reservoir
+    sample of the remaining rows. Numeric statistics are updated in
+    blocks of rows, so memory stays flat however long the sheet is.
+    
+    Args:
+        name: Sheet name
+        rows: Iterable of row value tuples
+        max_rows: Maximum number of data rows shown
+        max_columns: Maximum number of columns shown
+        seed: Seed for the row sample, so summaries are reproducible
+    
+    Returns:
+        Summary text of the sheet
+    """
+    rows = (row for row in rows if any(not _is_empty(value) for value in row))
+    
+    leading = []
+    for row in rows:
+        leading.append(row)
+        if len(leading) == HEADER_SEARCH_ROWS:
+            break
+    
+    header_index = _find_header(leading)
+    preamble = leading[:header_index] if header_index is not None else []
+    header = leading[header_index] if header_index is not None else ()
+    first_rows = leading[header_index + 1:] if header_index is not None else leading
+    
+    head_budget = (max_rows + 1) // 2
+    rng = random.Random(seed)
+    head = []
+    reservoir = []
+    stats = ColumnStats(max_columns)
+    block = []
+    width = max((index + 1 for index, value in enumerate(header) if not _is_empty(value)), default=0)
+    row_count = 0
+    
+    def take(row):
+        nonlocal width, row_count
+        filled = [index for index, value in enumerate(row) if not _is_empty(value)]
+        width = max(width, filled[-1] + 1)
+        shown = row[:max_columns]
+        block.append([value if _is_number(value) else np.nan for value in shown] + [np.nan] * (max_columns - len(shown)))
+        if len(block) == STATS_BLOCK_ROWS:
+            stats.update(block)
+            block.clear()
+        
+        if len(head) < head_budget:
+            head.append((row_count, shown))
+        elif len(reservoir) < max_rows - head_budget:
+            reservoir.append((row_count, shown))
+        else:
+            slot = rng.randint(0, row_count - head_budget)
+            if slot < len(reservoir):
+                reservoir[slot] = (row_count, shown)
+        row_count += 1
+    
+    for row in first_rows:
+        take(row)
+    for row in rows:
+        take(row)
+    if block:
+        stats.update(block)
+    
+    # Drop trailing columns without a header or any value in the kept rows
+    sample = head + sorted(reservoir)
+    used = [
+        index for index in range(min(width, max_columns))
+        if (index < len(header) and not _is_empty(header[index]))
+        or any(index < len(values) and not _is_empty(values[index]) for _, values in sample)
+        or stats.count[index]
+    ]
+    columns = used[-1] + 1 if used else 0
+    names = [
+        _format_cell(header[index]) if index < len(header) and not _is_empty(header[index]) else f"Column {index + 1}"
+        for index in range(columns)
+    ]
+    
+    lines = [f"\n=== Sheet: {name} ({row_count} rows x {width} columns) ===\n"]
+    for row in preamble:
+        lines.append(' '.join(_format_cell(value) for value in row if not _is_empty(value)))
+    
+    if columns:
+        more = f" (+{width - columns} more columns)" if width > columns else ""
+        lines.append(f"Columns: {' | '.join(names)}{more}")
+    
+    numeric = [(names[index], stats.describe(index)) for index in range(columns)]
+    numeric = [(column, values) for column, values in numeric if values]
+    if numeric:
+        lines.append("Numeric columns:")
+        for column, values in numeric:
+            lines.append(
+                f"- {column}: count {values['count']}, min {_format_cell(values['min'])}, "
+                f"max {_format_cell(values['max'])}, mean {_format_cell(values['mean'])}, "
+                f"sum {_format_cell(values['sum'])}"
+            )
+    
+    if sample:
+        label = f"Rows ({len(sample)} of {row_count}):" if len(sample) < row_count else "Rows:"
+        lines.append(label)
+        for _, values in sample:
+            lines.append(' | '.join(_format_cell(values[index]) if index < len(values) else "" for index in range(columns)))
+    
+    return '\n'.join(lines)
@@ -0,0 +1,33 @@
+"""Shared fixtures for the Case Study Studio backend tests."""
+
+import os
+import sys
+import pytest
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import token_budget
+
+
+@pytest.fixture(autouse=True)
+def character_token_counts(monkeypatch):
+    """Count tokens with the character estimate, whether or not tiktoken is installed."""
+    monkeypatch.setattr(token_budget, "_encoding_for", lambda model: None)
+
+
+def write_docx(path, paragraphs):
+    """
+    Write a small Word document to disk.
+    
+    Args:
+        path: Where to save the .docx file
+        paragraphs: Paragraph texts in order
+    """
+    from docx import Document
+    
+    document = Document()
+    for text in paragraphs:
+        document.add_paragraph(text)
+    document.save(str(path))
+    return path
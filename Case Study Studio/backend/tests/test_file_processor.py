@@ -0,0 +1,211 @@
+"""Test cases for file extraction and the shared extraction pool."""
+
+import queue
+import signal
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.pool import ThreadPool
+from pathlib import Path
+import sys
+import os
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import file_processor
+from file_processor import FileProcessor, extract_many, get_extraction_pool, shutdown_extraction_pool
+from conftest import write_docx
+
+
+@pytest.fixture(scope="module", autouse=True)
+def extraction_pool():
+    """Share one worker pool across the tests and stop it afterwards."""
+    yield
+    shutdown_extraction_pool()
+
+
+class TestExtractMany:
+    """Tests for parallel extraction in worker processes."""
+    
+    def test_results_keep_input_order_and_isolate_failures(self, tmp_path):
+        """Test that a broken file only affects its own result."""
+        notes = tmp_path / "notes.txt"
+        notes.write_text("Kickoff notes")
+        report = write_docx(tmp_path / "report.docx", ["Revenue grew 12%", "Churn fell"])
+        unsupported = tmp_path / "image.png"
+        unsupported.write_bytes(b"png")
+        finished = []
+        
+        results = extract_many(
+            [str(notes), str(tmp_path / "missing.txt"), str(report), str(unsupported)],
+            max_workers=2,
+            on_done=finished.append
+        )
+        
+        assert results[0] == ("Kickoff notes", None)
+        assert results[1][0] is None and "File not found" in results[1][1]
+        assert results[2] == ("Revenue grew 12%\nChurn fell", None)
+        assert results[3] == (None, "Unsupported file format: .png")
+        assert sorted(finished) == [0, 1, 2, 3]
+    
+    def test_pool_is_created_once_and_reused(self, tmp_path):
+        """Test that calls share one process-wide pool until it is shut down."""
+        notes = tmp_path / "notes.txt"
+        notes.write_text("Kickoff notes")
+        
+        extract_many([str(notes)], max_workers=2)
+        pool, workers = get_extraction_pool()
+        extract_many([str(notes)], max_workers=4)
+        
+        assert get_extraction_pool() == (pool, workers)
+        
+        shutdown_extraction_pool(object())
+        assert get_extraction_pool()[0] is pool
+        shutdown_extraction_pool(pool)
+        assert file_processor._pool is None
+    
+    def test_empty_input_starts_no_pool(self):
+        """Test that nothing is extracted, or started, for no files."""
+        shutdown_extraction_pool()
+        
+        assert extract_many([]) == []
+        assert file_processor._pool is None
+    
+    @pytest.mark.skipif(not hasattr(signal, "SIGALRM"), reason="alarms are not available")
+    def test_alarm_interrupts_stuck_extraction(self, monkeypatch, tmp_path):
+        """Test that a CPU-bound parser is stopped at the timeout."""
+        def spin(self, filepath, **kwargs):
+            while True:
+                pass
+        
+        monkeypatch.setattr(FileProcessor, "extract_content", spin)
+        started = time.monotonic()
+        
+        result = file_processor._extract_in_worker(str(tmp_path / "deck.pdf"), 0.2, None, "gpt-4", {})
+        
+        assert result == (None, "Extraction timed out after 0.2 seconds")
+        assert time.monotonic() - started < 2
+        assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+
+class TestExtractionDeadline:
+    """Tests for the per-file backstop when callers share the pool."""
+    
+    def test_queued_files_are_not_timed_out_by_other_callers(self, monkeypatch, tmp_path):
+        """Test that a file waiting behind another call's files still runs."""
+        def slow(self, filepath, **kwargs):
+            time.sleep(0.3)
+            return Path(filepath).name
+        
+        pool = ThreadPool(1)
+        monkeypatch.setattr(FileProcessor, "extract_content", slow)
+        monkeypatch.setattr(file_processor, "EXTRACTION_TIMEOUT_GRACE", 0.1)
+        monkeypatch.setattr(file_processor, "_started_queue", queue.Queue())
+        monkeypatch.setattr(file_processor, "get_extraction_pool", lambda max_workers=None: (pool, 1))
+        monkeypatch.setattr(file_processor, "_pool", pool)
+        
+        first = [str(tmp_path / f"first{index}.txt") for index in range(3)]
+        with ThreadPoolExecutor(max_workers=2) as callers:
+            earlier = callers.submit(extract_many, first, timeout=0.5)
+            time.sleep(0.05)
+            later = callers.submit(extract_many, [str(tmp_path / "second.txt")], timeout=0.5)
+            
+            assert earlier.result() == [(Path(path).name, None) for path in first]
+            assert later.result() == [("second.txt", None)]
+        pool.terminate()
+        assert file_processor._started_times == {}
+    
+    def test_started_file_past_its_deadline_is_given_up(self, monkeypatch, tmp_path):
+        """Test that the backstop still reports a file that runs too long."""
+        def stuck(self, filepath, **kwargs):
+            time.sleep(1)
+            return "late"
+        
+        pool = ThreadPool(1)
+        monkeypatch.setattr(FileProcessor, "extract_content", stuck)
+        monkeypatch.setattr(file_processor, "EXTRACTION_TIMEOUT_GRACE", 0.1)
+        monkeypatch.setattr(file_processor, "_started_queue", queue.Queue())
+        monkeypatch.setattr(file_processor, "get_extraction_pool", lambda max_workers=None: (pool, 1))
+        monkeypatch.setattr(file_processor, "_pool", pool)
+        
+        started = time.monotonic()
+        assert extract_many([str(tmp_path / "deck.pdf")], timeout=0.2) == [
+            (None, "Extraction timed out after 0.2 seconds")
+        ]
+        assert time.monotonic() - started < 0.9
+        pool.terminate()
+
+
+class FakePage:
+    """PDF page that records when its text is extracted."""
+    
+    def __init__(self, number, parsed):
+        self.number = number
+        self.parsed = parsed
+    
+    def extract_text(self):
+        self.parsed.append(self.number)
+        return f"Page {self.number} " + "word " * 99
+
+
+class InlinePool:
+    """Pool stand-in that runs each task immediately in the calling process."""
+    
+    def apply_async(self, fn, args, callback=None):
+        result = fn(*args)
+        if callback is not None:
+            callback(result)
+        return type("Result", (), {"get": lambda self, timeout=None: result})()
+
+
+class TestExtractionBudget:
+    """Tests for stopping extraction once the token budget is met."""
+    
+    def test_pdf_pages_are_parsed_only_up_to_the_budget(self, monkeypatch, tmp_path):
+        """Test that pages past the token limit are never extracted."""
+        import PyPDF2
+        
+        parsed = []
+        monkeypatch.setattr(
+            PyPDF2, "PdfReader",
+            lambda f: type("Reader", (), {"pages": [FakePage(n, parsed) for n in range(1, 401)]})()
+        )
+        report = tmp_path / "report.pdf"
+        report.write_bytes(b"%PDF")
+        
+        content = FileProcessor().extract_content(str(report), max_tokens=300)
+        
+        assert parsed == [1, 2, 3]
+        assert content.startswith("Page 1 ") and "Page 3 " in content
+        
+        parsed.clear()
+        assert "Page 400 " in FileProcessor().extract_content(str(report))
+        assert len(parsed) == 400
+    
+    def test_char_and_token_limits(self, tmp_path):
+        """Test that max_chars cuts the text and small files are returned whole."""
+        notes = tmp_path / "notes.txt"
+        notes.write_text("x" * 1000)
+        processor = FileProcessor()
+        
+        assert processor.extract_content(str(notes), max_chars=10) == "x" * 10
+        assert processor.extract_content(str(notes), max_tokens=5000) == "x" * 1000
+    
+    def test_extract_many_applies_a_limit_per_file(self, monkeypatch, tmp_path):
+        """Test that per-file token limits reach the worker processes."""
+        seen = []
+        monkeypatch.setattr(
+            file_processor, "get_extraction_pool",
+            lambda max_workers=None: (InlinePool(), 1)
+        )
+        monkeypatch.setattr(
+            file_processor, "_extract_in_worker",
+            lambda filepath, timeout, limit, model, options, task_id: seen.append((filepath, limit, model)) or ("text", None)
+        )
+        
+        results = extract_many(["a.pdf", "b.pdf"], max_tokens=[100, None], model="gpt-4o")
+        
+        assert results == [("text", None), ("text", None)]
+        assert seen == [("a.pdf", 100, "gpt-4o"), ("b.pdf", None, "gpt-4o")]
+
@@ -0,0 +1,111 @@
+"""Test cases for the background case study job queue."""
+
+import threading
+import time
+from unittest.mock import patch
+import sys
+import os
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from jobs import FAILED, QUEUED, RUNNING, SUCCEEDED, JobQueue
+
+
+def wait_for(queue, job_id, timeout=5):
+    """Poll a job until it finishes and return its record."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        record = queue.get(job_id)
+        if record['status'] in (SUCCEEDED, FAILED):
+            return record
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+class TestJobQueue:
+    """Tests for JobQueue."""
+    
+    def test_job_reports_stages_and_result(self):
+        """Test that a job's progress reports and return value are recorded."""
+        release = threading.Event()
+        
+        def job(value, report):
+            report('extracting', done=1, total=2)
+            release.wait(5)
+            return value * 2
+        
+        queue = JobQueue(max_workers=1)
+        job_id = queue.submit(job, 21)
+        
+        deadline = time.monotonic() + 5
+        while queue.get(job_id)['stage'] != 'extracting' and time.monotonic() < deadline:
+            time.sleep(0.01)
+        record = queue.get(job_id)
+        assert record['status'] == RUNNING
+        assert record['progress'] == {'done': 1, 'total': 2}
+        
+        release.set()
+        record = wait_for(queue, job_id)
+        assert record['status'] == SUCCEEDED
+        assert record['result'] == 42
+        assert record['error'] is None
+    
+    def test_failed_job_records_error(self):
+        """Test that an exception marks the job failed with its message."""
+        def job(report):
+            raise ValueError("Project details are too long")
+        
+        queue = JobQueue(max_workers=1)
+        record = wait_for(queue, queue.submit(job))
+        
+        assert record['status'] == FAILED
+        assert record['stage'] == FAILED
+        assert record['error'] == "Project details are too long"
+    
+    def test_dedupe_key_shares_in_flight_jobs_only(self):
+        """Test that duplicate submissions share a job until it finishes."""
+        release = threading.Event()
+        calls = []
+        
+        def job(report):
+            calls.append(1)
+            release.wait(5)
+            return len(calls)
+        
+        queue = JobQueue(max_workers=2)
+        first = queue.submit(job, dedupe_key="same")
+        assert queue.submit(job, dedupe_key="same") == first
+        assert queue.submit(job, dedupe_key="other") != first
+        
+        release.set()
+        wait_for(queue, first)
+        later = queue.submit(job, dedupe_key="same")
+        
+        assert later != first
+        wait_for(queue, later)
+        assert len(calls) == 3
+    
+    def test_finished_jobs_expire_after_ttl(self):
+        """Test that finished jobs are purged once they are older than the TTL."""
+        queue = JobQueue(max_workers=1, ttl=60)
+        job_id = queue.submit(lambda report: "done")
+        wait_for(queue, job_id)
+        
+        with patch("jobs.time.time", return_value=time.time() + 120):
+            queue.submit(lambda report: "next")
+        
+        assert queue.get(job_id) is None
+        assert queue.get("unknown") is None
+    
+    def test_new_jobs_start_queued(self):
+        """Test that a job waiting for a worker is reported as queued."""
+        release = threading.Event()
+        queue = JobQueue(max_workers=1)
+        running = queue.submit(lambda report: release.wait(5))
+        waiting = queue.submit(lambda report: None)
+        
+        assert queue.get(waiting)['status'] == QUEUED
+        release.set()
+        wait_for(queue, running)
+        assert wait_for(queue, waiting)['status'] == SUCCEEDED
@@ -0,0 +1,96 @@
+"""Test cases for streaming spreadsheet summaries."""
+
+import openpyxl
+import sys
+import os
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import spreadsheet
+from spreadsheet import iter_xlsx_sheets, summarize_sheet
+
+
+def sales_rows(count):
+    """A title line, a header row and count data rows."""
+    yield ("Quarterly sales export", None, None)
+    yield ("Region", "Units", "Revenue")
+    for index in range(count):
+        yield (f"R{index}", index, float(index) * 2.5)
+
+
+def sampled_regions(summary):
+    """Region names of the sampled rows in a summary."""
+    lines = summary.split("\n")
+    start = next(index for index, line in enumerate(lines) if line.startswith("Rows"))
+    return [line.split(" | ")[0] for line in lines[start + 1:]]
+
+
+class TestSummarizeSheet:
+    """Tests for summarize_sheet and its row sampling."""
+    
+    def test_header_preamble_and_statistics(self):
+        """Test that the summary lists the shape, headers and numeric columns."""
+        summary = summarize_sheet("Sales", sales_rows(4))
+        
+        assert "=== Sheet: Sales (4 rows x 3 columns) ===" in summary
+        assert "Quarterly sales export" in summary
+        assert "Columns: Region | Units | Revenue" in summary
+        assert "- Units: count 4, min 0, max 3, mean 1.50, sum 6" in summary
+        assert "Rows:" in summary
+        assert sampled_regions(summary) == ["R0", "R1", "R2", "R3"]
+    
+    def test_reservoir_keeps_top_rows_and_a_sorted_sample(self):
+        """Test that long sheets keep the first rows plus an ordered sample of the rest."""
+        summary = summarize_sheet("Sales", sales_rows(10000), max_rows=10)
+        regions = sampled_regions(summary)
+        indexes = [int(region[1:]) for region in regions]
+        
+        assert "Rows (10 of 10000):" in summary
+        assert indexes[:5] == [0, 1, 2, 3, 4]
+        assert indexes[5:] == sorted(indexes[5:])
+        assert all(index >= 5 for index in indexes[5:])
+        assert len(set(indexes)) == 10
+        assert summary == summarize_sheet("Sales", sales_rows(10000), max_rows=10)
+        assert regions != sampled_regions(summarize_sheet("Sales", sales_rows(10000), max_rows=10, seed=1))
+    
+    def test_reservoir_sample_is_uniform(self):
+        """Test that every later row is about equally likely to be sampled."""
+        counts = [0] * 4
+        for seed in range(2000):
+            summary = summarize_sheet("Sales", sales_rows(102), max_rows=4, seed=seed)
+            for region in sampled_regions(summary)[2:]:
+                counts[(int(region[1:]) - 2) * 4 // 100] += 1
+        
+        # 4000 sampled rows over four equal quarters of the sheet
+        assert all(900 < count < 1100 for count in counts)
+    
+    def test_statistics_cover_rows_beyond_the_sample(self, monkeypatch):
+        """Test that numeric statistics include every row, across stats blocks."""
+        monkeypatch.setattr(spreadsheet, "STATS_BLOCK_ROWS", 7)
+        summary = summarize_sheet("Sales", sales_rows(100), max_rows=4)
+        
+        assert "- Units: count 100, min 0, max 99, mean 49.50, sum 4,950" in summary
+        assert "- Revenue: count 100, min 0, max 247.50, mean 123.75, sum 12,375" in summary
+    
+    def test_columns_are_capped(self):
+        """Test that wide sheets show max_columns columns and report the rest."""
+        rows = [tuple(f"H{index}" for index in range(30))] + [tuple(range(30))] * 3
+        summary = summarize_sheet("Wide", rows, max_columns=5)
+        
+        assert "(3 rows x 30 columns)" in summary
+        assert "Columns: H0 | H1 | H2 | H3 | H4 (+25 more columns)" in summary
+    
+    def test_xlsx_workbooks_are_streamed_per_sheet(self, tmp_path):
+        """Test that every sheet of a workbook is read in order."""
+        workbook = openpyxl.Workbook()
+        workbook.active.title = "Sales"
+        workbook.active.append(["Region", "Units"])
+        workbook.active.append(["North", 12])
+        workbook.create_sheet("Costs").append(["Item", "Amount"])
+        path = tmp_path / "book.xlsx"
+        workbook.save(path)
+        
+        sheets = [(name, list(rows)) for name, rows in iter_xlsx_sheets(str(path))]
+        
+        assert sheets == [("Sales", [("Region", "Units"), ("North", 12)]), ("Costs", [("Item", "Amount")])]
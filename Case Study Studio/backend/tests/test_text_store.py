@@ -0,0 +1,72 @@
+"""Test cases for the content-addressed extracted text store."""
+
+import threading
+import sys
+import os
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from text_store import TextStore, file_digest
+
+
+SETTINGS = {"excel_max_rows": 100, "excel_max_columns": 20, "model": "gpt-4"}
+
+
+class TestTextStore:
+    """Tests for TextStore and file_digest."""
+    
+    def test_digest_depends_only_on_content(self, tmp_path):
+        """Test that renamed copies share a digest and edits change it."""
+        original = tmp_path / "report.txt"
+        original.write_text("Revenue grew 12%")
+        copy = tmp_path / "report (1).txt"
+        copy.write_text("Revenue grew 12%")
+        edited = tmp_path / "edited.txt"
+        edited.write_text("Revenue grew 13%")
+        
+        assert file_digest(str(original)) == file_digest(str(copy))
+        assert file_digest(str(original)) != file_digest(str(edited))
+        assert file_digest(str(original), block_size=4) == file_digest(str(original))
+    
+    def test_entries_are_keyed_by_digest_and_settings(self, tmp_path):
+        """Test that text is only returned for the settings it was extracted with."""
+        store = TextStore(str(tmp_path / "text.db"))
+        store.put("abc", "full text", SETTINGS, filename="report.txt", size=9)
+        
+        assert store.get("abc", SETTINGS) == "full text"
+        assert store.get("abc", dict(SETTINGS, excel_max_rows=50)) is None
+        assert store.get("other", SETTINGS) is None
+        assert len(store) == 1
+    
+    def test_truncated_text_only_serves_smaller_limits(self, tmp_path):
+        """Test that text cut at a token limit is not used when more is needed."""
+        store = TextStore(str(tmp_path / "text.db"))
+        store.put("abc", "first pages", SETTINGS, token_limit=1000)
+        
+        assert store.get("abc", SETTINGS, max_tokens=800) == "first pages"
+        assert store.get("abc", SETTINGS, max_tokens=1000) == "first pages"
+        assert store.get("abc", SETTINGS, max_tokens=1200) is None
+        assert store.get("abc", SETTINGS) is None
+        
+        store.put("abc", "every page", SETTINGS)
+        assert store.get("abc", SETTINGS, max_tokens=1200) == "every page"
+        assert len(store) == 1
+    
+    def test_store_persists_and_is_thread_safe(self, tmp_path):
+        """Test that entries written from several threads survive reopening."""
+        path = str(tmp_path / "text.db")
+        store = TextStore(path)
+        
+        threads = [
+            threading.Thread(target=store.put, args=(f"digest-{index}", f"text {index}", SETTINGS))
+            for index in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        reopened = TextStore(path)
+        assert len(reopened) == 8
+        assert reopened.get("digest-3", SETTINGS) == "text 3"
@@ -0,0 +1,68 @@
+"""Test cases for token counting and fitting source content into the prompt."""
+
+import pytest
+import sys
+import os
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from token_budget import (
+    context_limit,
+    count_message_tokens,
+    count_tokens,
+    fair_shares,
+    fit_sources,
+    truncate_to_tokens,
+)
+
+
+class TestTokenBudget:
+    """Tests for the token budgeting helpers."""
+    
+    def test_context_limit_uses_longest_prefix(self):
+        """Test that model variants resolve to their own context window."""
+        assert context_limit("gpt-4") == 8192
+        assert context_limit("gpt-4-32k-0613") == 32768
+        assert context_limit("gpt-4o-mini") == 128000
+        assert context_limit("unknown-model") == 4096
+    
+    def test_message_tokens_include_framing(self):
+        """Test that every message adds its framing on top of its content."""
+        messages = [{"role": "system", "content": "x" * 8}, {"role": "user", "content": "y" * 4}]
+        
+        assert count_message_tokens(messages) == 3 + (4 + 2) + (4 + 1)
+    
+    @pytest.mark.parametrize("sizes, budget, expected", [
+        ({"a": 10, "b": 20}, 100, {"a": 10, "b": 20}),
+        ({"a": 10, "b": 500, "c": 500}, 100, {"a": 10, "b": 45, "c": 45}),
+        ({"a": 40, "b": 40, "c": 40}, 100, {"a": 34, "b": 33, "c": 33}),
+        ({"a": 10, "b": 10}, -5, {"a": 0, "b": 0}),
+        ({}, 100, {}),
+    ])
+    def test_fair_shares(self, sizes, budget, expected):
+        """Test max-min fair splits, including leftovers and an exhausted budget."""
+        shares = fair_shares(sizes, budget)
+        
+        assert shares == expected
+        assert sum(shares.values()) <= max(0, budget)
+    
+    def test_fit_sources_truncates_only_large_sources(self):
+        """Test that sources are cut to their share and keep their order."""
+        sources = {"report.pdf": "x" * 4000, "notes.txt": "short"}
+        fitted = fit_sources(sources, budget=100)
+        
+        assert list(fitted) == ["report.pdf", "notes.txt"]
+        assert fitted["notes.txt"] == "short"
+        assert fitted["report.pdf"].endswith("...")
+        assert count_tokens(fitted["report.pdf"]) + count_tokens("short") <= 100
+    
+    def test_truncation_marker_counts_against_the_budget(self):
+        """Test that truncated text plus its marker never exceeds the limit."""
+        text = "word " * 100
+        
+        for max_tokens in range(0, 12):
+            assert count_tokens(truncate_to_tokens(text, max_tokens)) <= max_tokens
+        assert truncate_to_tokens(text, 1) == "..."
+        assert truncate_to_tokens(text, 0) == ""
+        assert truncate_to_tokens("fits", 10) == "fits"
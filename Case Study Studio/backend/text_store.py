@@ -0,0 +1,115 @@
+"""
+Text Store Module
+Persists extracted file text in SQLite, keyed by file content hash
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS extracted_text (
+    digest TEXT NOT NULL,
+    settings TEXT NOT NULL,
+    content TEXT NOT NULL,
+    token_limit INTEGER,
+    filename TEXT,
+    size INTEGER,
+    extracted_at REAL NOT NULL,
+    PRIMARY KEY (digest, settings)
+)
+"""
+
+
+def file_digest(filepath, block_size=1024 * 1024):
+    """Get the SHA-256 hex digest of a file's content"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class TextStore:
+    """
+    Extracted text of uploaded files, stored once per distinct file content
+    
+    Entries are keyed by the SHA-256 of the file and the extraction
+    settings that shape the text (such as spreadsheet budgets), so the
+    same document uploaded twice, or regenerated with different context,
+    is never parsed again. Text that was cut at a token limit is stored
+    with that limit and only serves requests that need no more.
+    """
+    
+    def __init__(self, path):
+        """
+        Args:
+            path: SQLite database file; created if missing
+        """
+        self.path = path
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(SCHEMA)
+    
+    def _connect(self):
+        # A connection per call keeps the store safe to use from any thread
+        return sqlite3.connect(self.path, timeout=30)
+    
+    @staticmethod
+    def settings_key(settings):
+        """Canonical string for a dictionary of extraction settings"""
+        return json.dumps(settings or {}, sort_keys=True)
+    
+    def get(self, digest, settings=None, max_tokens=None):
+        """
+        Get stored text for a file
+        
+        Args:
+            digest: Content digest from file_digest()
+            settings: Extraction settings the text must have been produced with
+            max_tokens: Token limit the caller will apply, or None if it
+                needs the complete text
+        
+        Returns:
+            The stored text, or None if there is no entry covering max_tokens
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT content, token_limit FROM extracted_text WHERE digest = ? AND settings = ?",
+                (digest, self.settings_key(settings))
+            ).fetchone()
+        
+        if row is None:
+            return None
+        
+        content, token_limit = row
+        if token_limit is not None and (max_tokens is None or max_tokens > token_limit):
+            return None
+        return content
+    
+    def put(self, digest, content, settings=None, token_limit=None, filename=None, size=None):
+        """
+        Store the text of a file, replacing any earlier entry
+        
+        Args:
+            digest: Content digest from file_digest()
+            content: Extracted text
+            settings: Extraction settings the text was produced with
+            token_limit: Token limit at which extraction stopped, or None if
+                the text is complete
+            filename: Optional original file name, for reference
+            size: Optional file size in bytes, for reference
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO extracted_text "
+                "(digest, settings, content, token_limit, filename, size, extracted_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (digest, self.settings_key(settings), content, token_limit, filename, size, time.time())
+            )
+    
+    def __len__(self):
+        with self._connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM extracted_text").fetchone()[0]
@@ -0,0 +1,161 @@
+"""
+Token Budget Module
+Counts prompt tokens and fits source content into model context limits
+"""
+
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:  # Optional: fall back to a character-based estimate
+    tiktoken = None
+
+
+# Rough characters-per-token ratio for English text, used without tiktoken
+CHARS_PER_TOKEN = 4
+
+# Context window sizes in tokens; the longest matching model prefix wins
+MODEL_CONTEXT_TOKENS = {
+    "gpt-3.5-turbo": 4096,
+    "gpt-3.5-turbo-16k": 16385,
+    "gpt-3.5-turbo-1106": 16385,
+    "gpt-3.5-turbo-0125": 16385,
+    "gpt-4": 8192,
+    "gpt-4-32k": 32768,
+    "gpt-4-1106": 128000,
+    "gpt-4-0125": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4o": 128000,
+}
+DEFAULT_CONTEXT_TOKENS = 4096
+
+# Chat framing added by the API around every message and before the reply
+MESSAGE_OVERHEAD_TOKENS = 4
+REPLY_PRIMING_TOKENS = 3
+
+
+def context_limit(model):
+    """Get the context window of a model in tokens"""
+    matches = [prefix for prefix in MODEL_CONTEXT_TOKENS if model.startswith(prefix)]
+    if not matches:
+        return DEFAULT_CONTEXT_TOKENS
+    return MODEL_CONTEXT_TOKENS[max(matches, key=len)]
+
+
+@lru_cache(maxsize=None)
+def _encoding_for(model):
+    """Get the tiktoken encoding for a model, or None without tiktoken"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text, model="gpt-4"):
+    """
+    Count the tokens in a piece of text
+    
+    Uses the model's tokenizer when tiktoken is installed and a
+    characters-per-token estimate otherwise.
+    
+    Args:
+        text: Text to measure
+        model: Model whose tokenizer applies
+    
+    Returns:
+        Number of tokens
+    """
+    encoding = _encoding_for(model)
+    if encoding is None:
+        return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages, model="gpt-4"):
+    """Count the prompt tokens of a chat request, including message framing"""
+    total = REPLY_PRIMING_TOKENS
+    for message in messages:
+        total += MESSAGE_OVERHEAD_TOKENS + count_tokens(message["content"], model)
+    return total
+
+
+def truncate_to_tokens(text, max_tokens, model="gpt-4", marker="..."):
+    """
+    Shorten text to at most max_tokens tokens, marking the cut
+    
+    Returns:
+        The text if it fits, otherwise its beginning plus marker, or ""
+        if even the marker does not fit
+    """
+    if count_tokens(text, model) <= max_tokens:
+        return text
+    
+    marker_tokens = count_tokens(marker, model)
+    if marker_tokens > max_tokens:
+        return ""
+    
+    keep = max_tokens - marker_tokens
+    encoding = _encoding_for(model)
+    if encoding is None:
+        return text[:keep * CHARS_PER_TOKEN] + marker
+    
+    # Tokens can merge across the join with the marker, so trim until it fits
+    tokens = encoding.encode(text, disallowed_special=())[:keep]
+    while tokens and count_tokens(encoding.decode(tokens) + marker, model) > max_tokens:
+        tokens = tokens[:-1]
+    return encoding.decode(tokens) + marker
+
+
+def fair_shares(sizes, budget):
+    """
+    Split a token budget between sources using max-min fairness
+    
+    Sources smaller than an equal share keep everything they need, and
+    what they leave unused is split evenly among the larger sources.
+    
+    Args:
+        sizes: Dictionary of tokens each source needs
+        budget: Total tokens available
+    
+    Returns:
+        Dictionary of tokens granted to each source
+    """
+    shares = {}
+    remaining = max(0, budget)
+    pending = sorted(sizes, key=lambda name: sizes[name])
+    
+    while pending:
+        name = pending[0]
+        if sizes[name] > remaining // len(pending):
+            break
+        shares[name] = sizes[name]
+        remaining -= sizes[name]
+        pending.pop(0)
+    
+    # Every remaining source needs more than an equal share
+    for index, name in enumerate(pending):
+        shares[name] = remaining // len(pending) + (1 if index < remaining % len(pending) else 0)
+    
+    return shares
+
+
+def fit_sources(sources, budget, model="gpt-4"):
+    """
+    Truncate several texts so that together they fit a token budget
+    
+    Args:
+        sources: Dictionary of text per source, e.g. keyed by file name
+        budget: Total tokens available for all sources
+        model: Model whose tokenizer applies
+    
+    Returns:
+        Dictionary of the sources in their original order, each cut to its fair share
+    """
+    sizes = {name: count_tokens(text, model) for name, text in sources.items()}
+    shares = fair_shares(sizes, budget)
+    return {
+        name: truncate_to_tokens(text, shares[name], model)
+        for name, text in sources.items()
+    }
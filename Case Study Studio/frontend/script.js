@@ -8,6 +8,7 @@ const UPLOAD_ENDPOINT = '/upload';
 const GENERATE_ENDPOINT = '/generate-case-study';
 const DOWNLOAD_ENDPOINT = '/download';
 const LIST_ENDPOINT = '/case-studies';
+const JOB_POLL_INTERVAL_MS = 1000;
 
 // State Management
 const state = {
@@ -238,7 +239,8 @@ async function handleGenerateCaseStudy() {
             throw new Error(`Generation failed: ${generateResponse.statusText}`);
         }
 
-        const generateData = await generateResponse.json();
+        const jobData = await generateResponse.json();
+        const generateData = await waitForJob(jobData.job_id);
         state.currentCaseStudy = generateData.case_study;
 
         // Display preview
@@ -257,6 +259,39 @@ async function handleGenerateCaseStudy() {
     }
 }
 
+async function waitForJob(jobId) {
+    // Poll the generation job, reporting its stage, until it finishes
+    const stageMessages = {
+        queued: 'Waiting for a free generator...',
+        running: 'Starting generation...',
+        generating: 'Writing the case study...',
+        rendering: 'Preparing the document...'
+    };
+
+    while (true) {
+        const response = await fetch(`${API_BASE_URL}/jobs/${jobId}`);
+        if (!response.ok) {
+            throw new Error(`Generation failed: ${response.statusText}`);
+        }
+
+        const job = await response.json();
+        if (job.status === 'succeeded') {
+            return job.result;
+        }
+        if (job.status === 'failed') {
+            throw new Error(`Generation failed: ${job.error}`);
+        }
+
+        if (job.stage === 'extracting') {
+            showStatus(`Reading files (${job.progress.done}/${job.progress.total})...`, 'info');
+        } else if (stageMessages[job.stage]) {
+            showStatus(stageMessages[job.stage], 'info');
+        }
+
+        await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    }
+}
+
 function displayCaseStudyPreview(caseStudy) {
     const sections = [
         { title: 'Problem Statement', key: 'problem_statement' },
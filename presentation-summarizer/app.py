@@ -1,9 +1,11 @@
 """Flask web application for the presentation summarizer."""
 
+import io
 import os
 import sys
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify, send_file
+import json
+from flask import Flask, render_template, request, jsonify, send_file, Response, stream_with_context
 from werkzeug.utils import secure_filename
 import tempfile
 from datetime import datetime
@@ -11,26 +13,100 @@ from datetime import datetime
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.presentation_reader import PresentationReader
+from src.presentation_reader import PresentationReader, iter_text_chunks
+from src.extraction_cache import ExtractionCache
+from src.response_cache import create_response_cache
 from src.summarizer import PresentationSummarizer
+from src.jobs import SUCCEEDED, JobQueue, MemoryJobStore, RedisJobStore
+from src.upload_store import UploadStore
+from src.preprocess import condense_slides
+from src.dedup import DeckIndex
 from src.slide_generator import create_summary_presentation
+from src.layout import deck_sections
 
 # Configuration
 UPLOAD_FOLDER = tempfile.gettempdir()
 ALLOWED_EXTENSIONS = {'pptx'}
+PPTX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+EXTRACTION_CACHE_DIR = os.getenv(
+    'EXTRACTION_CACHE_DIR',
+    os.path.join(UPLOAD_FOLDER, 'presentation_summarizer_cache')
+)
+EXTRACTION_CACHE_MAX_ENTRIES = int(os.getenv('EXTRACTION_CACHE_MAX_ENTRIES', '256'))
+SUMMARY_CHUNK_TOKENS = int(os.getenv('SUMMARY_CHUNK_TOKENS', '3000'))
+SUMMARY_MAX_WORKERS = int(os.getenv('SUMMARY_MAX_WORKERS', '4'))
+SUMMARY_MAX_CONCURRENCY = int(os.getenv('SUMMARY_MAX_CONCURRENCY', '8'))
+RESPONSE_CACHE = os.getenv('RESPONSE_CACHE', 'memory')  # memory, sqlite or none
+RESPONSE_CACHE_PATH = os.getenv(
+    'RESPONSE_CACHE_PATH',
+    os.path.join(UPLOAD_FOLDER, 'presentation_summarizer_responses.db')
+)
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '1024'))
+RESPONSE_CACHE_TTL = float(os.getenv('RESPONSE_CACHE_TTL', '86400'))  # 1 day
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '4'))
+JOB_TTL = float(os.getenv('JOB_TTL', '3600'))  # 1 hour
+JOB_STORE_URL = os.getenv('JOB_STORE_URL')  # e.g. redis://localhost:6379/0
+PREPROCESS = os.getenv('PREPROCESS', 'true').lower() in ('1', 'true', 'yes')
+FAST_EXTRACTION = os.getenv('FAST_EXTRACTION', 'false').lower() in ('1', 'true', 'yes')
+PREPROCESS_TOKEN_BUDGET = int(os.getenv('PREPROCESS_TOKEN_BUDGET', '0')) or None
+DUPLICATE_SLIDE_THRESHOLD = float(os.getenv('DUPLICATE_SLIDE_THRESHOLD', '0.85')) or None  # 0 disables
+DECK_REUSE_THRESHOLD = float(os.getenv('DECK_REUSE_THRESHOLD', '0'))  # 0 disables
+DECK_INDEX_TTL = float(os.getenv('DECK_INDEX_TTL', '86400'))  # 1 day
+DECK_INDEX_MAX_ENTRIES = int(os.getenv('DECK_INDEX_MAX_ENTRIES', '1024'))
+UPLOAD_TTL = float(os.getenv('UPLOAD_TTL', '3600'))  # 1 hour
+UPLOAD_MAX_ENTRIES = int(os.getenv('UPLOAD_MAX_ENTRIES', '256'))
+SLIDE_TEMPLATE = os.getenv('SLIDE_TEMPLATE')  # optional corporate .pptx for summary slides
+SUMMARY_BREAKDOWN = os.getenv('SUMMARY_BREAKDOWN', 'true').lower() in ('1', 'true', 'yes')
 
 app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
 
+# Cached AI responses; invalid RESPONSE_CACHE settings stop startup with their own error
+try:
+    response_cache = create_response_cache(
+        RESPONSE_CACHE,
+        db_path=RESPONSE_CACHE_PATH,
+        max_entries=RESPONSE_CACHE_MAX_ENTRIES,
+        ttl=RESPONSE_CACHE_TTL
+    )
+except ValueError as e:
+    raise SystemExit(f"Invalid response cache configuration: {e}")
+
 # Initialize summarizer (will use env var for API key)
 try:
-    summarizer = PresentationSummarizer()
+    summarizer = PresentationSummarizer(cache=response_cache, max_concurrency=SUMMARY_MAX_CONCURRENCY)
     SUMMARIZER_READY = True
 except ValueError:
     SUMMARIZER_READY = False
 
+# Extracted slide content, shared by upload and summarize requests
+extraction_cache = ExtractionCache(EXTRACTION_CACHE_DIR, max_entries=EXTRACTION_CACHE_MAX_ENTRIES)
+
+# Uploaded decks and their extracted slides, looked up by opaque upload ID
+upload_store = UploadStore(ttl=UPLOAD_TTL, max_entries=UPLOAD_MAX_ENTRIES)
+
+# Summaries by deck digest; with DECK_REUSE_THRESHOLD, near-identical decks share section summaries
+deck_index = DeckIndex(
+    threshold=DECK_REUSE_THRESHOLD,
+    ttl=DECK_INDEX_TTL,
+    max_entries=DECK_INDEX_MAX_ENTRIES
+)
+
+
+def create_job_store():
+    """Create the job store, using a Redis-compatible server when configured."""
+    if not JOB_STORE_URL:
+        return MemoryJobStore(ttl=JOB_TTL)
+    
+    import redis
+    return RedisJobStore(redis.Redis.from_url(JOB_STORE_URL), ttl=JOB_TTL)
+
+
+# Background summarization jobs, so request threads never wait on the AI
+job_queue = JobQueue(store=create_job_store(), max_workers=JOB_WORKERS)
+
 
 def allowed_file(filename):
     """Check if file has allowed extension."""
@@ -71,83 +147,305 @@ def upload_file():
         filepath = os.path.join(app.config['UPLOAD_FOLDER'], timestamp + filename)
         file.save(filepath)
         
-        # Read presentation
-        reader = PresentationReader(filepath)
-        presentation_data = reader.get_presentation_summary()
+        # Extract every slide before responding, so a deck that fails
+        # part-way returns an error instead of a truncated 200 body
+        reader = PresentationReader(filepath, cache=extraction_cache, fast=FAST_EXTRACTION)
+        records = reader.get_slide_records()
         
-        return jsonify({
-            'success': True,
-            'file_path': filepath,
-            'file_name': filename,
-            'total_slides': presentation_data['total_slides'],
-            'slides': presentation_data['slides']
-        })
+        # Keep the extracted slides so summarize never parses the deck again
+        upload_id = upload_store.create(
+            file_path=filepath,
+            file_name=filename,
+            digest=reader.content_digest,
+            slides=records,
+            signature=deck_index.deck_signature(records) if DECK_REUSE_THRESHOLD else None
+        )
+        
+        # Stream the slide list so large decks are never serialized as one response body
+        def generate():
+            header = json.dumps({
+                'success': True,
+                'upload_id': upload_id,
+                'file_name': filename,
+                'total_slides': len(records)
+            })
+            yield header[:-1] + ', "slides": ['
+            for index, record in enumerate(records):
+                yield (', ' if index else '') + json.dumps(record.to_dict())
+            yield ']}'
+        
+        return Response(stream_with_context(generate()), mimetype='application/json')
     
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
 
+def prepare_upload_text(upload, model):
+    """
+    Text chunks of an upload, condensed unless preprocessing is disabled.
+    
+    Returns:
+        Tuple of (text chunks, compression report dictionary or None)
+    """
+    slides = upload['slides']
+    
+    if not PREPROCESS:
+        return iter_text_chunks(slides), None
+    
+    chunks, compression = condense_slides(
+        slides,
+        token_budget=PREPROCESS_TOKEN_BUDGET,
+        model=model,
+        duplicate_threshold=DUPLICATE_SLIDE_THRESHOLD
+    )
+    return chunks, compression.to_dict()
+
+
+def find_reusable_summary(upload, model, max_length):
+    """
+    Look up a summary of this exact deck made with the same settings.
+    
+    Returns:
+        The earlier summary and title, or None
+    """
+    payload = deck_index.get(upload['digest'])
+    if payload is None or f'{model}:{max_length}' not in payload:
+        return None
+    
+    stored = payload[f'{model}:{max_length}']
+    return {'summary': stored['summary'], 'title': stored['title'], 'reused_from': upload['digest']}
+
+
+def similar_deck_sections(upload, model, max_length):
+    """
+    Section summaries to seed the map step with, from a near-identical deck.
+    
+    Only groups of slides whose text is unchanged can match, so edited
+    slides are always summarized again.
+    
+    Returns:
+        Section summaries by group fingerprint, empty without a match
+    """
+    if not DECK_REUSE_THRESHOLD or upload.get('signature') is None:
+        return {}
+    
+    match = deck_index.find(upload['signature'])
+    if match is None or f'{model}:{max_length}' not in match.payload:
+        return {}
+    
+    return dict(match.payload[f'{model}:{max_length}'].get('sections', {}))
+
+
+def remember_summary(upload, model, max_length, summary, title, sections):
+    """Store a finished summary with the upload and index it for reuse."""
+    upload_store.update(upload['upload_id'], summary=summary, title=title)
+    deck_index.add(
+        upload['digest'],
+        upload.get('signature'),
+        {f'{model}:{max_length}': {'summary': summary, 'title': title, 'sections': sections}}
+    )
+
+
+def run_summary_job(upload, max_length, model, chunk_tokens, max_workers, report):
+    """Generate the summary and title of an upload. Runs on the job pool."""
+    reused = find_reusable_summary(upload, model, max_length)
+    if reused is not None:
+        upload_store.update(upload['upload_id'], summary=reused['summary'], title=reused['title'])
+        return reused
+    
+    report('preprocessing')
+    chunks, compression = prepare_upload_text(upload, model)
+    sections = similar_deck_sections(upload, model, max_length)
+    
+    report('summarizing', compression=compression)
+    summary, title = summarizer.generate_summary_with_title(
+        chunks,
+        max_length=max_length,
+        model=model,
+        chunk_tokens=chunk_tokens,
+        max_workers=max_workers,
+        sections=sections
+    )
+    
+    remember_summary(upload, model, max_length, summary, title, sections)
+    return {'summary': summary, 'title': title, 'compression': compression}
+
+
+def job_summary(upload):
+    """
+    Copy the result of the summary job an upload joined into the upload.
+    
+    Identical decks share one job, which stores its result only with the
+    upload that started it; every other upload picks it up here.
+    
+    Returns:
+        The upload with the job's summary and title once it succeeded
+    """
+    if upload.get('summary') or not upload.get('job_id'):
+        return upload
+    
+    job = job_queue.get(upload['job_id'])
+    if job is None or job['status'] != SUCCEEDED:
+        return upload
+    
+    summary, title = job['result']['summary'], job['result']['title']
+    upload_store.update(upload['upload_id'], summary=summary, title=title)
+    return dict(upload, summary=summary, title=title)
+
+
 @app.route('/api/summarize', methods=['POST'])
 def summarize():
-    """Generate summary from uploaded presentation."""
+    """Submit a summarization job for an uploaded presentation."""
     try:
+        if not SUMMARIZER_READY:
+            return jsonify({'error': 'OpenAI API key not configured'}), 400
+        
         data = request.json
-        file_path = data.get('file_path')
+        upload = upload_store.get(data.get('upload_id', ''))
         max_length = int(data.get('max_length', 400))
         model = data.get('model', 'gpt-3.5-turbo')
+        chunk_tokens = int(data.get('chunk_tokens', SUMMARY_CHUNK_TOKENS))
+        max_workers = min(int(data.get('max_workers', SUMMARY_MAX_WORKERS)), SUMMARY_MAX_WORKERS)
         
-        if not file_path or not os.path.exists(file_path):
-            return jsonify({'error': 'File not found'}), 400
-        
-        # Extract content
-        reader = PresentationReader(file_path)
-        content = reader.extract_full_text()
+        if upload is None:
+            return jsonify({'error': 'Upload not found or expired'}), 404
         
-        # Generate summary
-        summary = summarizer.generate_summary(
-            content,
-            max_length=max_length,
-            model=model
+        # Identical decks with identical settings share one job
+        dedupe_key = ':'.join([upload['digest'], model, str(max_length), str(chunk_tokens)])
+        job_id = job_queue.submit(
+            run_summary_job,
+            upload,
+            max_length,
+            model,
+            chunk_tokens,
+            max_workers,
+            dedupe_key=dedupe_key
         )
-        
-        # Generate title
-        title = summarizer.generate_slide_title(summary, model=model)
+        # The job's result reaches this upload through job_summary()
+        upload_store.update(upload['upload_id'], job_id=job_id, summary=None, title=None)
         
         return jsonify({
             'success': True,
-            'summary': summary,
-            'title': title
-        })
+            'job_id': job_id,
+            'status_url': f'/api/jobs/{job_id}'
+        }), 202
     
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
 
+def sse_event(event, data):
+    """Format one server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.route('/api/summarize/stream', methods=['GET'])
+def summarize_stream():
+    """Stream a summary as server-sent events while the model writes it."""
+    try:
+        if not SUMMARIZER_READY:
+            return jsonify({'error': 'OpenAI API key not configured'}), 400
+        
+        upload = upload_store.get(request.args.get('upload_id', ''))
+        max_length = int(request.args.get('max_length', 400))
+        model = request.args.get('model', 'gpt-3.5-turbo')
+        chunk_tokens = int(request.args.get('chunk_tokens', SUMMARY_CHUNK_TOKENS))
+        max_workers = min(int(request.args.get('max_workers', SUMMARY_MAX_WORKERS)), SUMMARY_MAX_WORKERS)
+        
+        if upload is None:
+            return jsonify({'error': 'Upload not found or expired'}), 404
+        
+        # token events carry summary text as it arrives; done carries the title
+        def generate():
+            try:
+                reused = find_reusable_summary(upload, model, max_length)
+                if reused is not None:
+                    upload_store.update(upload['upload_id'], summary=reused['summary'], title=reused['title'])
+                    yield sse_event('token', {'text': reused['summary']})
+                    yield sse_event('done', reused)
+                    return
+                
+                chunks, compression = prepare_upload_text(upload, model)
+                sections = similar_deck_sections(upload, model, max_length)
+                pieces = []
+                for piece in summarizer.generate_summary_stream(
+                    chunks,
+                    max_length=max_length,
+                    model=model,
+                    chunk_tokens=chunk_tokens,
+                    max_workers=max_workers,
+                    sections=sections
+                ):
+                    pieces.append(piece)
+                    yield sse_event('token', {'text': piece})
+                
+                summary = ''.join(pieces).strip()
+                title = summarizer.generate_slide_title(summary, model=model)
+                remember_summary(upload, model, max_length, summary, title, sections)
+                yield sse_event('done', {'title': title, 'summary': summary, 'compression': compression})
+            
+            except Exception as e:
+                yield sse_event('failure', {'error': str(e)})
+        
+        return Response(
+            stream_with_context(generate()),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Report the status, progress and result of a summarization job."""
+    job = job_queue.get(job_id)
+    
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    return jsonify(job)
+
+
 @app.route('/api/download', methods=['POST'])
 def download_summary():
     """Generate and download the summary presentation."""
     try:
         data = request.json
-        title = data.get('title')
-        summary = data.get('summary')
-        file_name = data.get('file_name', 'summary.pptx')
+        upload = upload_store.get(data.get('upload_id', ''))
+        
+        if upload is None:
+            return jsonify({'error': 'Upload not found or expired'}), 404
+        upload = job_summary(upload)
+        
+        # Edited text from the client wins over the generated summary
+        title = data.get('title') or upload.get('title')
+        summary = data.get('summary') or upload.get('summary')
+        file_name = upload['file_name']
+        
+        if not title or not summary:
+            return jsonify({'error': 'No summary has been generated for this upload'}), 400
         
         # Generate output filename
         base_name = file_name.rsplit('.', 1)[0] if '.' in file_name else file_name
         output_filename = f"{base_name}_summary.pptx"
-        output_path = os.path.join(app.config['UPLOAD_FOLDER'], output_filename)
         
-        # Create summary presentation
+        # Render in memory, so concurrent downloads never share a file
+        buffer = io.BytesIO()
         create_summary_presentation(
             title=title,
             summary=summary,
-            output_path=output_path,
-            subtitle="Executive Summary"
+            output_path=buffer,
+            subtitle="Executive Summary",
+            template_path=SLIDE_TEMPLATE,
+            sections=deck_sections(upload['slides']) if SUMMARY_BREAKDOWN else None
         )
+        buffer.seek(0)
         
-        # Send file
         return send_file(
-            output_path,
+            buffer,
+            mimetype=PPTX_MIMETYPE,
             as_attachment=True,
             download_name=output_filename
         )
@@ -161,10 +459,20 @@ def status():
     """Check application status."""
     return jsonify({
         'ready': SUMMARIZER_READY,
-        'message': 'Application is ready' if SUMMARIZER_READY else 'API key not configured'
+        'message': 'Application is ready' if SUMMARIZER_READY else 'API key not configured',
+        'response_cache': response_cache.stats() if response_cache else None
     })
 
 
+@app.route('/api/cache', methods=['DELETE'])
+def clear_cache():
+    """Invalidate cached slide extractions and AI responses."""
+    removed = extraction_cache.clear()
+    if response_cache:
+        response_cache.clear()
+    return jsonify({'success': True, 'removed': removed})
+
+
 @app.errorhandler(413)
 def too_large(e):
     """Handle file too large error."""
@@ -0,0 +1,101 @@
+"""Benchmark the python-pptx and streaming XML slide extraction paths."""
+
+import sys
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import click
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from pptx import Presentation
+from pptx.util import Inches, Pt
+from presentation_reader import PresentationReader
+
+
+def build_benchmark_deck(path: Path, slides: int, shapes: int) -> Path:
+    """
+    Write a synthetic deck with many text shapes, a table and a group per slide.
+    
+    Args:
+        path: Where to save the .pptx file
+        slides: Number of slides
+        shapes: Text boxes per slide
+    """
+    presentation = Presentation()
+    layout = presentation.slide_layouts[5]  # Title Only
+    
+    for slide_number in range(1, slides + 1):
+        slide = presentation.slides.add_slide(layout)
+        slide.shapes.title.text = f"Section {slide_number // 10 + 1}: results {slide_number}"
+        
+        for index in range(shapes):
+            box = slide.shapes.add_textbox(Inches(0.2 + (index % 10) * 0.9), Inches(1.5 + index // 10 * 0.3), Inches(0.9), Inches(0.3))
+            box.text_frame.text = f"Metric {index} rose {index % 17}% on slide {slide_number}"
+            box.text_frame.paragraphs[0].font.size = Pt(8)
+        
+        table = slide.shapes.add_table(3, 3, Inches(1), Inches(5), Inches(6), Inches(1)).table
+        for row in range(3):
+            for column in range(3):
+                table.cell(row, column).text = f"R{row}C{column}"
+        
+        group = slide.shapes.add_group_shape()
+        group.shapes.add_textbox(Inches(7), Inches(6), Inches(2), Inches(0.5)).text_frame.text = "Grouped callout"
+        
+        slide.notes_slide.notes_text_frame.text = f"Speaker notes for slide {slide_number}"
+    
+    presentation.save(str(path))
+    return path
+
+
+def time_path(deck: Path, fast: bool, repeat: int):
+    """Best wall time of extracting every slide record, and the records."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        records = PresentationReader(str(deck), fast=fast).get_slide_records()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, records
+
+
+@click.command()
+@click.argument("deck", required=False, type=click.Path(exists=True, dir_okay=False))
+@click.option("--slides", type=click.IntRange(min=1), default=200, help="Slides in the generated deck (default: 200)")
+@click.option("--shapes", type=click.IntRange(min=1), default=40, help="Text boxes per generated slide (default: 40)")
+@click.option("--repeat", type=click.IntRange(min=1), default=3, help="Runs per path; the best is reported (default: 3)")
+def main(deck: str, slides: int, shapes: int, repeat: int):
+    """
+    Compare slide extraction through python-pptx with the streaming path.
+    
+    DECK is an existing .pptx to measure; without it a synthetic deck with
+    many shapes, tables, groups and notes is generated.
+    
+    Example:
+        python benchmark_reader.py --slides 500 --shapes 60
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        if deck is None:
+            deck = build_benchmark_deck(Path(work_dir) / "benchmark.pptx", slides, shapes)
+            click.echo(f"Generated {slides} slides x {shapes} text boxes ({deck.stat().st_size / 1e6:.1f} MB)")
+        deck = Path(deck)
+        
+        object_model_seconds, object_model_records = time_path(deck, False, repeat)
+        streaming_seconds, streaming_records = time_path(deck, True, repeat)
+    
+    object_model_items = sum(len(record.content) for record in object_model_records)
+    streaming_items = sum(len(record.content) for record in streaming_records)
+    same_titles = [r.title for r in object_model_records] == [r.title for r in streaming_records]
+    same_notes = [r.notes for r in object_model_records] == [r.notes for r in streaming_records]
+    
+    click.echo(f"python-pptx: {object_model_seconds:.3f}s, {object_model_items} content items")
+    click.echo(f"streaming:   {streaming_seconds:.3f}s, {streaming_items} content items")
+    click.echo(f"speedup:     {object_model_seconds / streaming_seconds:.1f}x")
+    click.echo(f"titles match: {same_titles}, notes match: {same_notes}")
+
+
+if __name__ == "__main__":
+    main()
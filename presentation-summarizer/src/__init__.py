@@ -3,13 +3,24 @@
 __version__ = "1.0.0"
 __author__ = "AI Assistant"
 
-from presentation_reader import PresentationReader
+from presentation_reader import PresentationReader, SlideRecord
+from extraction_cache import ExtractionCache
 from summarizer import PresentationSummarizer
-from slide_generator import SlideGenerator, create_summary_presentation
+from async_summarizer import AsyncPresentationSummarizer
+from response_cache import MemoryResponseCache, SQLiteResponseCache
+from jobs import JobQueue
+from slide_generator import SlideGenerator, create_summary_presentation, insert_summary_presentation
 
 __all__ = [
     "PresentationReader",
+    "SlideRecord",
+    "ExtractionCache",
     "PresentationSummarizer",
+    "AsyncPresentationSummarizer",
+    "MemoryResponseCache",
+    "SQLiteResponseCache",
+    "JobQueue",
     "SlideGenerator",
     "create_summary_presentation",
+    "insert_summary_presentation",
 ]
@@ -0,0 +1,492 @@
+"""Module for summarizing many presentations concurrently with asyncio."""
+
+import asyncio
+import os
+import threading
+from typing import AsyncIterator, Awaitable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+import aiohttp
+import openai
+from dotenv import load_dotenv
+from response_cache import ResponseCache, make_cache_key
+from token_budget import completion_budget, words_to_tokens
+from summarizer import (
+    FALLBACK_TITLE,
+    SUMMARY_SYSTEM_PROMPT,
+    TITLE_AND_SUMMARY_OVERHEAD_TOKENS,
+    TITLE_SYSTEM_PROMPT,
+    MapReducePlan,
+    build_messages,
+    build_section_prompt,
+    build_summary_prompt,
+    build_title_prompt,
+    chunk_fingerprint,
+    parse_title_and_summary,
+    strip_slide_numbers,
+    summary_error,
+)
+
+
+T = TypeVar("T")
+
+
+class AsyncPresentationSummarizer:
+    """
+    Asynchronous counterpart of PresentationSummarizer.
+    
+    All requests share one aiohttp session, so HTTPS connections are kept
+    alive and reused, and a semaphore bounds the number of requests in
+    flight across every summary running on the event loop.
+    
+    Example:
+        async with AsyncPresentationSummarizer(max_concurrency=8) as summarizer:
+            results = await asyncio.gather(*(
+                summarizer.generate_summary_with_title(text) for text in decks
+            ))
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        max_concurrency: int = 8,
+        connection_limit: Optional[int] = None
+    ):
+        """
+        Initialize the summarizer.
+        
+        Args:
+            api_key: OpenAI API key. If not provided, loads from environment.
+            cache: Optional response cache shared with other summarizers
+            max_concurrency: Maximum number of API requests in flight
+            connection_limit: Maximum pooled connections (default: max_concurrency)
+        
+        Raises:
+            ValueError: If no API key is available or the limits are invalid
+        """
+        load_dotenv()
+        
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        
+        if not self.api_key:
+            raise ValueError(
+                "OpenAI API key not found. "
+                "Please provide it as an argument or set OPENAI_API_KEY environment variable."
+            )
+        
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        openai.api_key = self.api_key
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.connection_limit = connection_limit or max_concurrency
+        self._session = None
+        self._semaphore = None
+    
+    async def open(self) -> None:
+        """Create the shared HTTP session. Called automatically on first use."""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._semaphore = None
+    
+    async def __aenter__(self) -> "AsyncPresentationSummarizer":
+        await self.open()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def generate_summary(
+        self,
+        content: Union[str, Iterable[str]],
+        max_length: int = 500,
+        model: str = "gpt-3.5-turbo"
+    ) -> str:
+        """
+        Generate a concise summary of the presentation content.
+        
+        See PresentationSummarizer.generate_summary().
+        """
+        if not isinstance(content, str):
+            content = "\n".join(content)
+        
+        if not content or not content.strip():
+            raise ValueError("Content cannot be empty")
+        
+        return await self._summary_call(
+            build_summary_prompt(content, max_length),
+            model=model,
+            max_tokens=words_to_tokens(max_length),
+        )
+    
+    async def generate_slide_title(self, content: str, model: str = "gpt-3.5-turbo") -> str:
+        """
+        Generate a suitable title for the executive summary slide.
+        
+        See PresentationSummarizer.generate_slide_title().
+        """
+        try:
+            return await self._complete(
+                TITLE_SYSTEM_PROMPT,
+                build_title_prompt(content),
+                model=model,
+                max_tokens=30,
+            )
+        except Exception:
+            return FALLBACK_TITLE
+    
+    async def generate_chunked_summary(
+        self,
+        chunks: Iterable[str],
+        max_length: int = 500,
+        model: str = "gpt-3.5-turbo",
+        chunk_tokens: int = 3000,
+        max_workers: Optional[int] = None,
+        sections: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Summarize content that may exceed the model context using map-reduce.
+        
+        See PresentationSummarizer.generate_chunked_summary(). Fan-out is
+        bounded by the shared max_concurrency, and by max_workers when given.
+        """
+        prompt = await self._final_prompt(chunks, max_length, model, chunk_tokens, max_workers, sections=sections)
+        return await self._summary_call(prompt, model=model, max_tokens=words_to_tokens(max_length))
+    
+    async def generate_summary_with_title(
+        self,
+        chunks: Union[str, Iterable[str]],
+        max_length: int = 500,
+        model: str = "gpt-3.5-turbo",
+        chunk_tokens: int = 3000,
+        max_workers: Optional[int] = None,
+        sections: Optional[Dict[str, str]] = None
+    ) -> Tuple[str, str]:
+        """
+        Generate the summary and the slide title in one final API call.
+        
+        See PresentationSummarizer.generate_summary_with_title().
+        
+        Returns:
+            Tuple of (summary, title)
+        """
+        if isinstance(chunks, str):
+            chunks = [chunks]
+        
+        prompt = await self._final_prompt(
+            chunks, max_length, model, chunk_tokens, max_workers, with_title=True, sections=sections
+        )
+        reply = await self._summary_call(
+            prompt,
+            model=model,
+            max_tokens=words_to_tokens(max_length) + TITLE_AND_SUMMARY_OVERHEAD_TOKENS,
+        )
+        
+        parsed = parse_title_and_summary(reply)
+        if parsed is not None:
+            return parsed
+        
+        return reply, await self.generate_slide_title(reply, model=model)
+    
+    async def generate_summary_stream(
+        self,
+        chunks: Union[str, Iterable[str]],
+        max_length: int = 500,
+        model: str = "gpt-3.5-turbo",
+        chunk_tokens: int = 3000,
+        max_workers: Optional[int] = None,
+        sections: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Generate a summary and yield it piece by piece as the model writes it.
+        
+        See PresentationSummarizer.generate_summary_stream().
+        """
+        if isinstance(chunks, str):
+            chunks = [chunks]
+        
+        prompt = await self._final_prompt(chunks, max_length, model, chunk_tokens, max_workers, sections=sections)
+        
+        try:
+            async for piece in self._stream_complete(
+                SUMMARY_SYSTEM_PROMPT,
+                prompt,
+                model=model,
+                max_tokens=words_to_tokens(max_length),
+            ):
+                yield piece
+        except Exception as e:
+            raise summary_error(e)
+    
+    async def _final_prompt(
+        self,
+        chunks: Iterable[str],
+        max_length: int,
+        model: str,
+        chunk_tokens: int,
+        max_workers: Optional[int] = None,
+        with_title: bool = False,
+        sections: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Condense the chunks as needed and build the prompt for the final call."""
+        max_workers = max_workers or self.max_concurrency
+        plan = MapReducePlan(chunks, max_length, model, chunk_tokens, max_workers, with_title=with_title)
+        
+        # The shared semaphore bounds the whole process; this one bounds the call
+        workers = asyncio.Semaphore(max_workers)
+        
+        async def summarize(group: str) -> str:
+            async with workers:
+                return await self._summarize_section(group, plan.section_length, model, sections)
+        
+        while plan.groups:
+            plan.add_partials(await asyncio.gather(*(summarize(group) for group in plan.groups)))
+        
+        return plan.final_prompt()
+    
+    async def _summarize_section(
+        self,
+        content: str,
+        max_length: int,
+        model: str,
+        sections: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Summarize one group of slides from a larger presentation."""
+        fingerprint = chunk_fingerprint(content)
+        if sections is not None and fingerprint in sections:
+            return sections[fingerprint]
+        
+        try:
+            # Without slide numbers, unchanged groups keep their cached response
+            # when slides are inserted or removed earlier in the deck
+            partial = await self._complete(
+                SUMMARY_SYSTEM_PROMPT,
+                build_section_prompt(strip_slide_numbers(content), max_length),
+                model=model,
+                max_tokens=words_to_tokens(max_length),
+            )
+        except Exception as e:
+            raise Exception(f"Failed to summarize section: {str(e)}")
+        
+        if sections is not None:
+            sections[fingerprint] = partial
+        return partial
+    
+    async def _summary_call(self, prompt: str, model: str, max_tokens: int) -> str:
+        """Run a final summary request, translating API errors."""
+        try:
+            return await self._complete(SUMMARY_SYSTEM_PROMPT, prompt, model=model, max_tokens=max_tokens)
+        except Exception as e:
+            raise summary_error(e)
+    
+    async def _complete(
+        self,
+        system_prompt: str,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float = 0.7
+    ) -> str:
+        """Send one chat completion request over the shared session."""
+        messages = build_messages(system_prompt, prompt)
+        max_tokens = completion_budget(messages, model, max_tokens)
+        
+        cache_key = self._cache_key(system_prompt, prompt, model, max_tokens, temperature)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        await self.open()
+        
+        async with self._semaphore:
+            session_token = openai.aiosession.set(self._session)
+            try:
+                response = await openai.ChatCompletion.acreate(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            finally:
+                openai.aiosession.reset(session_token)
+        
+        reply = response.choices[0].message.content.strip()
+        
+        if cache_key is not None:
+            self.cache.set(cache_key, reply)
+        
+        return reply
+    
+    async def _stream_complete(
+        self,
+        system_prompt: str,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float = 0.7
+    ) -> AsyncIterator[str]:
+        """Send one streaming chat completion request and yield the reply pieces."""
+        messages = build_messages(system_prompt, prompt)
+        max_tokens = completion_budget(messages, model, max_tokens)
+        
+        cache_key = self._cache_key(system_prompt, prompt, model, max_tokens, temperature)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+        
+        await self.open()
+        
+        pieces = []
+        async with self._semaphore:
+            session_token = openai.aiosession.set(self._session)
+            try:
+                response = await openai.ChatCompletion.acreate(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                )
+            finally:
+                openai.aiosession.reset(session_token)
+            
+            async for chunk in response:
+                piece = chunk.choices[0].delta.get("content")
+                if not piece:
+                    continue
+                # Drop leading whitespace so the stream matches _complete()'s stripped reply
+                if not pieces:
+                    piece = piece.lstrip()
+                    if not piece:
+                        continue
+                pieces.append(piece)
+                yield piece
+        
+        if cache_key is not None:
+            self.cache.set(cache_key, "".join(pieces).strip())
+    
+    def _cache_key(
+        self,
+        system_prompt: str,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float
+    ) -> Optional[str]:
+        """Key of a request in the response cache, or None without a cache."""
+        if self.cache is None:
+            return None
+        return make_cache_key(
+            model=model,
+            system_prompt=system_prompt,
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+
+
+class EventLoopThread:
+    """
+    An event loop running in a daemon thread, for synchronous callers.
+    
+    PresentationSummarizer runs its AsyncPresentationSummarizer here, so
+    every synchronous caller in the process shares one HTTP session and
+    one bound on requests in flight; callers only wait on the result.
+    """
+    
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="summary-loop", daemon=True)
+        self._thread.start()
+    
+    def run(self, coroutine: Awaitable[T]) -> T:
+        """Run a coroutine on the loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+    
+    def close_client(self, client: AsyncPresentationSummarizer) -> None:
+        """Close a client's session, waiting for it unless called on the loop thread."""
+        future = asyncio.run_coroutine_threadsafe(client.close(), self.loop)
+        if threading.current_thread() is not self._thread:
+            future.result()
+    
+    def iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        """Iterate an async iterator on the loop, closing it if iteration stops early."""
+        try:
+            while True:
+                try:
+                    yield self.run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.run(iterator.aclose())
+
+
+_loop_thread = None
+_loop_thread_lock = threading.Lock()
+
+
+def get_event_loop_thread() -> EventLoopThread:
+    """Get the process-wide event loop thread, starting it on first use."""
+    global _loop_thread
+    with _loop_thread_lock:
+        if _loop_thread is None:
+            _loop_thread = EventLoopThread()
+        return _loop_thread
+
+
+def summarize_many(
+    contents: List[Union[str, Iterable[str]]],
+    max_length: int = 500,
+    model: str = "gpt-3.5-turbo",
+    chunk_tokens: int = 3000,
+    api_key: Optional[str] = None,
+    cache: Optional[ResponseCache] = None,
+    max_concurrency: int = 8
+) -> List[Union[Tuple[str, str], Exception]]:
+    """
+    Synchronously summarize several documents concurrently from one thread.
+    
+    Args:
+        contents: Text, or text chunks, for each document
+        max_length: Maximum length of each summary in words
+        model: The OpenAI model to use
+        chunk_tokens: Approximate token budget for each slide group
+        api_key: OpenAI API key. If not provided, loads from environment.
+        cache: Optional response cache
+        max_concurrency: Maximum number of API requests in flight
+    
+    Returns:
+        One (summary, title) tuple per document, in order. A document that
+        failed is represented by its exception instead.
+    """
+    async def run():
+        async with AsyncPresentationSummarizer(
+            api_key=api_key,
+            cache=cache,
+            max_concurrency=max_concurrency
+        ) as summarizer:
+            return await asyncio.gather(
+                *(
+                    summarizer.generate_summary_with_title(
+                        content,
+                        max_length=max_length,
+                        model=model,
+                        chunk_tokens=chunk_tokens
+                    )
+                    for content in contents
+                ),
+                return_exceptions=True
+            )
+    
+    return list(asyncio.run(run()))
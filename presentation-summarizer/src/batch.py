@@ -0,0 +1,519 @@
+"""Batch command-line interface for summarizing many presentations at once."""
+
+import asyncio
+import csv
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import click
+from presentation_reader import PresentationReader
+from preprocess import condense_slides
+from extraction_cache import ExtractionCache
+from async_summarizer import AsyncPresentationSummarizer
+from response_cache import SQLiteResponseCache
+from slide_generator import create_summary_presentation
+from layout import deck_sections
+
+
+MANIFEST_FIELDS = [
+    "input",
+    "output",
+    "status",
+    "digest",
+    "settings",
+    "slides",
+    "original_tokens",
+    "prompt_tokens",
+    "title",
+    "parse_seconds",
+    "summarize_seconds",
+    "render_seconds",
+    "total_seconds",
+    "error",
+]
+
+# Options that change a summary; a finished deck is redone when any of them differ
+SETTINGS_OPTIONS = (
+    "max_length",
+    "model",
+    "chunk_tokens",
+    "preprocess",
+    "token_budget",
+    "duplicate_threshold",
+    "fast_extract",
+    "template",
+    "breakdown",
+)
+
+
+def expand_inputs(patterns: List[str]) -> List[Path]:
+    """
+    Expand files, directories and glob patterns into a sorted list of decks.
+    
+    Args:
+        patterns: File paths, directories (searched recursively) or globs
+    
+    Returns:
+        Unique .pptx paths in sorted order
+    """
+    found = set()
+    
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            candidates = path.rglob("*.pptx")
+        elif path.is_file():
+            candidates = [path]
+        else:
+            candidates = (Path(match) for match in glob.glob(pattern, recursive=True))
+        
+        for candidate in candidates:
+            # Skip Office lock files such as ~$deck.pptx
+            if candidate.suffix.lower() == ".pptx" and not candidate.name.startswith("~$"):
+                found.add(candidate.resolve())
+    
+    return sorted(found)
+
+
+def output_paths(inputs: List[Path], output_dir: Path) -> Dict[Path, Path]:
+    """Map each input deck to its summary file, disambiguating repeated names."""
+    stem_counts = {}
+    for input_path in inputs:
+        stem_counts[input_path.stem] = stem_counts.get(input_path.stem, 0) + 1
+    
+    outputs = {}
+    for input_path in inputs:
+        stem = input_path.stem
+        if stem_counts[stem] > 1:
+            stem += "_" + hashlib.sha1(str(input_path).encode("utf-8")).hexdigest()[:8]
+        outputs[input_path] = output_dir / f"{stem}_summary.pptx"
+    
+    return outputs
+
+
+def load_manifest(manifest_path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load a previous manifest, keyed by input path.
+    
+    Returns:
+        Dictionary of manifest rows, empty if the manifest does not exist
+    """
+    if not manifest_path.exists():
+        return {}
+    
+    with open(manifest_path, "r", encoding="utf-8", newline="") as f:
+        if manifest_path.suffix.lower() == ".csv":
+            rows = list(csv.DictReader(f))
+        else:
+            rows = json.load(f)["files"]
+    
+    return {row["input"]: row for row in rows}
+
+
+def write_manifest(manifest_path: Path, rows: List[Dict[str, Any]]) -> None:
+    """Atomically write the manifest as JSON or CSV, based on its extension."""
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=manifest_path.parent, suffix=".tmp")
+    
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            if manifest_path.suffix.lower() == ".csv":
+                writer = csv.DictWriter(f, fieldnames=MANIFEST_FIELDS, extrasaction="ignore")
+                writer.writeheader()
+                writer.writerows(rows)
+            else:
+                json.dump({"files": rows}, f, indent=2)
+        os.replace(tmp_path, manifest_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def run_settings(options: Dict[str, Any]) -> str:
+    """Serialize the options that affect a summary, for storing in a manifest row."""
+    return json.dumps({name: options[name] for name in SETTINGS_OPTIONS}, sort_keys=True)
+
+
+def completed_digest(row: Optional[Dict[str, Any]], settings: str) -> Optional[str]:
+    """
+    Return the digest a manifest row finished with, if it can be reused.
+    
+    Args:
+        row: Manifest row of an earlier run, or None
+        settings: run_settings() of the current run
+    
+    Returns:
+        The digest, or None if the row failed, was made with different
+        settings or its output no longer exists
+    """
+    if (
+        row is not None
+        and row.get("status") in ("ok", "skipped")
+        and row.get("settings") == settings
+        and Path(row.get("output", "")).exists()
+    ):
+        return row.get("digest")
+    return None
+
+
+def extract_deck(
+    input_path: str,
+    cache_dir: Optional[str],
+    done_digest: Optional[str] = None,
+    preprocess: bool = True,
+    token_budget: Optional[int] = None,
+    model: str = "gpt-3.5-turbo",
+    duplicate_threshold: Optional[float] = None,
+    fast: bool = False
+) -> Tuple[str, Optional[int], Optional[List[str]], Optional[Dict[str, Any]], Optional[List[str]], float]:
+    """
+    Parse and condense one deck. Runs in a worker process.
+    
+    Args:
+        input_path: Path to the deck
+        cache_dir: Optional extraction cache directory
+        done_digest: Digest of a completed earlier run; parsing is skipped
+            if the deck still has this digest
+        preprocess: Whether to remove boilerplate and duplicate lines
+        token_budget: Optional token limit for the condensed text
+        model: Model whose tokenizer is used for counting
+        duplicate_threshold: Similarity at which near-identical slides are
+            collapsed, or None to keep every slide
+        fast: Whether to stream slide XML instead of loading python-pptx
+    
+    Returns:
+        Tuple of (content digest, slide count, text chunks, compression
+        report, section breakdown lines, parse seconds). Slide count,
+        chunks and sections are None when parsing was skipped; the report
+        is None without preprocessing.
+    """
+    started = time.perf_counter()
+    digest = ExtractionCache.file_digest(input_path)
+    if digest == done_digest:
+        return digest, None, None, None, None, time.perf_counter() - started
+    
+    cache = ExtractionCache(cache_dir) if cache_dir else None
+    reader = PresentationReader(input_path, cache=cache, fast=fast)
+    sections = deck_sections(reader.get_slide_records())
+    
+    if not preprocess:
+        chunks = list(reader.iter_text_chunks())
+        return digest, reader.slide_count, chunks, None, sections, time.perf_counter() - started
+    
+    chunks, compression = condense_slides(
+        reader.get_slide_records(),
+        token_budget=token_budget,
+        model=model,
+        duplicate_threshold=duplicate_threshold
+    )
+    return digest, reader.slide_count, chunks, compression.to_dict(), sections, time.perf_counter() - started
+
+
+async def process_deck(
+    input_path: Path,
+    output_path: Path,
+    previous: Optional[Dict[str, Any]],
+    pool: ProcessPoolExecutor,
+    summarizer: AsyncPresentationSummarizer,
+    options: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Parse, summarize and render one deck, returning its manifest row."""
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    row = {field: "" for field in MANIFEST_FIELDS}
+    settings = run_settings(options)
+    row.update(input=str(input_path), output=str(output_path), status="failed", settings=settings)
+    
+    try:
+        digest, slide_count, chunks, compression, sections, parse_seconds = await loop.run_in_executor(
+            pool,
+            extract_deck,
+            str(input_path),
+            options["cache_dir"],
+            completed_digest(previous, settings),
+            options["preprocess"],
+            options["token_budget"],
+            options["model"],
+            options["duplicate_threshold"],
+            options["fast_extract"]
+        )
+        
+        if chunks is None:
+            return dict(previous, status="skipped")
+        
+        row.update(digest=digest, slides=slide_count, parse_seconds=round(parse_seconds, 3))
+        if compression is not None:
+            row.update(
+                original_tokens=compression["original_tokens"],
+                prompt_tokens=compression["kept_tokens"]
+            )
+        
+        summarize_started = time.perf_counter()
+        summary, title = await summarizer.generate_summary_with_title(
+            chunks,
+            max_length=options["max_length"],
+            model=options["model"],
+            chunk_tokens=options["chunk_tokens"]
+        )
+        row.update(title=title, summarize_seconds=round(time.perf_counter() - summarize_started, 3))
+        
+        render_started = time.perf_counter()
+        await loop.run_in_executor(
+            None,
+            lambda: create_summary_presentation(
+                title=title,
+                summary=summary,
+                output_path=str(output_path),
+                subtitle="Executive Summary",
+                template_path=options["template"],
+                sections=sections if options["breakdown"] else None
+            )
+        )
+        row.update(status="ok", render_seconds=round(time.perf_counter() - render_started, 3))
+    
+    except Exception as e:
+        row["error"] = str(e)
+    
+    row["total_seconds"] = round(time.perf_counter() - started, 3)
+    return row
+
+
+async def run_batch(
+    inputs: List[Path],
+    outputs: Dict[Path, Path],
+    manifest_path: Path,
+    previous_rows: Dict[str, Dict[str, Any]],
+    summarizer: AsyncPresentationSummarizer,
+    workers: int,
+    options: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Run every deck, rewriting the manifest as each one finishes."""
+    rows = {str(path): previous_rows[str(path)] for path in inputs if str(path) in previous_rows}
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        async with summarizer:
+            tasks = [
+                asyncio.ensure_future(process_deck(
+                    input_path,
+                    outputs[input_path],
+                    previous_rows.get(str(input_path)),
+                    pool,
+                    summarizer,
+                    options
+                ))
+                for input_path in inputs
+            ]
+            
+            for finished in asyncio.as_completed(tasks):
+                row = await finished
+                rows[row["input"]] = row
+                write_manifest(manifest_path, [rows[key] for key in sorted(rows)])
+                
+                status = {"ok": "✓", "skipped": "↷"}.get(row["status"], "❌")
+                detail = row["error"] or row["title"]
+                click.echo(f"{status} {Path(row['input']).name}: {detail}")
+    
+    return [rows[str(path)] for path in inputs]
+
+
+@click.command()
+@click.argument("inputs", nargs=-1, required=True)
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(file_okay=False),
+    required=True,
+    help="Directory for the generated summary presentations",
+)
+@click.option(
+    "--manifest",
+    type=click.Path(dir_okay=False),
+    help="Manifest file, .json or .csv (default: OUTPUT_DIR/manifest.json)",
+)
+@click.option(
+    "--api-key",
+    envvar="OPENAI_API_KEY",
+    help="OpenAI API key (or set OPENAI_API_KEY environment variable)",
+)
+@click.option(
+    "--max-length",
+    type=int,
+    default=400,
+    help="Maximum length of each summary in words (default: 400)",
+)
+@click.option(
+    "--model",
+    type=str,
+    default="gpt-3.5-turbo",
+    help="OpenAI model to use (default: gpt-3.5-turbo)",
+)
+@click.option(
+    "--chunk-tokens",
+    type=click.IntRange(min=1),
+    default=3000,
+    help="Token budget per slide group for large decks (default: 3000)",
+)
+@click.option(
+    "--preprocess/--no-preprocess",
+    default=True,
+    help="Drop repeated footers, boilerplate and duplicate lines before summarizing (default: on)",
+)
+@click.option(
+    "--token-budget",
+    type=click.IntRange(min=1),
+    help="Keep only the most central sentences of each deck up to this many tokens",
+)
+@click.option(
+    "--duplicate-threshold",
+    type=click.FloatRange(min=0, max=1),
+    default=0.85,
+    help="Similarity at which near-identical slides in a deck are collapsed before summarizing; 0 disables (default: 0.85)",
+)
+@click.option(
+    "--fast-extract",
+    is_flag=True,
+    help="Stream slide XML instead of loading python-pptx; faster, and includes text in groups, tables and charts",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=os.cpu_count() or 1,
+    help="Processes used to parse decks (default: number of CPUs)",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=8,
+    help="Maximum AI requests in flight (default: 8)",
+)
+@click.option(
+    "--resume/--no-resume",
+    default=True,
+    help="Skip decks the manifest already records as done (default: resume)",
+)
+@click.option(
+    "--template",
+    type=click.Path(exists=True, dir_okay=False),
+    envvar="SLIDE_TEMPLATE",
+    help="Corporate .pptx whose theme and masters the summary slides use (or set SLIDE_TEMPLATE)",
+)
+@click.option(
+    "--breakdown/--no-breakdown",
+    default=True,
+    help="Add a slide listing each deck's sections after the summary (default: on)",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    envvar="EXTRACTION_CACHE_DIR",
+    help="Directory for cached slide extractions (or set EXTRACTION_CACHE_DIR)",
+)
+@click.option(
+    "--response-cache",
+    type=click.Path(dir_okay=False),
+    envvar="RESPONSE_CACHE_PATH",
+    help="SQLite file caching AI responses (or set RESPONSE_CACHE_PATH)",
+)
+def main(
+    inputs: Tuple[str, ...],
+    output_dir: str,
+    manifest: str,
+    api_key: str,
+    max_length: int,
+    model: str,
+    chunk_tokens: int,
+    preprocess: bool,
+    token_budget: int,
+    duplicate_threshold: float,
+    fast_extract: bool,
+    workers: int,
+    concurrency: int,
+    resume: bool,
+    template: str,
+    breakdown: bool,
+    cache_dir: str,
+    response_cache: str,
+):
+    """
+    Create executive summary slides for many presentations in one run.
+    
+    INPUTS may be .pptx files, directories (searched recursively) or glob
+    patterns. Decks are parsed in a process pool, summarized with a bounded
+    number of concurrent AI requests, and recorded in a manifest with
+    per-file timing, prompt compression and status. Re-running with the
+    same manifest skips decks that already completed and have not changed.
+    
+    Example:
+        python batch.py decks/ "archive/**/*.pptx" --output-dir summaries
+    """
+    try:
+        click.echo("📊 Presentation Summarizer - Batch Mode")
+        click.echo("-" * 50)
+        
+        deck_paths = expand_inputs(list(inputs))
+        if not deck_paths:
+            raise ValueError("No .pptx files matched the given inputs")
+        
+        output_root = Path(output_dir)
+        manifest_path = Path(manifest) if manifest else output_root / "manifest.json"
+        previous_rows = load_manifest(manifest_path) if resume else {}
+        
+        summarizer = AsyncPresentationSummarizer(
+            api_key=api_key,
+            cache=SQLiteResponseCache(response_cache) if response_cache else None,
+            max_concurrency=concurrency
+        )
+        
+        click.echo(f"📖 Summarizing {len(deck_paths)} presentations")
+        started = time.perf_counter()
+        rows = asyncio.run(run_batch(
+            deck_paths,
+            output_paths(deck_paths, output_root),
+            manifest_path,
+            previous_rows,
+            summarizer,
+            workers,
+            {
+                "max_length": max_length,
+                "model": model,
+                "chunk_tokens": chunk_tokens,
+                "preprocess": preprocess,
+                "token_budget": token_budget,
+                "duplicate_threshold": duplicate_threshold or None,
+                "fast_extract": fast_extract,
+                "cache_dir": cache_dir,
+                "template": template,
+                "breakdown": breakdown,
+            }
+        ))
+        
+        counts = {}
+        for row in rows:
+            counts[row["status"]] = counts.get(row["status"], 0) + 1
+        
+        click.echo("-" * 50)
+        click.echo(
+            f"✨ Done in {time.perf_counter() - started:.1f}s: "
+            f"{counts.get('ok', 0)} summarized, {counts.get('skipped', 0)} skipped, "
+            f"{counts.get('failed', 0)} failed"
+        )
+        click.echo(f"📄 Manifest: {manifest_path}")
+        
+        if counts.get("failed"):
+            raise click.exceptions.Exit(1)
+    
+    except ValueError as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        raise click.exceptions.Exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,12 @@
 import click
 from pathlib import Path
 from presentation_reader import PresentationReader
+from preprocess import condense_slides
+from extraction_cache import ExtractionCache
+from response_cache import SQLiteResponseCache
 from summarizer import PresentationSummarizer
-from slide_generator import create_summary_presentation
+from slide_generator import create_summary_presentation, insert_summary_presentation
+from layout import deck_sections
 
 
 @click.command()
@@ -13,7 +17,7 @@ from slide_generator import create_summary_presentation
     "--output",
     "-o",
     type=click.Path(),
-    help="Output file path (default: input_filename_summary.pptx)",
+    help="Output file path (default: input_filename_summary.pptx; the input is only overwritten when named here)",
 )
 @click.option(
     "--api-key",
@@ -32,10 +36,66 @@ from slide_generator import create_summary_presentation
     default="gpt-3.5-turbo",
     help="OpenAI model to use (default: gpt-3.5-turbo)",
 )
+@click.option(
+    "--chunk-tokens",
+    type=click.IntRange(min=1),
+    default=3000,
+    help="Token budget per slide group for large decks (default: 3000)",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Slide groups summarized concurrently for large decks (default: 4)",
+)
+@click.option(
+    "--preprocess/--no-preprocess",
+    default=True,
+    help="Drop repeated footers, boilerplate and duplicate lines before summarizing (default: on)",
+)
+@click.option(
+    "--token-budget",
+    type=click.IntRange(min=1),
+    help="Keep only the most central sentences up to this many tokens",
+)
+@click.option(
+    "--duplicate-threshold",
+    type=click.FloatRange(min=0, max=1),
+    default=0.85,
+    help="Similarity at which near-identical slides are collapsed before summarizing; 0 disables (default: 0.85)",
+)
+@click.option(
+    "--fast-extract",
+    is_flag=True,
+    help="Stream slide XML instead of loading python-pptx; faster, and includes text in groups, tables and charts",
+)
 @click.option(
     "--include-original",
     is_flag=True,
-    help="Include summary slide in the original presentation instead of creating new file",
+    help="Insert the summary slides at the front of the original presentation instead of creating a new file",
+)
+@click.option(
+    "--template",
+    type=click.Path(exists=True, dir_okay=False),
+    envvar="SLIDE_TEMPLATE",
+    help="Corporate .pptx whose theme and masters the summary slide uses (or set SLIDE_TEMPLATE)",
+)
+@click.option(
+    "--breakdown/--no-breakdown",
+    default=True,
+    help="Add a slide listing the deck's sections after the summary (default: on)",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    envvar="EXTRACTION_CACHE_DIR",
+    help="Directory for cached slide extractions (or set EXTRACTION_CACHE_DIR)",
+)
+@click.option(
+    "--response-cache",
+    type=click.Path(dir_okay=False),
+    envvar="RESPONSE_CACHE_PATH",
+    help="SQLite file caching AI responses for unchanged decks (or set RESPONSE_CACHE_PATH)",
 )
 def main(
     input_file: str,
@@ -43,7 +103,17 @@ def main(
     api_key: str,
     max_length: int,
     model: str,
+    chunk_tokens: int,
+    max_workers: int,
+    preprocess: bool,
+    token_budget: int,
+    duplicate_threshold: float,
+    fast_extract: bool,
     include_original: bool,
+    template: str,
+    breakdown: bool,
+    cache_dir: str,
+    response_cache: str,
 ):
     """
     Create an executive summary slide from a presentation deck.
@@ -61,55 +131,86 @@ def main(
         
         # Read presentation
         click.echo(f"📖 Reading presentation: {input_file}")
-        reader = PresentationReader(input_file)
-        presentation_content = reader.extract_full_text()
-        click.echo(f"✓ Extracted content from {reader.presentation.slides.__len__()} slides")
+        cache = ExtractionCache(cache_dir) if cache_dir else None
+        reader = PresentationReader(input_file, cache=cache, fast=fast_extract)
+        presentation_content = reader.iter_text_chunks()
+        click.echo(f"✓ Found {reader.slide_count} slides")
+        
+        if preprocess:
+            presentation_content, compression = condense_slides(
+                reader.get_slide_records(),
+                token_budget=token_budget,
+                model=model,
+                duplicate_threshold=duplicate_threshold or None
+            )
+            click.echo(
+                f"✓ Condensed {compression.original_tokens} → {compression.kept_tokens} tokens "
+                f"({compression.duplicate_slides} duplicate slides, "
+                f"{compression.boilerplate_lines} boilerplate and "
+                f"{compression.duplicate_lines} duplicate lines removed)"
+            )
         
         # Initialize summarizer
         click.echo("🤖 Initializing AI summarizer...")
-        summarizer = PresentationSummarizer(api_key=api_key)
+        summarizer = PresentationSummarizer(
+            api_key=api_key,
+            cache=SQLiteResponseCache(response_cache) if response_cache else None
+        )
         
-        # Generate summary
-        click.echo(f"✍️  Generating summary (max {max_length} words)...")
-        summary = summarizer.generate_summary(
+        # Generate summary and title together
+        click.echo(f"✍️  Generating summary (max {max_length} words) and slide title...")
+        summary, title = summarizer.generate_summary_with_title(
             presentation_content,
             max_length=max_length,
-            model=model
+            model=model,
+            chunk_tokens=chunk_tokens,
+            max_workers=max_workers
         )
         click.echo("✓ Summary generated successfully")
-        
-        # Generate title
-        click.echo("📝 Generating slide title...")
-        title = summarizer.generate_slide_title(summary, model=model)
         click.echo(f"✓ Title: {title}")
         
+        sections = deck_sections(reader.get_slide_records()) if breakdown else None
+        
         # Determine output path
         if not output:
             input_path = Path(input_file)
             output = str(input_path.parent / f"{input_path.stem}_summary.pptx")
         
-        # Create presentation
-        click.echo(f"💾 Creating summary presentation...")
-        create_summary_presentation(
-            title=title,
-            summary=summary,
-            output_path=output,
-            subtitle="Executive Summary"
-        )
+        if include_original:
+            click.echo(f"💾 Adding summary to the original presentation...")
+            insert_summary_presentation(
+                input_file,
+                title=title,
+                summary=summary,
+                output_path=output,
+                subtitle="Executive Summary",
+                sections=sections
+            )
+        else:
+            # Create presentation
+            click.echo(f"💾 Creating summary presentation...")
+            create_summary_presentation(
+                title=title,
+                summary=summary,
+                output_path=output,
+                subtitle="Executive Summary",
+                template_path=template,
+                sections=sections
+            )
         click.echo(f"✓ Presentation saved to: {output}")
         
         click.echo("-" * 50)
         click.echo("✨ Done! Your executive summary slide is ready.")
-        
+    
     except FileNotFoundError as e:
         click.echo(f"❌ Error: {str(e)}", err=True)
-        raise click.Exit(1)
+        raise click.exceptions.Exit(1)
     except ValueError as e:
         click.echo(f"❌ Error: {str(e)}", err=True)
-        raise click.Exit(1)
+        raise click.exceptions.Exit(1)
     except Exception as e:
         click.echo(f"❌ Unexpected error: {str(e)}", err=True)
-        raise click.Exit(1)
+        raise click.exceptions.Exit(1)
 
 
 if __name__ == "__main__":
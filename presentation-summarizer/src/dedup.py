@@ -0,0 +1,378 @@
+"""Module for detecting near-duplicate slides and decks with MinHash and LSH."""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, NamedTuple, Optional, Set, Tuple
+import numpy as np
+from presentation_reader import SlideRecord
+
+
+NUM_PERMUTATIONS = 128
+LSH_BANDS = 32
+SHINGLE_WORDS = 3
+
+# Universal hashing modulo a Mersenne prime, truncated to 32 bits
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+WORD_RE = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = SHINGLE_WORDS) -> Set[str]:
+    """
+    Split text into overlapping word n-grams.
+    
+    Args:
+        text: Text to split; case and punctuation are ignored
+        size: Words per shingle; shorter texts become a single shingle
+    
+    Returns:
+        Set of shingles, empty if the text has no words
+    """
+    words = WORD_RE.findall(text.lower())
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[index:index + size]) for index in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """Computes fixed-length MinHash signatures of shingle sets."""
+    
+    def __init__(self, num_permutations: int = NUM_PERMUTATIONS, seed: int = 1):
+        """
+        Initialize the hasher.
+        
+        Args:
+            num_permutations: Signature length; more permutations give more
+                accurate similarity estimates
+            seed: Seed for the permutation parameters. Signatures are only
+                comparable between hashers with the same seed and length.
+        """
+        generator = np.random.RandomState(seed)
+        self.num_permutations = num_permutations
+        self._a = generator.randint(1, (1 << 32) - 1, size=num_permutations, dtype=np.uint64)
+        self._b = generator.randint(0, (1 << 32) - 1, size=num_permutations, dtype=np.uint64)
+    
+    def signature(self, shingle_set: Iterable[str]) -> np.ndarray:
+        """
+        Compute the MinHash signature of a set of shingles.
+        
+        Args:
+            shingle_set: Shingles, e.g. from shingles()
+        
+        Returns:
+            Array of num_permutations hash minimums; all MAX_HASH when empty
+        """
+        values = np.array(
+            [
+                int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "little")
+                for shingle in shingle_set
+            ],
+            dtype=np.uint64,
+        )
+        if values.size == 0:
+            return np.full(self.num_permutations, MAX_HASH, dtype=np.uint64)
+        
+        with np.errstate(over="ignore"):
+            permuted = (np.outer(values, self._a) + self._b) % MERSENNE_PRIME & MAX_HASH
+        return permuted.min(axis=0)
+    
+    def text_signature(self, text: str) -> np.ndarray:
+        """Compute the MinHash signature of a text's word shingles."""
+        return self.signature(shingles(text))
+
+
+def estimate_similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimate the Jaccard similarity of two sets from their signatures."""
+    return float(np.mean(first == second))
+
+
+class LSHIndex:
+    """
+    Locality-sensitive hashing index over MinHash signatures.
+    
+    Signatures are split into bands; two items become candidates when any
+    band matches exactly, so lookups only compare against likely matches
+    instead of every indexed item.
+    """
+    
+    def __init__(self, num_permutations: int = NUM_PERMUTATIONS, bands: int = LSH_BANDS):
+        """
+        Initialize the index.
+        
+        Args:
+            num_permutations: Signature length
+            bands: Number of bands; must divide num_permutations. More bands
+                find matches at lower similarity.
+        
+        Raises:
+            ValueError: If bands does not divide num_permutations
+        """
+        if bands < 1 or num_permutations % bands:
+            raise ValueError("bands must divide num_permutations")
+        
+        self.rows = num_permutations // bands
+        self._buckets = [{} for _ in range(bands)]
+        self._signatures = {}
+    
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(len(self._buckets))
+        ]
+    
+    def add(self, key: Hashable, signature: np.ndarray) -> None:
+        """Index a signature under a key, replacing any earlier signature for it."""
+        self.remove(key)
+        self._signatures[key] = signature
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            buckets.setdefault(band_key, set()).add(key)
+    
+    def remove(self, key: Hashable) -> None:
+        """Remove a key from the index if present."""
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            members = buckets.get(band_key)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del buckets[band_key]
+    
+    def query(self, signature: np.ndarray, threshold: float) -> List[Tuple[Hashable, float]]:
+        """
+        Find indexed items similar to a signature.
+        
+        Args:
+            signature: Signature to look up
+            threshold: Minimum estimated Jaccard similarity
+        
+        Returns:
+            (key, similarity) pairs, most similar first
+        """
+        candidates = set()
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(buckets.get(band_key, ()))
+        
+        matches = []
+        for key in candidates:
+            similarity = estimate_similarity(signature, self._signatures[key])
+            if similarity >= threshold:
+                matches.append((key, similarity))
+        
+        return sorted(matches, key=lambda match: -match[1])
+    
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+
+def slide_text(record: SlideRecord) -> str:
+    """Text used to compare slides; slide numbers are ignored."""
+    return "\n".join([record.title, *record.content, record.notes])
+
+
+def cluster_slides(
+    records: Iterable[SlideRecord],
+    threshold: float = 0.85,
+    hasher: Optional[MinHasher] = None
+) -> List[List[int]]:
+    """
+    Group near-identical slides.
+    
+    Args:
+        records: Slide records in slide order
+        threshold: Minimum estimated Jaccard similarity of the slides'
+            word shingles for two slides to share a cluster
+        hasher: Optional MinHasher to reuse
+    
+    Returns:
+        Clusters of 0-based slide positions, each in slide order and
+        ordered by their first slide. Slides without text stay alone.
+    """
+    hasher = hasher or MinHasher()
+    index = LSHIndex(hasher.num_permutations)
+    parents = []
+    
+    def find(position: int) -> int:
+        while parents[position] != position:
+            parents[position] = parents[parents[position]]
+            position = parents[position]
+        return position
+    
+    for position, record in enumerate(records):
+        parents.append(position)
+        shingle_set = shingles(slide_text(record))
+        if not shingle_set:
+            continue
+        
+        signature = hasher.signature(shingle_set)
+        for match, _ in index.query(signature, threshold):
+            parents[find(position)] = find(match)
+        index.add(position, signature)
+    
+    clusters = {}
+    for position in range(len(parents)):
+        clusters.setdefault(find(position), []).append(position)
+    return sorted(clusters.values(), key=lambda cluster: cluster[0])
+
+
+def collapse_near_duplicates(
+    records: Iterable[SlideRecord],
+    threshold: float = 0.85
+) -> Tuple[SlideRecord, ...]:
+    """
+    Keep one representative of each cluster of near-identical slides.
+    
+    The first slide of each cluster represents it, so agenda slides and
+    appendix copies collapse onto their original position.
+    
+    Args:
+        records: Slide records in slide order
+        threshold: Similarity threshold passed to cluster_slides()
+    
+    Returns:
+        The representative records in slide order
+    """
+    records = list(records)
+    return tuple(records[cluster[0]] for cluster in cluster_slides(records, threshold))
+
+
+class DeckMatch(NamedTuple):
+    """An indexed deck that is near-identical to a looked-up deck."""
+    
+    deck_id: str
+    similarity: float
+    payload: Dict[str, Any]
+
+
+class DeckIndex:
+    """
+    In-memory index of summarized decks for reusing earlier results.
+    
+    Each deck is represented by the MinHash signature of all its slide
+    text, so a re-upload with a few cosmetic edits still matches the deck
+    it was derived from. A near-identical deck is not the same deck, so
+    callers should only reuse what is still valid for the edited one,
+    such as the summaries of unchanged slide groups; get() looks up a
+    deck by its exact ID. Decks that have not been added or looked up for
+    ttl seconds, or that exceed max_entries, are dropped least recently
+    used first.
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        hasher: Optional[MinHasher] = None,
+        ttl: float = 86400,
+        max_entries: int = 1024
+    ):
+        """
+        Initialize the index.
+        
+        Args:
+            threshold: Minimum estimated similarity for find() to match
+            hasher: Optional MinHasher; defaults to the standard parameters
+            ttl: Seconds a deck is kept after it was last used
+            max_entries: Maximum number of decks kept
+        
+        Raises:
+            ValueError: If ttl or max_entries is not positive
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        
+        self.threshold = threshold
+        self.hasher = hasher or MinHasher()
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._index = LSHIndex(self.hasher.num_permutations)
+        self._payloads = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def deck_signature(self, records: Iterable[SlideRecord]) -> np.ndarray:
+        """Compute the signature of a whole deck."""
+        shingle_set = set()
+        for record in records:
+            shingle_set |= shingles(slide_text(record))
+        return self.hasher.signature(shingle_set)
+    
+    def add(self, deck_id: str, signature: Optional[np.ndarray], payload: Dict[str, Any]) -> None:
+        """
+        Index a deck with data to reuse, merging with an earlier payload.
+        
+        Args:
+            deck_id: Identifier of the deck, e.g. its content digest
+            signature: Signature from deck_signature(), or None to keep the
+                payload for get() only
+            payload: Data to return when the deck or a similar one is looked up
+        """
+        with self._lock:
+            now = time.time()
+            self._purge(now)
+            
+            if signature is not None:
+                self._index.add(deck_id, signature)
+            merged, _ = self._payloads.get(deck_id, ({}, now))
+            merged.update(payload)
+            self._touch(deck_id, merged, now)
+            
+            while len(self._payloads) > self.max_entries:
+                self._drop(next(iter(self._payloads)))
+    
+    def get(self, deck_id: str) -> Optional[Dict[str, Any]]:
+        """Payload of exactly this deck, or None if it was never added or was dropped."""
+        with self._lock:
+            now = time.time()
+            self._purge(now)
+            
+            entry = self._payloads.get(deck_id)
+            if entry is None:
+                return None
+            self._touch(deck_id, entry[0], now)
+            return dict(entry[0])
+    
+    def find(self, signature: np.ndarray) -> Optional[DeckMatch]:
+        """
+        Find the most similar indexed deck.
+        
+        Returns:
+            The best DeckMatch at or above the threshold, or None
+        """
+        with self._lock:
+            now = time.time()
+            self._purge(now)
+            
+            matches = self._index.query(signature, self.threshold)
+            if not matches:
+                return None
+            deck_id, similarity = matches[0]
+            payload, _ = self._payloads[deck_id]
+            self._touch(deck_id, payload, now)
+            return DeckMatch(deck_id, similarity, dict(payload))
+    
+    def __len__(self) -> int:
+        return len(self._payloads)
+    
+    def _touch(self, deck_id: str, payload: Dict[str, Any], now: float) -> None:
+        """Store a payload as the most recently used deck (lock held)."""
+        self._payloads[deck_id] = (payload, now)
+        self._payloads.move_to_end(deck_id)
+    
+    def _drop(self, deck_id: str) -> None:
+        """Remove a deck's payload and signature (lock held)."""
+        del self._payloads[deck_id]
+        self._index.remove(deck_id)
+    
+    def _purge(self, now: float) -> None:
+        """Drop decks unused for longer than the TTL (lock held)."""
+        while self._payloads:
+            deck_id, (_, last_used) = next(iter(self._payloads.items()))
+            if now - last_used <= self.ttl:
+                break
+            self._drop(deck_id)
@@ -0,0 +1,182 @@
+"""Module for caching extracted presentation content on disk."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+
+class ExtractionCache:
+    """
+    Persistent, content-addressed cache of extracted slide content.
+    
+    Entries are keyed by the SHA-256 digest of the .pptx file, so a deck
+    re-uploaded under a different name still hits the cache. Each entry is
+    stored as a JSON file; its modification time doubles as the LRU
+    timestamp, so eviction order survives process restarts.
+    """
+    
+    FORMAT_VERSION = 1
+    
+    def __init__(self, cache_dir: str, max_entries: int = 256):
+        """
+        Initialize the extraction cache.
+        
+        Args:
+            cache_dir: Directory where cache entries are stored
+            max_entries: Maximum number of decks kept before the least
+                recently used entries are evicted
+        
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    @staticmethod
+    def file_digest(file_path: Union[str, Path]) -> str:
+        """
+        Compute the content hash used as the cache key for a file.
+        
+        Args:
+            file_path: Path to the file
+        
+        Returns:
+            Hex-encoded SHA-256 digest of the file contents
+        """
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def _entry_path(self, digest: str) -> Path:
+        return self.cache_dir / f"{digest}.json"
+    
+    def get(self, digest: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up the extracted slides for a content digest.
+        
+        Args:
+            digest: Content digest returned by file_digest()
+        
+        Returns:
+            The cached list of slide dictionaries, or None on a miss
+        """
+        entry_path = self._entry_path(digest)
+        
+        with self._lock:
+            try:
+                with open(entry_path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+            
+            if entry.get("version") != self.FORMAT_VERSION:
+                return None
+            
+            # Mark as most recently used
+            try:
+                os.utime(entry_path, None)
+            except OSError:
+                pass
+        
+        return entry["slides"]
+    
+    def put(self, digest: str, slides: List[Dict[str, Any]]) -> None:
+        """
+        Store the extracted slides for a content digest.
+        
+        Args:
+            digest: Content digest returned by file_digest()
+            slides: List of slide dictionaries to cache
+        """
+        entry = {"version": self.FORMAT_VERSION, "slides": slides}
+        
+        with self._lock:
+            # Write atomically so concurrent readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, self._entry_path(digest))
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            
+            self._evict()
+    
+    def invalidate(self, file_path: Optional[str] = None, digest: Optional[str] = None) -> bool:
+        """
+        Remove a single entry from the cache.
+        
+        Args:
+            file_path: Path of a file whose entry should be removed
+            digest: Content digest of the entry to remove
+        
+        Returns:
+            True if an entry was removed, False otherwise
+        
+        Raises:
+            ValueError: If neither file_path nor digest is given
+        """
+        if digest is None:
+            if file_path is None:
+                raise ValueError("Either file_path or digest must be provided")
+            digest = self.file_digest(file_path)
+        
+        with self._lock:
+            try:
+                self._entry_path(digest).unlink()
+                return True
+            except FileNotFoundError:
+                return False
+    
+    def clear(self) -> int:
+        """
+        Remove every entry from the cache.
+        
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._lock:
+            for entry_path in self.cache_dir.glob("*.json"):
+                try:
+                    entry_path.unlink()
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self.cache_dir.glob("*.json"))
+    
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond max_entries (lock held)."""
+        entries = []
+        for entry_path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((entry_path.stat().st_mtime, entry_path))
+            except FileNotFoundError:
+                continue
+        
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+        
+        entries.sort()
+        for _, entry_path in entries[:excess]:
+            try:
+                entry_path.unlink()
+            except FileNotFoundError:
+                pass
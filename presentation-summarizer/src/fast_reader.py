@@ -0,0 +1,231 @@
+"""Module for extracting slide text straight from the .pptx package XML."""
+
+import posixpath
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Union
+from lxml import etree
+from presentation_reader import SlideRecord
+from pptx_package import PRESENTATION_PART, relationships_part
+
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+C_NS = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_RELATIONSHIPS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+NOTES_SLIDE_RELATIONSHIP = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesSlide"
+
+# Shapes whose text becomes one content item; group shapes only contain them
+SHAPE_TAGS = frozenset(f"{{{P_NS}}}{name}" for name in ("sp", "graphicFrame", "cxnSp", "pic"))
+
+PARAGRAPH = f"{{{A_NS}}}p"
+TEXT = f"{{{A_NS}}}t"
+LINE_BREAK = f"{{{A_NS}}}br"
+TABLE_ROW = f"{{{A_NS}}}tr"
+TABLE_CELL = f"{{{A_NS}}}tc"
+SHAPE_PROPERTIES = f"{{{P_NS}}}cNvPr"
+PLACEHOLDER = f"{{{P_NS}}}ph"
+CHART = f"{{{C_NS}}}chart"
+SLIDE_ID = f"{{{P_NS}}}sldId"
+RELATIONSHIP = f"{{{PACKAGE_RELATIONSHIPS_NS}}}Relationship"
+
+# The only elements iterparse reports; formatting elements never reach Python
+STREAMED_TAGS = sorted(SHAPE_TAGS | {
+    PARAGRAPH, TEXT, LINE_BREAK, TABLE_ROW, TABLE_CELL, SHAPE_PROPERTIES, PLACEHOLDER, CHART
+})
+
+
+class _Shape:
+    """Text collected from one shape while its XML is streamed."""
+    
+    __slots__ = ("name", "placeholder", "paragraphs", "rows", "cells", "chart_rid")
+    
+    def __init__(self):
+        self.name = None
+        self.placeholder = None
+        self.paragraphs = []
+        self.rows = []
+        self.cells = None
+        self.chart_rid = None
+    
+    def text(self) -> str:
+        if self.rows:
+            return "\n".join(" | ".join(cells) for cells in self.rows)
+        return "\n".join(self.paragraphs)
+
+
+def _resolve(source_part: str, target: str) -> str:
+    """Part name a relationship target of a part points to."""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source_part), target))
+
+
+def _relationships(package: zipfile.ZipFile, part_name: str) -> Dict[str, tuple]:
+    """Map relationship ids of a part to (type, target part name)."""
+    try:
+        root = etree.fromstring(package.read(relationships_part(part_name)))
+    except KeyError:
+        return {}
+    return {
+        relationship.get("Id"): (relationship.get("Type"), _resolve(part_name, relationship.get("Target")))
+        for relationship in root.iter(RELATIONSHIP)
+        if relationship.get("TargetMode") != "External"
+    }
+
+
+def slide_parts(package: zipfile.ZipFile) -> List[str]:
+    """Part names of the slides of a package, in presentation order."""
+    targets = _relationships(package, PRESENTATION_PART)
+    parts = []
+    for _, element in etree.iterparse(package.open(PRESENTATION_PART), tag=SLIDE_ID):
+        target = targets.get(element.get(f"{{{R_NS}}}id"))
+        if target is not None:
+            parts.append(target[1])
+    return parts
+
+
+def iter_shape_texts(package: zipfile.ZipFile, part_name: str) -> Iterator[_Shape]:
+    """
+    Stream the shapes of a slide or notes part with their text.
+    
+    Shapes are yielded in document order, including those nested in
+    groups. Paragraphs are collected from a:t runs, with line breaks as
+    vertical tabs like python-pptx; table cells are collected per row.
+    Elements are cleared as soon as they are consumed, so memory stays
+    flat however many shapes a slide has.
+    """
+    shape = None
+    depth = 0  # Nesting of shape elements inside the current shape
+    runs = []
+    
+    for event, element in etree.iterparse(package.open(part_name), events=("start", "end"), tag=STREAMED_TAGS):
+        tag = element.tag
+        
+        if event == "start":
+            if tag in SHAPE_TAGS:
+                if shape is None:
+                    shape = _Shape()
+                else:
+                    depth += 1
+            elif shape is not None:
+                if tag == SHAPE_PROPERTIES and shape.name is None:
+                    shape.name = element.get("name", "")
+                elif tag == PLACEHOLDER and shape.placeholder is None:
+                    shape.placeholder = element.get("type", "body")
+                elif tag == TABLE_ROW:
+                    shape.rows.append([])
+                elif tag == TABLE_CELL:
+                    shape.cells = []
+                elif tag == PARAGRAPH:
+                    runs = []
+                elif tag == CHART:
+                    shape.chart_rid = element.get(f"{{{R_NS}}}id")
+            continue
+        
+        if shape is None:
+            continue
+        
+        if tag == TEXT:
+            runs.append(element.text or "")
+        elif tag == LINE_BREAK:
+            runs.append("\v")
+        elif tag == PARAGRAPH:
+            (shape.cells if shape.cells is not None else shape.paragraphs).append("".join(runs))
+            element.clear()
+        elif tag == TABLE_CELL:
+            shape.rows[-1].append(" ".join(" ".join(shape.cells).split()))
+            shape.cells = None
+            element.clear()
+        elif tag in SHAPE_TAGS:
+            if depth:
+                depth -= 1
+                continue
+            yield shape
+            shape = None
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+
+def _chart_text(package: zipfile.ZipFile, part_name: str) -> str:
+    """Titles and labels of a chart part."""
+    texts = []
+    for _, element in etree.iterparse(package.open(part_name), tag=TEXT):
+        if element.text and element.text.strip():
+            texts.append(element.text.strip())
+        element.clear()
+    return " ".join(texts)
+
+
+def iter_package_slides(file_path: Union[str, Path]) -> Iterator[SlideRecord]:
+    """
+    Extract slide records without building the python-pptx object model.
+    
+    Slide and notes parts are streamed from the zip with lxml iterparse.
+    Titles follow the same rule as PresentationReader (the first shape
+    with "Title" in its name), and notes are the body placeholder of the
+    notes slide. Unlike the object-model walk, text inside group shapes,
+    table cells (" | " between cells, one line per row) and chart titles
+    is included.
+    
+    Args:
+        file_path: Path to the .pptx file
+    
+    Yields:
+        SlideRecord objects in slide order
+    
+    Raises:
+        ValueError: If the file is not a valid presentation package
+    """
+    try:
+        package = zipfile.ZipFile(file_path)
+    except (OSError, zipfile.BadZipFile) as e:
+        raise ValueError(f"Failed to load presentation: {str(e)}")
+    
+    with package:
+        try:
+            parts = slide_parts(package)
+        except (KeyError, etree.XMLSyntaxError) as e:
+            raise ValueError(f"Failed to load presentation: {str(e)}")
+        
+        for slide_number, part_name in enumerate(parts, 1):
+            relationships = _relationships(package, part_name)
+            title = ""
+            content = []
+            
+            for shape in iter_shape_texts(package, part_name):
+                text = shape.text()
+                if shape.chart_rid in relationships:
+                    chart_text = _chart_text(package, relationships[shape.chart_rid][1])
+                    text = "\n".join(filter(None, [text, chart_text]))
+                
+                if not text.strip():
+                    continue
+                if not title and shape.name and "Title" in shape.name:
+                    title = text
+                else:
+                    content.append(text)
+            
+            notes = ""
+            notes_part = next(
+                (target for kind, target in relationships.values() if kind == NOTES_SLIDE_RELATIONSHIP),
+                None
+            )
+            if notes_part is not None:
+                body = next(
+                    (shape for shape in iter_shape_texts(package, notes_part) if shape.placeholder == "body"),
+                    None
+                )
+                if body is not None and body.text().strip():
+                    notes = body.text()
+            
+            yield SlideRecord(slide_number, title, tuple(content), notes)
+
+
+def package_slide_count(file_path: Union[str, Path]) -> int:
+    """Number of slides in a .pptx file, read from the presentation part only."""
+    with zipfile.ZipFile(file_path) as package:
+        return len(slide_parts(package))
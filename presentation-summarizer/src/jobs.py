@@ -0,0 +1,214 @@
+"""Module for running summarization jobs in the background."""
+
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class MemoryJobStore:
+    """Job records kept in process memory."""
+    
+    def __init__(self, ttl: float = 3600):
+        """
+        Initialize the store.
+        
+        Args:
+            ttl: Seconds a finished job is kept before it is discarded
+        """
+        self.ttl = ttl
+        self._jobs = {}
+        self._dedupe = {}
+        self._lock = threading.Lock()
+    
+    def create(self, job_id: str, record: Dict[str, Any], dedupe_key: Optional[str] = None) -> str:
+        """
+        Store a new job unless an equivalent job already exists.
+        
+        Args:
+            job_id: Identifier for the new job
+            record: Initial job record
+            dedupe_key: Jobs with the same key share one record while it is
+                queued, running or succeeded
+        
+        Returns:
+            The identifier of the stored job, which is an existing job's
+            identifier when the submission was deduplicated
+        """
+        with self._lock:
+            self._purge(time.time())
+            
+            if dedupe_key is not None:
+                existing_id = self._dedupe.get(dedupe_key)
+                existing = self._jobs.get(existing_id)
+                if existing is not None and existing["status"] != FAILED:
+                    return existing_id
+                self._dedupe[dedupe_key] = job_id
+            
+            self._jobs[job_id] = dict(record)
+            return job_id
+    
+    def update(self, job_id: str, **fields: Any) -> None:
+        """Update fields of a job record."""
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields)
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of a job record, or None if it does not exist."""
+        with self._lock:
+            record = self._jobs.get(job_id)
+            return dict(record) if record is not None else None
+    
+    def _purge(self, now: float) -> None:
+        """Discard finished jobs older than the TTL (lock held)."""
+        expired = [
+            job_id for job_id, record in self._jobs.items()
+            if record["status"] in (SUCCEEDED, FAILED) and now - record["updated_at"] > self.ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        for key in [key for key, job_id in self._dedupe.items() if job_id not in self._jobs]:
+            del self._dedupe[key]
+
+
+class RedisJobStore:
+    """
+    Job records kept in a Redis-compatible server.
+    
+    Any client exposing get and set (with nx/ex) works, including
+    redis-py and local stand-ins such as fakeredis, so several web
+    processes can share job status.
+    """
+    
+    def __init__(self, client: Any, prefix: str = "presentation-summarizer:jobs:", ttl: float = 3600):
+        """
+        Initialize the store.
+        
+        Args:
+            client: Redis-compatible client
+            prefix: Key prefix for job records
+            ttl: Seconds a job record is kept
+        """
+        self.client = client
+        self.prefix = prefix
+        self.ttl = int(ttl)
+    
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}{job_id}"
+    
+    def _dedupe_key(self, dedupe_key: str) -> str:
+        return f"{self.prefix}dedupe:{dedupe_key}"
+    
+    def create(self, job_id: str, record: Dict[str, Any], dedupe_key: Optional[str] = None) -> str:
+        """See MemoryJobStore.create()."""
+        if dedupe_key is not None:
+            key = self._dedupe_key(dedupe_key)
+            if not self.client.set(key, job_id, nx=True, ex=self.ttl):
+                existing_id = self.client.get(key)
+                if isinstance(existing_id, bytes):
+                    existing_id = existing_id.decode("utf-8")
+                existing = self.get(existing_id) if existing_id else None
+                if existing is not None and existing["status"] != FAILED:
+                    return existing_id
+                self.client.set(key, job_id, ex=self.ttl)
+        
+        self.client.set(self._job_key(job_id), json.dumps(record), ex=self.ttl)
+        return job_id
+    
+    def update(self, job_id: str, **fields: Any) -> None:
+        """See MemoryJobStore.update()."""
+        record = self.get(job_id)
+        if record is not None:
+            record.update(fields)
+            self.client.set(self._job_key(job_id), json.dumps(record), ex=self.ttl)
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """See MemoryJobStore.get()."""
+        raw = self.client.get(self._job_key(job_id))
+        return json.loads(raw) if raw is not None else None
+
+
+class JobQueue:
+    """
+    Runs jobs on a worker pool and tracks their status in a job store.
+    
+    A job function receives a ``report`` keyword argument it can call with a
+    stage name and optional details to publish progress.
+    """
+    
+    def __init__(self, store: Any = None, executor: Optional[Executor] = None, max_workers: int = 4):
+        """
+        Initialize the queue.
+        
+        Args:
+            store: Job store (default: MemoryJobStore)
+            executor: Worker pool (default: a thread pool of max_workers)
+            max_workers: Size of the default worker pool
+        """
+        self.store = store if store is not None else MemoryJobStore()
+        self.executor = executor if executor is not None else ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="summary-job"
+        )
+    
+    def submit(self, fn: Callable[..., Any], *args: Any, dedupe_key: Optional[str] = None, **kwargs: Any) -> str:
+        """
+        Submit a job.
+        
+        Args:
+            fn: Job function; its return value becomes the job result
+            *args: Positional arguments for fn
+            dedupe_key: Submissions with the same key share one job
+            **kwargs: Keyword arguments for fn
+        
+        Returns:
+            The job identifier to poll with get()
+        """
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        record = {
+            "job_id": job_id,
+            "status": QUEUED,
+            "stage": QUEUED,
+            "progress": {},
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        
+        stored_id = self.store.create(job_id, record, dedupe_key=dedupe_key)
+        if stored_id == job_id:
+            self.executor.submit(self._run, job_id, fn, args, kwargs)
+        
+        return stored_id
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get the current record of a job, or None if it is unknown."""
+        return self.store.get(job_id)
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool."""
+        self.executor.shutdown(wait=wait)
+    
+    def _run(self, job_id: str, fn: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> None:
+        """Execute a job and record its outcome."""
+        def report(stage: str, **progress: Any) -> None:
+            self.store.update(job_id, stage=stage, progress=progress, updated_at=time.time())
+        
+        self.store.update(job_id, status=RUNNING, stage=RUNNING, updated_at=time.time())
+        
+        try:
+            result = fn(*args, report=report, **kwargs)
+        except Exception as e:
+            self.store.update(job_id, status=FAILED, stage=FAILED, error=str(e), updated_at=time.time())
+        else:
+            self.store.update(job_id, status=SUCCEEDED, stage=SUCCEEDED, result=result, updated_at=time.time())
@@ -0,0 +1,249 @@
+"""Module for fitting summary text onto slides using font metrics."""
+
+import math
+import unicodedata
+from typing import Iterable, List, NamedTuple, Sequence, Tuple
+from presentation_reader import SlideRecord
+
+
+# Advance widths of Calibri, the default theme font, in fractions of an em
+CHARACTER_WIDTHS = {
+    " ": 0.226, "!": 0.265, "\"": 0.401, "#": 0.498, "$": 0.507, "%": 0.715,
+    "&": 0.682, "'": 0.221, "(": 0.303, ")": 0.303, "*": 0.498, "+": 0.498,
+    ",": 0.250, "-": 0.306, ".": 0.252, "/": 0.386, ":": 0.268, ";": 0.268,
+    "<": 0.498, "=": 0.498, ">": 0.498, "?": 0.463, "@": 0.894, "[": 0.307,
+    "\\": 0.386, "]": 0.307, "_": 0.498, "|": 0.460,
+    "A": 0.579, "B": 0.544, "C": 0.533, "D": 0.615, "E": 0.488, "F": 0.459,
+    "G": 0.631, "H": 0.623, "I": 0.252, "J": 0.319, "K": 0.520, "L": 0.420,
+    "M": 0.855, "N": 0.646, "O": 0.662, "P": 0.517, "Q": 0.673, "R": 0.543,
+    "S": 0.459, "T": 0.487, "U": 0.642, "V": 0.567, "W": 0.890, "X": 0.519,
+    "Y": 0.487, "Z": 0.468,
+    "a": 0.479, "b": 0.525, "c": 0.423, "d": 0.525, "e": 0.498, "f": 0.305,
+    "g": 0.471, "h": 0.525, "i": 0.229, "j": 0.239, "k": 0.455, "l": 0.229,
+    "m": 0.799, "n": 0.525, "o": 0.527, "p": 0.525, "q": 0.525, "r": 0.349,
+    "s": 0.391, "t": 0.335, "u": 0.525, "v": 0.452, "w": 0.715, "x": 0.433,
+    "y": 0.453, "z": 0.395,
+    "–": 0.498, "—": 0.905, "‘": 0.250, "’": 0.250,
+    "“": 0.418, "”": 0.418, "•": 0.350, "…": 0.750,
+}
+DIGIT_WIDTH = 0.507
+WIDE_CHARACTER_WIDTH = 1.0
+DEFAULT_CHARACTER_WIDTH = 0.55
+
+# Headroom for kerning and for template fonts slightly wider than Calibri
+WIDTH_SAFETY = 1.05
+
+# Line height as a multiple of the font size, and space around paragraphs
+LINE_SPACING = 1.2
+PARAGRAPH_SPACING_PT = 12
+
+# Summary font sizes tried in order; text that does not fit on one slide
+# at the smallest is split across slides at PAGINATED_FONT_SIZE
+FONT_SIZES = (16, 14, 13, 12)
+PAGINATED_FONT_SIZE = 14
+
+
+class Page(NamedTuple):
+    """The paragraphs placed on one slide and the font size they fit at."""
+    
+    font_size: int
+    paragraphs: Tuple[str, ...]
+
+
+def character_width(character: str) -> float:
+    """Estimate the advance width of a character in ems."""
+    width = CHARACTER_WIDTHS.get(character)
+    if width is not None:
+        return width
+    if character.isdigit():
+        return DIGIT_WIDTH
+    if unicodedata.east_asian_width(character) in ("W", "F"):
+        return WIDE_CHARACTER_WIDTH
+    return DEFAULT_CHARACTER_WIDTH
+
+
+def text_width(text: str, font_size: float) -> float:
+    """Estimate the width of a run of text in inches."""
+    return sum(character_width(character) for character in text) * font_size / 72 * WIDTH_SAFETY
+
+
+def wrap_lines(text: str, font_size: float, width: float) -> List[str]:
+    """
+    Break a paragraph into the lines it occupies in a text box.
+    
+    Words wrap greedily as PowerPoint does; a word wider than the box is
+    broken between characters.
+    
+    Args:
+        text: Paragraph text
+        font_size: Font size in points
+        width: Usable text box width in inches
+    
+    Returns:
+        The wrapped lines; an empty paragraph is one empty line
+    """
+    space = text_width(" ", font_size)
+    lines = []
+    line = []
+    line_width = 0.0
+    
+    for word in text.split():
+        word_width = text_width(word, font_size)
+        if line and line_width + space + word_width <= width:
+            line.append(word)
+            line_width += space + word_width
+            continue
+        
+        if line:
+            lines.append(" ".join(line))
+        line, line_width = [], 0.0
+        
+        while word_width > width:
+            cut = 1
+            while cut < len(word) and text_width(word[:cut + 1], font_size) <= width:
+                cut += 1
+            lines.append(word[:cut])
+            word = word[cut:]
+            word_width = text_width(word, font_size)
+        
+        if word:
+            line, line_width = [word], word_width
+    
+    if line or not lines:
+        lines.append(" ".join(line))
+    return lines
+
+
+def paragraph_height(line_count: int, font_size: float) -> float:
+    """Height in inches of a paragraph with the given number of lines."""
+    return (line_count * font_size * LINE_SPACING + PARAGRAPH_SPACING_PT) / 72
+
+
+def fit_text(
+    text: str,
+    width: float,
+    height: float,
+    font_sizes: Sequence[int] = FONT_SIZES,
+    paginated_font_size: int = PAGINATED_FONT_SIZE
+) -> List[Page]:
+    """
+    Lay out text, one paragraph per line, in a fixed-size text box.
+    
+    The largest font size at which the whole text fits is used. If it does
+    not fit even at the smallest size, the text is split across pages at
+    paginated_font_size, breaking between paragraphs where possible and
+    within a paragraph only when it is taller than a page.
+    
+    Args:
+        text: Text with one paragraph per line
+        width: Usable text box width in inches
+        height: Usable text box height in inches
+        font_sizes: Font sizes to try for a single page, largest first
+        paginated_font_size: Font size used when the text needs more pages
+    
+    Returns:
+        Pages in reading order; at least one
+    """
+    paragraphs = text.replace("\r", "").split("\n")
+    while paragraphs and not paragraphs[-1].strip():
+        paragraphs.pop()
+    
+    for font_size in font_sizes:
+        used = sum(
+            paragraph_height(len(wrap_lines(paragraph, font_size, width)), font_size)
+            for paragraph in paragraphs
+        )
+        if used <= height:
+            return [Page(font_size, tuple(paragraphs))]
+    
+    font_size = paginated_font_size
+    line_height = font_size * LINE_SPACING / 72
+    
+    def room(used: float) -> int:
+        """Lines a new paragraph can take below the used height."""
+        lines = math.floor((height - used - PARAGRAPH_SPACING_PT / 72) / line_height)
+        return max(lines, 1) if used == 0 else lines
+    
+    pages = []
+    current = []
+    used = 0.0
+    
+    for paragraph in paragraphs:
+        if not paragraph.strip() and not current:
+            continue  # No blank paragraph at the top of a page
+        
+        lines = wrap_lines(paragraph, font_size, width)
+        
+        # Move a paragraph that fits on a page of its own rather than split it
+        if current and room(used) < len(lines) <= room(0):
+            pages.append(Page(font_size, tuple(current)))
+            current, used = [], 0.0
+            if not paragraph.strip():
+                continue
+        
+        while len(lines) > room(used):
+            take = room(used)
+            if take > 0:
+                current.append(" ".join(lines[:take]))
+                lines = lines[take:]
+                paragraph = " ".join(lines)
+            pages.append(Page(font_size, tuple(current)))
+            current, used = [], 0.0
+        
+        current.append(paragraph)
+        used += paragraph_height(len(lines), font_size)
+    
+    if current or not pages:
+        pages.append(Page(font_size, tuple(current)))
+    return pages
+
+
+def deck_sections(records: Iterable[SlideRecord], max_sections: int = 8) -> List[str]:
+    """
+    Describe the sections of a deck by slide range and title.
+    
+    Consecutive slides with the same title form one section, and untitled
+    slides belong to the section before them. Decks with more sections
+    than max_sections have neighbouring sections merged, naming the first
+    and listing the titles that were merged in.
+    
+    Args:
+        records: Slide records in slide order
+        max_sections: Maximum number of sections returned
+    
+    Returns:
+        One line per section, e.g. "Slides 3–7: Market Overview", or an
+        empty list if no slide has a title
+    """
+    groups = []
+    for record in records:
+        title = " ".join(record.title.split())
+        if groups and (not title or title.lower() == groups[-1][2].lower()):
+            groups[-1][1] = record.slide_number
+        else:
+            groups.append([record.slide_number, record.slide_number, title])
+    
+    if not any(title for _, _, title in groups):
+        return []
+    
+    count = min(len(groups), max_sections)
+    bounds = [round(index * len(groups) / count) for index in range(count + 1)]
+    
+    sections = []
+    for start, end in zip(bounds, bounds[1:]):
+        merged = groups[start:end]
+        titles = []
+        for _, _, title in merged:
+            if title and title.lower() not in (seen.lower() for seen in titles):
+                titles.append(title)
+        
+        first, last = merged[0][0], merged[-1][1]
+        label = f"Slide {first}" if first == last else f"Slides {first}–{last}"
+        name = titles[0] if titles else "Untitled"
+        
+        others = titles[1:]
+        if len(others) > 3:
+            others = others[:3] + [f"+{len(titles) - 4} more"]
+        sections.append(f"{label}: {name}" + (f" ({', '.join(others)})" if others else ""))
+    
+    return sections
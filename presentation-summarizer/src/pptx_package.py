@@ -0,0 +1,307 @@
+"""Module for adding slides to a .pptx package by editing its parts directly."""
+
+import copy
+import posixpath
+import re
+import shutil
+import struct
+import sys
+import zipfile
+from typing import BinaryIO, Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
+from lxml import etree
+
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+PRESENTATION_PART = "ppt/presentation.xml"
+PRESENTATION_RELS_PART = "ppt/_rels/presentation.xml.rels"
+
+SLIDE_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+SLIDE_RELATIONSHIP = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+SLIDE_LAYOUT_RELATIONSHIP = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
+
+CONTENT_TYPES_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+RELATIONSHIPS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+PRESENTATION_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+OFFICE_RELATIONSHIPS_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+# Slide ids below 256 are reserved
+MIN_SLIDE_ID = 256
+
+SLIDE_PART_RE = re.compile(r"^ppt/slides/slide(\d+)\.xml$")
+SLIDE_LAYOUT_PART_RE = re.compile(r"^ppt/slideLayouts/slideLayout(\d+)\.xml$")
+LAYOUT_TYPE_RE = re.compile(rb"<p:sldLayout\b[^>]*\btype=\"(\w+)\"")
+
+# Zip local file header size and general purpose flag for a trailing data descriptor
+LOCAL_HEADER_SIZE = 30
+DATA_DESCRIPTOR_FLAG = 0x08
+COPY_BLOCK_SIZE = 1024 * 1024
+
+# Extra field record holding ZIP64 sizes and offsets, and the size above
+# which zipfile writes one
+ZIP64_EXTRA_ID = 0x0001
+ZIP64_LIMIT = (1 << 31) - 1
+
+# Python versions whose ZipFile writer state the raw copy was checked against
+RAW_COPY_VERSIONS = ((3, 7), (3, 13))
+RAW_COPY_ATTRIBUTES = ("fp", "filelist", "NameToInfo", "start_dir", "_didModify")
+
+# Elements of p:presentation that come before p:sldIdLst
+SLIDE_LIST_PREDECESSORS = ("sldMasterIdLst", "notesMasterIdLst", "handoutMasterIdLst")
+
+
+def _serialize(root: etree._Element) -> bytes:
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def relationships_part(part_name: str) -> str:
+    """Name of the relationships part that belongs to a part."""
+    directory, name = posixpath.split(part_name)
+    return posixpath.join(directory, "_rels", name + ".rels")
+
+
+def insert_slides(
+    read: Callable[[str], bytes],
+    names: Iterable[str],
+    slides: Sequence[Tuple[bytes, Optional[bytes]]],
+    position: Optional[int] = None
+) -> Dict[str, bytes]:
+    """
+    Add slides to a package without loading it into an object model.
+    
+    Only the content types, the presentation part and its relationships
+    are parsed and rewritten; every other part of the package is left as
+    it is, so callers can copy them through unchanged.
+    
+    Args:
+        read: Function returning the content of a package part by name
+        names: Names of all parts in the package
+        slides: (slide XML, slide relationships XML or None) per new slide.
+            Relationship targets are resolved from ppt/slides/, where the
+            new slide parts are placed.
+        position: Index in the slide order at which the slides are
+            inserted, or None to append them
+    
+    Returns:
+        New and rewritten parts by name
+    """
+    numbers = [int(match.group(1)) for match in map(SLIDE_PART_RE.match, names) if match]
+    next_number = max(numbers, default=0) + 1
+    
+    content_types = etree.fromstring(read(CONTENT_TYPES_PART))
+    presentation = etree.fromstring(read(PRESENTATION_PART))
+    relationships = etree.fromstring(read(PRESENTATION_RELS_PART))
+    
+    slide_list = presentation.find(f"{{{PRESENTATION_NS}}}sldIdLst")
+    if slide_list is None:
+        slide_list = etree.Element(f"{{{PRESENTATION_NS}}}sldIdLst")
+        index = 0
+        for offset, child in enumerate(presentation):
+            if etree.QName(child).localname in SLIDE_LIST_PREDECESSORS:
+                index = offset + 1
+        presentation.insert(index, slide_list)
+    
+    next_id = max([MIN_SLIDE_ID - 1] + [int(slide_id.get("id")) for slide_id in slide_list]) + 1
+    next_rid = max(
+        [0] + [
+            int(relationship.get("Id")[3:]) for relationship in relationships
+            if re.fullmatch(r"rId\d+", relationship.get("Id", ""))
+        ]
+    ) + 1
+    if position is None:
+        position = len(slide_list)
+    
+    parts = {}
+    for offset, (slide_xml, slide_rels) in enumerate(slides):
+        part_name = f"ppt/slides/slide{next_number + offset}.xml"
+        rid = f"rId{next_rid + offset}"
+        
+        parts[part_name] = slide_xml
+        if slide_rels is not None:
+            parts[relationships_part(part_name)] = slide_rels
+        
+        etree.SubElement(
+            content_types,
+            f"{{{CONTENT_TYPES_NS}}}Override",
+            PartName="/" + part_name,
+            ContentType=SLIDE_CONTENT_TYPE
+        )
+        etree.SubElement(
+            relationships,
+            f"{{{RELATIONSHIPS_NS}}}Relationship",
+            Id=rid,
+            Type=SLIDE_RELATIONSHIP,
+            Target=posixpath.relpath(part_name, "ppt")
+        )
+        
+        slide_id = etree.Element(f"{{{PRESENTATION_NS}}}sldId", id=str(next_id + offset))
+        slide_id.set(f"{{{OFFICE_RELATIONSHIPS_NS}}}id", rid)
+        slide_list.insert(position + offset, slide_id)
+    
+    parts[CONTENT_TYPES_PART] = _serialize(content_types)
+    parts[PRESENTATION_PART] = _serialize(presentation)
+    parts[PRESENTATION_RELS_PART] = _serialize(relationships)
+    return parts
+
+
+def slide_size(presentation_xml: bytes) -> Optional[Tuple[int, int]]:
+    """Slide width and height of a presentation part in EMU, or None if not set."""
+    size = etree.fromstring(presentation_xml).find(f"{{{PRESENTATION_NS}}}sldSz")
+    return (int(size.get("cx")), int(size.get("cy"))) if size is not None else None
+
+
+def blank_layout(read: Callable[[str], bytes], names: Iterable[str]) -> str:
+    """
+    Find the layout a new slide without placeholders should use.
+    
+    Args:
+        read: Function returning the content of a package part by name
+        names: Names of all parts in the package
+    
+    Returns:
+        Part name of the package's blank layout, or of its first layout
+        if none is marked blank
+    
+    Raises:
+        ValueError: If the package has no slide layouts
+    """
+    layouts = sorted(
+        (int(match.group(1)), match.group(0))
+        for match in map(SLIDE_LAYOUT_PART_RE.match, names) if match
+    )
+    if not layouts:
+        raise ValueError("Presentation has no slide layouts")
+    
+    for _, name in layouts:
+        match = LAYOUT_TYPE_RE.search(read(name)[:4096])
+        if match and match.group(1) == b"blank":
+            return name
+    return layouts[0][1]
+
+
+def slide_relationships(layout_part: str) -> bytes:
+    """Relationships part of a new slide that only refers to its layout."""
+    relationships = etree.Element(f"{{{RELATIONSHIPS_NS}}}Relationships", nsmap={None: RELATIONSHIPS_NS})
+    etree.SubElement(
+        relationships,
+        f"{{{RELATIONSHIPS_NS}}}Relationship",
+        Id="rId1",
+        Type=SLIDE_LAYOUT_RELATIONSHIP,
+        Target=posixpath.relpath(layout_part, "ppt/slides")
+    )
+    return _serialize(relationships)
+
+
+def strip_zip64_extra(extra: bytes) -> bytes:
+    """Extra field data without its ZIP64 record, which zipfile writes itself."""
+    records = []
+    position = 0
+    while position + 4 <= len(extra):
+        record_id, size = struct.unpack("<HH", extra[position:position + 4])
+        end = position + 4 + size
+        if record_id != ZIP64_EXTRA_ID:
+            records.append(extra[position:end])
+        position = end
+    return b"".join(records)
+
+
+def raw_copy_supported(target: zipfile.ZipFile) -> bool:
+    """Whether entries can be copied into an archive without recompressing them."""
+    return (
+        RAW_COPY_VERSIONS[0] <= sys.version_info[:2] <= RAW_COPY_VERSIONS[1]
+        and all(hasattr(target, name) for name in RAW_COPY_ATTRIBUTES)
+    )
+
+
+def copy_entry(source: zipfile.ZipFile, info: zipfile.ZipInfo, target: zipfile.ZipFile) -> None:
+    """
+    Copy a zip entry, without decompressing it where possible.
+    
+    zipfile has no public way to write compressed bytes as they are, so
+    the raw copy relies on the writer state of the Python versions in
+    RAW_COPY_VERSIONS. On other versions the entry is decompressed and
+    compressed again through the public API. Either way the entry keeps
+    its name, date, compression method and extra fields, and ZIP64
+    records are written afresh for the copy's own sizes and offset.
+    
+    Args:
+        source: Archive opened for reading
+        info: Entry of the source archive
+        target: Archive opened for writing, with no entry being written
+    """
+    if raw_copy_supported(target):
+        _copy_raw(source, info, target)
+        return
+    
+    copied = zipfile.ZipInfo(info.filename, info.date_time)
+    copied.compress_type = info.compress_type
+    copied.comment = info.comment
+    copied.extra = strip_zip64_extra(info.extra)
+    copied.create_system = info.create_system
+    copied.external_attr = info.external_attr
+    
+    zip64 = info.file_size > ZIP64_LIMIT
+    with source.open(info) as reader, target.open(copied, "w", force_zip64=zip64) as writer:
+        shutil.copyfileobj(reader, writer, COPY_BLOCK_SIZE)
+
+
+def _copy_raw(source: zipfile.ZipFile, info: zipfile.ZipInfo, target: zipfile.ZipFile) -> None:
+    """
+    Copy the compressed bytes of an entry behind a fresh local header.
+    
+    The bytes are streamed in blocks, so large media parts cost one
+    sequential copy and constant memory.
+    """
+    source.fp.seek(info.header_offset)
+    header = source.fp.read(LOCAL_HEADER_SIZE)
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    source.fp.seek(info.header_offset + LOCAL_HEADER_SIZE + name_length + extra_length)
+    
+    # Sizes are known up front, so the copy needs no data descriptor; the
+    # header adds a ZIP64 record when the sizes need one
+    copied = copy.copy(info)
+    copied.flag_bits &= ~DATA_DESCRIPTOR_FLAG
+    copied.extra = strip_zip64_extra(info.extra)
+    copied.header_offset = target.fp.tell()
+    target.fp.write(copied.FileHeader())
+    
+    remaining = info.compress_size
+    while remaining:
+        block = source.fp.read(min(remaining, COPY_BLOCK_SIZE))
+        if not block:
+            raise ValueError(f"Truncated zip entry: {info.filename}")
+        target.fp.write(block)
+        remaining -= len(block)
+    
+    target.filelist.append(copied)
+    target.NameToInfo[copied.filename] = copied
+    target.start_dir = target.fp.tell()
+    target._didModify = True
+
+
+def write_package(
+    source: zipfile.ZipFile,
+    parts: Dict[str, bytes],
+    output: Union[str, BinaryIO]
+) -> None:
+    """
+    Write a copy of a package with some parts replaced or added.
+    
+    Entries that are not in parts are copied through compressed, in their
+    original order; replaced parts keep their position and new parts are
+    appended.
+    
+    Args:
+        source: Package opened for reading
+        parts: New and rewritten parts by name, e.g. from insert_slides()
+        output: Path or seekable binary stream to write the package to
+    """
+    pending = dict(parts)
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            if info.filename in pending:
+                target.writestr(info.filename, pending.pop(info.filename))
+            else:
+                copy_entry(source, info, target)
+        
+        for name, data in pending.items():
+            target.writestr(name, data)
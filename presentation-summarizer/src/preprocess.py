@@ -0,0 +1,307 @@
+"""Module for shrinking extracted slide text before it is sent to the AI."""
+
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+import numpy as np
+from presentation_reader import SlideRecord
+from dedup import collapse_near_duplicates
+from token_budget import count_tokens
+
+
+# Lines of at most BOILERPLATE_MAX_WORDS words on at least this share of
+# slides (and at least MIN_BOILERPLATE_SLIDES slides) are treated as footers
+# or headers where they start or end a slide; other repeated lines, such as
+# a key message, are kept once
+BOILERPLATE_SHARE = 0.5
+MIN_BOILERPLATE_SLIDES = 3
+BOILERPLATE_MAX_WORDS = 8
+
+PAGE_NUMBER_RE = re.compile(r"^(page|slide)\s*\d+(\s*(/|of)\s*\d+)?$", re.IGNORECASE)
+# A bare number may be a KPI; it only counts as a page number when it is the
+# slide's own number and enough slides carry theirs the same way
+BARE_PAGE_NUMBER_RE = re.compile(r"^(\d+)(\s*(/|of)\s*\d+)?$")
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(])")
+TERM_RE = re.compile(r"[a-z0-9]+(?:['’][a-z]+)?")
+
+STOPWORDS = frozenset("""
+a about after all also an and any are as at be been but by can could did do does
+for from had has have he her his how i if in into is it its just may more most
+must no not of on or our out over so such than that the their them then there
+these they this those to up us was we were what when which while who will with
+would you your
+""".split())
+
+# TextRank damping factor and convergence settings
+DAMPING = 0.85
+MAX_ITERATIONS = 100
+TOLERANCE = 1e-6
+
+
+class CompressionReport(NamedTuple):
+    """How much preprocessing shrank one deck."""
+    
+    original_tokens: int
+    kept_tokens: int
+    boilerplate_lines: int
+    duplicate_lines: int
+    dropped_sentences: int
+    duplicate_slides: int = 0
+    
+    @property
+    def ratio(self) -> float:
+        """Kept tokens as a share of the original tokens."""
+        if not self.original_tokens:
+            return 1.0
+        return self.kept_tokens / self.original_tokens
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the report as a dictionary, including the ratio."""
+        return dict(self._asdict(), ratio=round(self.ratio, 3))
+
+
+class _Sentence(NamedTuple):
+    slide_index: int
+    in_notes: bool
+    line_index: int
+    text: str
+
+
+def normalize_line(line: str) -> str:
+    """Normalize a line for duplicate and boilerplate detection."""
+    return re.sub(r"\s+", " ", line).strip().lower()
+
+
+def _bare_page_number(key: str) -> Optional[int]:
+    """The page a line consisting only of a number (or "n of m") refers to."""
+    match = BARE_PAGE_NUMBER_RE.match(key)
+    return int(match.group(1)) if match else None
+
+
+def _edge_runs(flags: List[bool]) -> Set[int]:
+    """Indexes in the leading and trailing runs of flagged items."""
+    edges = set()
+    for indexes in (range(len(flags)), range(len(flags) - 1, -1, -1)):
+        for index in indexes:
+            if not flags[index]:
+                break
+            edges.add(index)
+    return edges
+
+
+def split_sentences(line: str) -> List[str]:
+    """Split a line of slide text into sentences."""
+    return [sentence for sentence in SENTENCE_SPLIT_RE.split(line.strip()) if sentence]
+
+
+def rank_sentences(sentences: List[str]) -> np.ndarray:
+    """
+    Score sentences by centrality with TextRank over TF-IDF vectors.
+    
+    Args:
+        sentences: Sentences to rank
+    
+    Returns:
+        One score per sentence; higher scores mark more central content
+    """
+    count = len(sentences)
+    if count == 0:
+        return np.zeros(0)
+    
+    documents = [
+        [term for term in TERM_RE.findall(sentence.lower()) if term not in STOPWORDS]
+        for sentence in sentences
+    ]
+    vocabulary = {term: index for index, term in enumerate(sorted({t for d in documents for t in d}))}
+    if not vocabulary:
+        return np.full(count, 1.0 / count)
+    
+    term_counts = np.zeros((count, len(vocabulary)))
+    for row, document in enumerate(documents):
+        for term, occurrences in Counter(document).items():
+            term_counts[row, vocabulary[term]] = occurrences
+    
+    document_frequency = np.count_nonzero(term_counts, axis=0)
+    idf = np.log((1 + count) / (1 + document_frequency)) + 1
+    vectors = term_counts * idf
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+    
+    similarity = vectors @ vectors.T
+    np.fill_diagonal(similarity, 0.0)
+    
+    # Row-normalize into a transition matrix; isolated sentences jump uniformly
+    row_sums = similarity.sum(axis=1, keepdims=True)
+    transition = np.where(row_sums > 0, similarity / np.where(row_sums > 0, row_sums, 1), 1.0 / count)
+    
+    scores = np.full(count, 1.0 / count)
+    for _ in range(MAX_ITERATIONS):
+        updated = (1 - DAMPING) / count + DAMPING * (transition.T @ scores)
+        converged = np.abs(updated - scores).sum() < TOLERANCE
+        scores = updated
+        if converged:
+            break
+    
+    return scores
+
+
+def condense_slides(
+    records: Iterable[SlideRecord],
+    token_budget: Optional[int] = None,
+    model: str = "gpt-3.5-turbo",
+    duplicate_threshold: Optional[float] = None
+) -> Tuple[List[str], CompressionReport]:
+    """
+    Remove boilerplate and repetition from slide text and keep the most
+    central sentences within a token budget.
+    
+    Near-identical slides such as appendix copies are first collapsed to
+    one representative when duplicate_threshold is given. Short lines that
+    repeat across many slides at the start or end of the slide (footers,
+    headers) and page numbers ("Page 3", or a slide's own number when most
+    slides show theirs) are dropped, and any other line, including a
+    repeated key message, is kept only the first time it appears. If the remaining text still exceeds token_budget, sentences
+    are ranked with TextRank and the lowest ranked ones are dropped. Slide
+    titles are always kept, and the surviving text stays in slide order.
+    
+    Args:
+        records: Slide records in slide order
+        token_budget: Approximate token limit for the condensed text, or
+            None to only remove boilerplate and duplicates
+        model: Model whose tokenizer is used for counting
+        duplicate_threshold: Minimum MinHash similarity for two slides to
+            count as near-identical, or None to keep every slide
+    
+    Returns:
+        Tuple of (one text chunk per non-empty slide, compression report)
+    """
+    records = list(records)
+    original_tokens = sum(
+        count_tokens("\n".join(record.text_lines()), model) for record in records
+    )
+    
+    slide_count = len(records)
+    if duplicate_threshold is not None:
+        records = list(collapse_near_duplicates(records, threshold=duplicate_threshold))
+    
+    # Lines of each slide, split so that multi-line shapes are compared line by line
+    slide_lines = []
+    for record in records:
+        content = [line for item in record.content for line in item.splitlines() if line.strip()]
+        notes = [line for line in record.notes.splitlines() if line.strip()]
+        slide_lines.append((content, notes))
+    
+    slides_per_line = Counter()
+    for content, notes in slide_lines:
+        slides_per_line.update({normalize_line(line) for line in content + notes})
+    
+    boilerplate_min = max(MIN_BOILERPLATE_SLIDES, math.ceil(BOILERPLATE_SHARE * len(records)))
+    
+    own_numbers = [
+        {
+            index for index, line in enumerate(content)
+            if _bare_page_number(normalize_line(line)) == record.slide_number
+        }
+        for record, (content, _) in zip(records, slide_lines)
+    ]
+    if sum(1 for numbers in own_numbers if numbers) < boilerplate_min:
+        own_numbers = [set() for _ in records]
+    boilerplate_lines = 0
+    duplicate_lines = 0
+    seen = set()
+    sentences = []
+    
+    for slide_index, (content, notes) in enumerate(slide_lines):
+        for in_notes, lines in ((False, content), (True, notes)):
+            keys = [normalize_line(line) for line in lines]
+            page_numbers = [
+                bool(PAGE_NUMBER_RE.match(key)) or (not in_notes and line_index in own_numbers[slide_index])
+                for line_index, key in enumerate(keys)
+            ]
+            footers = [
+                slides_per_line[key] >= boilerplate_min and len(key.split()) <= BOILERPLATE_MAX_WORDS
+                for key in keys
+            ]
+            # Footers only count at the edges of the slide, past any page numbers
+            edges = _edge_runs([footer or number for footer, number in zip(footers, page_numbers)])
+            
+            for line_index, (line, key) in enumerate(zip(lines, keys)):
+                if page_numbers[line_index] or (footers[line_index] and line_index in edges):
+                    boilerplate_lines += 1
+                    continue
+                if key in seen:
+                    duplicate_lines += 1
+                    continue
+                seen.add(key)
+                
+                for sentence in split_sentences(line):
+                    sentences.append(_Sentence(slide_index, in_notes, line_index, sentence))
+    
+    headers = [
+        f"Slide {record.slide_number}: {record.title}" if record.title else ""
+        for record in records
+    ]
+    keep = _select_sentences(sentences, headers, token_budget, model)
+    
+    kept_by_slide = [[] for _ in records]
+    for index in keep:
+        kept_by_slide[sentences[index].slide_index].append(sentences[index])
+    
+    chunks = []
+    for slide_index, kept in enumerate(kept_by_slide):
+        content = _join_lines([s for s in kept if not s.in_notes])
+        notes = " ".join(_join_lines([s for s in kept if s.in_notes]))
+        
+        lines = ([headers[slide_index]] if headers[slide_index] else []) + content
+        if notes:
+            lines.append(f"Notes: {notes}")
+        if lines:
+            chunks.append("\n".join(lines + [""]))
+    
+    report = CompressionReport(
+        original_tokens=original_tokens,
+        kept_tokens=sum(count_tokens(chunk, model) for chunk in chunks),
+        boilerplate_lines=boilerplate_lines,
+        duplicate_lines=duplicate_lines,
+        dropped_sentences=len(sentences) - len(keep),
+        duplicate_slides=slide_count - len(records),
+    )
+    return chunks, report
+
+
+def _select_sentences(
+    sentences: List["_Sentence"],
+    headers: List[str],
+    token_budget: Optional[int],
+    model: str
+) -> List[int]:
+    """Indexes of the sentences to keep, in original order."""
+    sizes = [count_tokens(sentence.text, model) + 1 for sentence in sentences]
+    header_tokens = sum(count_tokens(header, model) + 1 for header in headers if header)
+    
+    if token_budget is None or header_tokens + sum(sizes) <= token_budget:
+        return list(range(len(sentences)))
+    
+    scores = rank_sentences([sentence.text for sentence in sentences])
+    remaining = token_budget - header_tokens
+    keep = []
+    for index in np.argsort(-scores, kind="stable"):
+        if sizes[index] <= remaining:
+            keep.append(int(index))
+            remaining -= sizes[index]
+    
+    return sorted(keep)
+
+
+def _join_lines(sentences: List["_Sentence"]) -> List[str]:
+    """Reassemble kept sentences into their original lines."""
+    lines = []
+    current_line = None
+    for sentence in sentences:
+        if sentence.line_index == current_line:
+            lines[-1] += " " + sentence.text
+        else:
+            lines.append(sentence.text)
+            current_line = sentence.line_index
+    return lines
@@ -2,18 +2,103 @@
 
 from pathlib import Path
 from pptx import Presentation
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, NamedTuple, Tuple, Iterator
+from extraction_cache import ExtractionCache
+
+
+class SlideRecord(NamedTuple):
+    """Immutable, tuple-backed text content of a single slide."""
+    
+    slide_number: int
+    title: str
+    content: Tuple[str, ...]
+    notes: str
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SlideRecord":
+        """Build a record from the dictionary view returned by to_dict()."""
+        return cls(
+            data["slide_number"],
+            data["title"],
+            tuple(data["content"]),
+            data["notes"]
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary view used by get_slides_content()."""
+        return {
+            "slide_number": self.slide_number,
+            "title": self.title,
+            "content": list(self.content),
+            "notes": self.notes
+        }
+    
+    def text_lines(self) -> List[str]:
+        """Return the lines this slide contributes to the full text."""
+        lines = []
+        
+        if self.title:
+            lines.append(f"Slide {self.slide_number}: {self.title}")
+        
+        lines.extend(self.content)
+        
+        if self.notes:
+            lines.append(f"Notes: {self.notes}")
+        
+        lines.append("")  # Empty line between slides
+        return lines
+
+
+def iter_text_chunks(records: Iterable[SlideRecord], max_chars: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield the text of slide records incrementally, split on slide boundaries.
+    
+    Args:
+        records: Slide records in slide order
+        max_chars: If given, consecutive slides are grouped into chunks of
+            at most this many characters. A single slide longer than the
+            limit is yielded on its own. By default every slide is its own
+            chunk.
+    
+    Yields:
+        Text chunks in slide order
+    """
+    pending = []
+    pending_chars = 0
+    
+    for record in records:
+        slide_text = "\n".join(record.text_lines())
+        
+        if max_chars is None:
+            yield slide_text
+            continue
+        
+        if pending and pending_chars + 1 + len(slide_text) > max_chars:
+            yield "\n".join(pending)
+            pending = []
+            pending_chars = 0
+        
+        pending_chars += len(slide_text) + (1 if pending else 0)
+        pending.append(slide_text)
+    
+    if pending:
+        yield "\n".join(pending)
 
 
 class PresentationReader:
     """Handles reading PowerPoint presentations and extracting text content."""
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, cache: Optional[ExtractionCache] = None, fast: bool = False):
         """
         Initialize the presentation reader.
         
         Args:
             file_path: Path to the presentation file (.pptx)
+            cache: Optional extraction cache. When the deck's content hash
+                is already cached, the file is not parsed at all.
+            fast: Stream slide XML straight from the package instead of
+                loading python-pptx; also picks up text in groups, tables
+                and charts (see fast_reader.iter_package_slides)
         
         Raises:
             FileNotFoundError: If the file doesn't exist
@@ -27,51 +112,204 @@ class PresentationReader:
         if self.file_path.suffix.lower() != ".pptx":
             raise ValueError(f"File must be a .pptx file, got: {self.file_path.suffix}")
         
-        self.presentation = None
-        self._load_presentation()
+        self.cache = cache
+        self.fast = fast
+        self.content_digest = None
+        self._presentation = None
+        self._records = None
+        self._slide_count = None
+        
+        if self.cache is not None:
+            self.content_digest = self.cache.file_digest(self.file_path)
+            cached_slides = self.cache.get(self._cache_key)
+            if cached_slides is not None:
+                self._records = tuple(SlideRecord.from_dict(slide) for slide in cached_slides)
+        
+        if self._records is None:
+            if self.fast:
+                from fast_reader import package_slide_count
+                
+                try:
+                    self._slide_count = package_slide_count(self.file_path)
+                except Exception as e:
+                    raise ValueError(f"Failed to load presentation: {str(e)}")
+            else:
+                self._load_presentation()
+    
+    @property
+    def _cache_key(self) -> str:
+        # The fast path extracts more text, so its records are cached apart
+        return f"{self.content_digest}-fast" if self.fast else self.content_digest
     
     def _load_presentation(self) -> None:
         """Load the PowerPoint presentation."""
         try:
-            self.presentation = Presentation(self.file_path)
+            self._presentation = Presentation(self.file_path)
         except Exception as e:
             raise ValueError(f"Failed to load presentation: {str(e)}")
     
-    def get_slides_content(self) -> List[Dict[str, Any]]:
+    @property
+    def presentation(self):
+        """The python-pptx presentation, loaded on first access after a cache hit."""
+        if self._presentation is None:
+            self._load_presentation()
+        return self._presentation
+    
+    @property
+    def slide_count(self) -> int:
+        """Number of slides in the presentation."""
+        if self._records is not None:
+            return len(self._records)
+        if self._slide_count is not None:
+            return self._slide_count
+        return len(self.presentation.slides)
+    
+    def get_slide_records(self) -> Tuple[SlideRecord, ...]:
         """
-        Extract content from all slides.
+        Get the immutable per-slide records, extracting them on first use.
+        
+        Every other accessor is served from these records, so the slide
+        shapes and notes are walked at most once per reader.
         
         Returns:
-            List of dictionaries containing slide content
+            Tuple of SlideRecord objects in slide order
         """
-        slides_content = []
+        if self._records is None:
+            self._records = tuple(self._extract_records())
+            if self.cache is not None:
+                self.cache.put(
+                    self._cache_key,
+                    [record.to_dict() for record in self._records]
+                )
+        return self._records
+    
+    def _extract_records(self) -> List[SlideRecord]:
+        """Walk every slide of the loaded presentation once."""
+        return list(self._walk_slides())
+    
+    def _walk_slides(self) -> Iterator[SlideRecord]:
+        """Build slide records one at a time from the loaded presentation."""
+        if self.fast:
+            from fast_reader import iter_package_slides
+            
+            yield from iter_package_slides(self.file_path)
+            return
         
         for slide_idx, slide in enumerate(self.presentation.slides, 1):
-            slide_data = {
-                "slide_number": slide_idx,
-                "title": "",
-                "content": [],
-                "notes": ""
-            }
+            title = ""
+            content = []
+            notes = ""
             
             # Extract text from shapes
             for shape in slide.shapes:
                 if hasattr(shape, "text") and shape.text.strip():
                     # Check if it's a title (typically first text shape)
-                    if not slide_data["title"] and hasattr(shape, "name") and "Title" in shape.name:
-                        slide_data["title"] = shape.text
+                    if not title and hasattr(shape, "name") and "Title" in shape.name:
+                        title = shape.text
                     else:
-                        slide_data["content"].append(shape.text)
+                        content.append(shape.text)
             
             # Extract notes if available
             if slide.has_notes_slide:
                 notes_frame = slide.notes_slide.notes_text_frame
                 if notes_frame.text.strip():
-                    slide_data["notes"] = notes_frame.text
+                    notes = notes_frame.text
             
-            slides_content.append(slide_data)
+            yield SlideRecord(slide_idx, title, tuple(content), notes)
+    
+    def iter_slides(self) -> Iterator[SlideRecord]:
+        """
+        Yield slide records one at a time.
+        
+        Records that were already extracted are replayed. Otherwise each
+        slide is extracted just before it is yielded, so the first slide is
+        available immediately and nothing is retained between slides. When
+        an extraction cache is attached, the records are kept so that a
+        completed walk can be stored in the cache.
+        
+        Yields:
+            SlideRecord objects in slide order
+        """
+        if self._records is not None:
+            yield from self._records
+            return
+        
+        collected = [] if self.cache is not None else None
         
-        return slides_content
+        for record in self._walk_slides():
+            if collected is not None:
+                collected.append(record)
+            yield record
+        
+        if collected is not None and self._records is None:
+            self._records = tuple(collected)
+            self.cache.put(
+                self._cache_key,
+                [record.to_dict() for record in self._records]
+            )
+    
+    def iter_text_chunks(self, max_chars: Optional[int] = None) -> Iterator[str]:
+        """
+        Yield the full text incrementally, split on slide boundaries.
+        
+        Joining the yielded chunks with a newline reproduces
+        extract_full_text().
+        
+        Args:
+            max_chars: If given, consecutive slides are grouped into chunks
+                of at most this many characters. A single slide longer than
+                the limit is yielded on its own. By default every slide is
+                its own chunk.
+        
+        Returns:
+            Iterator over text chunks in slide order
+        """
+        return iter_text_chunks(self.iter_slides(), max_chars=max_chars)
+    
+    def get_slide(self, slide_number: int) -> SlideRecord:
+        """
+        Get the record for a single slide.
+        
+        Args:
+            slide_number: 1-based slide number
+        
+        Returns:
+            The SlideRecord for that slide
+        
+        Raises:
+            IndexError: If the slide number is out of range
+        """
+        records = self.get_slide_records()
+        if not 1 <= slide_number <= len(records):
+            raise IndexError(f"Slide number out of range: {slide_number}")
+        return records[slide_number - 1]
+    
+    def get_distinct_slide_records(self, threshold: float = 0.85) -> Tuple[SlideRecord, ...]:
+        """
+        Get the slide records with near-identical slides collapsed.
+        
+        Repeated agenda slides, backup slides and appendix copies are
+        detected with MinHash and represented by their first occurrence.
+        
+        Args:
+            threshold: Minimum estimated Jaccard similarity of two slides'
+                word shingles for them to count as duplicates
+        
+        Returns:
+            Tuple of representative SlideRecord objects in slide order
+        """
+        from dedup import collapse_near_duplicates
+        
+        return collapse_near_duplicates(self.get_slide_records(), threshold=threshold)
+    
+    def get_slides_content(self) -> List[Dict[str, Any]]:
+        """
+        Extract content from all slides.
+        
+        Returns:
+            List of dictionaries containing slide content
+        """
+        return [record.to_dict() for record in self.get_slide_records()]
     
     def get_presentation_summary(self) -> Dict[str, Any]:
         """
@@ -84,7 +322,7 @@ class PresentationReader:
         
         return {
             "file_name": self.file_path.name,
-            "total_slides": len(self.presentation.slides),
+            "total_slides": self.slide_count,
             "slides": slides
         }
     
@@ -95,19 +333,9 @@ class PresentationReader:
         Returns:
             Combined text from all slides
         """
-        slides = self.get_slides_content()
         full_text = []
         
-        for slide in slides:
-            if slide["title"]:
-                full_text.append(f"Slide {slide['slide_number']}: {slide['title']}")
-            
-            for content in slide["content"]:
-                full_text.append(content)
-            
-            if slide["notes"]:
-                full_text.append(f"Notes: {slide['notes']}")
-            
-            full_text.append("")  # Empty line between slides
+        for record in self.get_slide_records():
+            full_text.extend(record.text_lines())
         
         return "\n".join(full_text)
@@ -0,0 +1,267 @@
+"""Module for caching AI responses for identical requests."""
+
+import abc
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def make_cache_key(**inputs: Any) -> str:
+    """
+    Build a cache key from the inputs of a request.
+    
+    String values are normalized (line endings, trailing whitespace and
+    surrounding blank space) so that cosmetic differences in extracted text
+    do not cause misses.
+    
+    Args:
+        **inputs: Request inputs such as model, prompt and max_tokens
+    
+    Returns:
+        Hex-encoded SHA-256 digest of the normalized inputs
+    """
+    normalized = {}
+    for name, value in inputs.items():
+        if isinstance(value, str):
+            value = value.replace("\r\n", "\n")
+            value = re.sub(r"[ \t]+\n", "\n", value).strip()
+        normalized[name] = value
+    
+    payload = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache(abc.ABC):
+    """Base class for response cache backends with TTL, size limit and counters."""
+    
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of responses kept
+            ttl: Seconds a response stays valid, or None to keep it until evicted
+        
+        Raises:
+            ValueError: If max_entries or ttl is not positive
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Key returned by make_cache_key()
+        
+        Returns:
+            The cached response, or None on a miss
+        """
+        with self._lock:
+            value = self._get(key, time.time())
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+    
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a response.
+        
+        Args:
+            key: Key returned by make_cache_key()
+            value: Response text
+        """
+        with self._lock:
+            self._set(key, value, time.time())
+    
+    def clear(self) -> None:
+        """Remove every cached response and reset the counters."""
+        with self._lock:
+            self._clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with hits, misses and current size
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": self._size()}
+    
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl is not None and now - created > self.ttl
+    
+    @abc.abstractmethod
+    def _get(self, key: str, now: float) -> Optional[str]:
+        """Cached response for a key, or None if it is missing or expired."""
+    
+    @abc.abstractmethod
+    def _set(self, key: str, value: str, now: float) -> None:
+        """Store a response, evicting entries over the size limit."""
+    
+    @abc.abstractmethod
+    def _clear(self) -> None:
+        """Remove every entry from the backend."""
+    
+    @abc.abstractmethod
+    def _size(self) -> int:
+        """Number of entries currently stored."""
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU response cache."""
+    
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None):
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        self._entries = OrderedDict()
+    
+    def _get(self, key: str, now: float) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        value, created = entry
+        if self._expired(created, now):
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def _set(self, key: str, value: str, now: float) -> None:
+        self._entries[key] = (value, now)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def _clear(self) -> None:
+        self._entries.clear()
+    
+    def _size(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """On-disk response cache shared across processes and restarts."""
+    
+    def __init__(self, db_path: str, max_entries: int = 10000, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            db_path: Path of the SQLite database file
+            max_entries: Maximum number of responses kept
+            ttl: Seconds a response stays valid, or None to keep it until evicted
+        """
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+        )
+        self._conn.commit()
+    
+    def _get(self, key: str, now: float) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT value, created FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        
+        value, created = row
+        if self._expired(created, now):
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+        
+        self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        return value
+    
+    def _set(self, key: str, value: str, now: float) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, created, accessed) "
+            "VALUES (?, ?, ?, ?)",
+            (key, value, now, now)
+        )
+        # Evict least recently used responses beyond the size limit
+        self._conn.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        self._conn.commit()
+    
+    def _clear(self) -> None:
+        self._conn.execute("DELETE FROM responses")
+        self._conn.commit()
+    
+    def _size(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+def create_response_cache(
+    backend: str,
+    db_path: Optional[str] = None,
+    max_entries: int = 1024,
+    ttl: Optional[float] = None
+) -> Optional[ResponseCache]:
+    """
+    Create a response cache from configuration values.
+    
+    Args:
+        backend: "memory", "sqlite" or "none"
+        db_path: Database path, required for the sqlite backend
+        max_entries: Maximum number of responses kept
+        ttl: Seconds a response stays valid, or None to keep it until evicted
+    
+    Returns:
+        The configured cache, or None when caching is disabled
+    
+    Raises:
+        ValueError: If the backend is unknown or db_path is missing
+    """
+    backend = backend.lower()
+    
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return MemoryResponseCache(max_entries=max_entries, ttl=ttl)
+    if backend == "sqlite":
+        if not db_path:
+            raise ValueError("A database path is required for the sqlite response cache")
+        return SQLiteResponseCache(db_path, max_entries=max_entries, ttl=ttl)
+    
+    raise ValueError(f"Unknown response cache backend: {backend}")
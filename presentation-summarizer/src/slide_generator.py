@@ -1,39 +1,112 @@
 """Module for generating PowerPoint slides with the executive summary."""
 
+import io
+import re
+import threading
+import zipfile
+from functools import lru_cache
 from pathlib import Path
+from xml.sax.saxutils import escape
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
-from typing import Optional
+from typing import BinaryIO, List, Optional, Sequence, Tuple, Union
+from layout import Page, fit_text
+from pptx_package import (
+    PRESENTATION_PART,
+    blank_layout,
+    insert_slides,
+    relationships_part,
+    slide_relationships,
+    slide_size,
+    write_package,
+)
+
+
+# Placeholder text marking where the renderer fills in slide text
+TITLE_MARKER = "\ue000title\ue000"
+SUBTITLE_MARKER = "\ue000subtitle\ue000"
+SUMMARY_MARKER = "\ue000summary\ue000"
+
+# Characters that are not allowed in XML 1.0 text
+INVALID_XML_CHARS_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+# Slide size in inches when the template does not set one
+SLIDE_WIDTH = 10
+SLIDE_HEIGHT = 7.5
+
+# Text box geometry in inches; boxes span the slide less TITLE_LEFT or
+# SUMMARY_LEFT on each side, the summary box ends BOTTOM_MARGIN above the
+# slide edge and its text is inset 0.1in on each side
+TITLE_LEFT = 0.5
+SUMMARY_LEFT = 0.8
+SUMMARY_TOP = {True: 2.3, False: 1.8}
+BOTTOM_MARGIN = 0.4
+SUMMARY_FONT_SIZE = 16
+
+CONTINUED_SUFFIX = " (continued)"
+BREAKDOWN_SUBTITLE = "Section Breakdown"
 
 
 class SlideGenerator:
     """Handles creation of new presentation slides."""
     
-    def __init__(self):
-        """Initialize the slide generator."""
-        self.presentation = Presentation()
-        self.presentation.slide_width = Inches(10)
-        self.presentation.slide_height = Inches(7.5)
+    def __init__(self, template_path: Optional[str] = None, slide_size: Optional[Tuple[int, int]] = None):
+        """
+        Initialize the slide generator.
+        
+        Args:
+            template_path: Optional .pptx whose masters, layouts, theme and
+                slide size are used; any slides it contains are removed
+            slide_size: Optional slide width and height in EMU, replacing
+                the template's
+        """
+        self.presentation = Presentation(template_path)
+        if slide_size is not None:
+            self.presentation.slide_width, self.presentation.slide_height = slide_size
+        
+        slide_ids = self.presentation.slides._sldIdLst
+        for slide_id in list(slide_ids):
+            self.presentation.part.drop_rel(slide_id.rId)
+            slide_ids.remove(slide_id)
+    
+    @property
+    def slide_size(self) -> Tuple[float, float]:
+        """Slide width and height in inches."""
+        width = self.presentation.slide_width
+        height = self.presentation.slide_height
+        return (
+            width.inches if width is not None else SLIDE_WIDTH,
+            height.inches if height is not None else SLIDE_HEIGHT
+        )
+    
+    def blank_layout(self):
+        """The template's blank layout, or its first layout if none is marked blank."""
+        layouts = self.presentation.slide_layouts
+        return next((layout for layout in layouts if layout._element.get("type") == "blank"), layouts[0])
     
     def add_summary_slide(
         self,
         title: str,
         summary: str,
-        subtitle: Optional[str] = None
+        subtitle: Optional[str] = None,
+        font_size: int = SUMMARY_FONT_SIZE
     ) -> None:
         """
         Add an executive summary slide to the presentation.
         
+        The summary is not fitted to the slide; use fit_text() or
+        SlideRenderer for text that may be too long.
+        
         Args:
             title: The slide title
             summary: The summary content
             subtitle: Optional subtitle
+            font_size: Summary font size in points
         """
-        # Use blank slide layout
-        blank_slide_layout = self.presentation.slide_layouts[6]
-        slide = self.presentation.slides.add_slide(blank_slide_layout)
+        slide_width, slide_height = self.slide_size
+        slide = self.presentation.slides.add_slide(self.blank_layout())
         
         # Add background color
         background = slide.background
@@ -42,9 +115,9 @@ class SlideGenerator:
         fill.fore_color.rgb = RGBColor(255, 255, 255)  # White background
         
         # Add title
-        title_left = Inches(0.5)
+        title_left = Inches(TITLE_LEFT)
         title_top = Inches(0.5)
-        title_width = Inches(9)
+        title_width = Inches(slide_width - 2 * TITLE_LEFT)
         title_height = Inches(1)
         
         title_box = slide.shapes.add_textbox(title_left, title_top, title_width, title_height)
@@ -74,15 +147,14 @@ class SlideGenerator:
             subtitle_paragraph.font.size = Pt(18)
             subtitle_paragraph.font.color.rgb = RGBColor(100, 100, 100)
             subtitle_paragraph.alignment = PP_ALIGN.CENTER
-            
-            content_top = Inches(2.3)
-        else:
-            content_top = Inches(1.8)
         
         # Add summary content
-        content_height = Inches(5)
+        content_top = SUMMARY_TOP[bool(subtitle)]
         content_box = slide.shapes.add_textbox(
-            Inches(0.8), content_top, Inches(8.4), content_height
+            Inches(SUMMARY_LEFT),
+            Inches(content_top),
+            Inches(slide_width - 2 * SUMMARY_LEFT),
+            Inches(slide_height - content_top - BOTTOM_MARGIN)
         )
         text_frame = content_box.text_frame
         text_frame.word_wrap = True
@@ -90,22 +162,30 @@ class SlideGenerator:
         
         # Format summary text
         for paragraph in text_frame.paragraphs:
-            paragraph.font.size = Pt(16)
+            paragraph.font.size = Pt(font_size)
             paragraph.font.color.rgb = RGBColor(0, 0, 0)
             paragraph.space_before = Pt(6)
             paragraph.space_after = Pt(6)
             paragraph.level = 0
     
-    def save(self, output_path: str) -> None:
+    def save(self, output_path: Union[str, BinaryIO]) -> None:
         """
-        Save the presentation to a file.
+        Save the presentation to a file or writable binary stream.
         
         Args:
-            output_path: Path where the presentation will be saved
+            output_path: Path where the presentation will be saved, or a
+                stream such as io.BytesIO to write it to
         
         Raises:
             ValueError: If output path is invalid
         """
+        if hasattr(output_path, "write"):
+            try:
+                self.presentation.save(output_path)
+            except Exception as e:
+                raise Exception(f"Failed to save presentation: {str(e)}")
+            return
+        
         output_path = Path(output_path)
         
         if output_path.suffix.lower() != ".pptx":
@@ -120,21 +200,333 @@ class SlideGenerator:
             raise Exception(f"Failed to save presentation: {str(e)}")
 
 
+class SlideRenderer:
+    """
+    Renders summary presentations from a cached, pre-styled prototype.
+    
+    The template is loaded and a summary slide is built with
+    SlideGenerator once, with marker text in place of the title, subtitle
+    and summary. The prototype's package parts are kept in memory, so each
+    render only escapes the text into the slide XML and writes the zip,
+    without loading the template or building shapes again. Summaries too
+    long for one slide are continued on copies of the prototype slide.
+    """
+    
+    def __init__(self, template_path: Optional[str] = None, slide_size: Optional[Tuple[int, int]] = None):
+        """
+        Initialize the renderer.
+        
+        Args:
+            template_path: Optional .pptx to use as the base template
+            slide_size: Optional slide width and height in EMU, replacing
+                the template's
+        """
+        self.template_path = template_path
+        self.slide_size = slide_size
+        self._prototypes = {}
+        self._lock = threading.Lock()
+    
+    def render(
+        self,
+        title: str,
+        summary: str,
+        subtitle: Optional[str] = None,
+        sections: Optional[Sequence[str]] = None
+    ) -> bytes:
+        """
+        Render a presentation with the executive summary.
+        
+        The summary is fitted to the slide with fit_text(): it is shown at
+        the largest font size that fits, or continued on further slides
+        when it is too long for one.
+        
+        Args:
+            title: The slide title
+            summary: The summary content; each line becomes a paragraph
+            subtitle: Optional subtitle
+            sections: Optional lines from deck_sections() for a section
+                breakdown slide after the summary
+        
+        Returns:
+            The .pptx file content
+        """
+        parts, slide_name, _, _ = self._prototype(bool(subtitle))
+        slides = self.render_slides(title, summary, subtitle, sections)
+        
+        package = dict(parts)
+        package[slide_name] = slides[0]
+        if len(slides) > 1:
+            slide_rels = package.get(relationships_part(slide_name))
+            package.update(
+                insert_slides(package.__getitem__, package, [(slide, slide_rels) for slide in slides[1:]])
+            )
+        
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as output:
+            for name, data in package.items():
+                output.writestr(name, data)
+        return buffer.getvalue()
+    
+    def render_slides(
+        self,
+        title: str,
+        summary: str,
+        subtitle: Optional[str] = None,
+        sections: Optional[Sequence[str]] = None
+    ) -> List[bytes]:
+        """
+        Render the summary slides as slide part XML, without a package.
+        
+        Takes the same arguments as render().
+        
+        Returns:
+            The XML of each slide in order; the slides refer to no parts
+            other than their slide layout
+        """
+        _, _, segments, (width, height) = self._prototype(bool(subtitle))
+        pages = fit_text(summary, summary_text_width(width), summary_text_height(bool(subtitle), height))
+        slides = [
+            _render_slide(segments, title + (CONTINUED_SUFFIX if index else ""), subtitle, page)
+            for index, page in enumerate(pages)
+        ]
+        
+        if sections:
+            breakdown_segments = self._prototype(True)[2]
+            breakdown_pages = fit_text(
+                "\n".join(sections), summary_text_width(width), summary_text_height(True, height)
+            )
+            slides.extend(
+                _render_slide(
+                    breakdown_segments,
+                    title,
+                    BREAKDOWN_SUBTITLE + (CONTINUED_SUFFIX if index else ""),
+                    page
+                )
+                for index, page in enumerate(breakdown_pages)
+            )
+        return slides
+    
+    def _prototype(self, with_subtitle: bool) -> Tuple[List[Tuple[str, bytes]], str, list, Tuple[float, float]]:
+        """Build the prototype for a slide variant on first use."""
+        with self._lock:
+            if with_subtitle not in self._prototypes:
+                self._prototypes[with_subtitle] = self._build_prototype(with_subtitle)
+            return self._prototypes[with_subtitle]
+    
+    def _build_prototype(self, with_subtitle: bool) -> Tuple[List[Tuple[str, bytes]], str, list, Tuple[float, float]]:
+        """
+        Build a marked-up summary slide and split its XML around the markers.
+        
+        Returns:
+            Tuple of (package parts in order, slide part name, segments,
+            slide width and height in inches), where segments are literal
+            XML strings and (field, paragraph prefix, paragraph suffix)
+            tuples for the text to fill in
+        """
+        generator = SlideGenerator(self.template_path, self.slide_size)
+        generator.add_summary_slide(
+            TITLE_MARKER, SUMMARY_MARKER, SUBTITLE_MARKER if with_subtitle else None
+        )
+        buffer = io.BytesIO()
+        generator.presentation.save(buffer)
+        
+        with zipfile.ZipFile(buffer) as package:
+            parts = [(info.filename, package.read(info)) for info in package.infolist()]
+        
+        slide_name, slide_xml = next(
+            (name, data.decode("utf-8")) for name, data in parts
+            if name.startswith("ppt/slides/slide") and name.endswith(".xml")
+        )
+        
+        markers = {"title": TITLE_MARKER, "summary": SUMMARY_MARKER}
+        if with_subtitle:
+            markers["subtitle"] = SUBTITLE_MARKER
+        
+        # Each marker sits in one formatted paragraph, which is repeated per line of text
+        fields = []
+        for field, marker in markers.items():
+            match = re.search(
+                f"<a:p>((?:(?!</a:p>).)*?){re.escape(marker)}((?:(?!</a:p>).)*?)</a:p>",
+                slide_xml,
+                re.DOTALL,
+            )
+            if match is None:
+                raise ValueError(f"Could not find the {field} paragraph in the slide prototype")
+            fields.append((match.start(), match.end(), field, "<a:p>" + match.group(1), match.group(2) + "</a:p>"))
+        
+        segments = []
+        position = 0
+        for start, end, field, prefix, suffix in sorted(fields):
+            segments.append(slide_xml[position:start])
+            segments.append((field, prefix, suffix))
+            position = end
+        segments.append(slide_xml[position:])
+        
+        return parts, slide_name, segments, generator.slide_size
+
+
+def summary_text_width(slide_width: float = SLIDE_WIDTH) -> float:
+    """Width in inches available to summary text, inside the box insets."""
+    return slide_width - 2 * SUMMARY_LEFT - 0.2
+
+
+def summary_text_height(with_subtitle: bool, slide_height: float = SLIDE_HEIGHT) -> float:
+    """Height in inches available to summary text, inside the box insets."""
+    return slide_height - SUMMARY_TOP[with_subtitle] - BOTTOM_MARGIN - 0.1
+
+
+def _render_slide(segments: list, title: str, subtitle: Optional[str], page: Page) -> bytes:
+    """Fill a prototype slide's segments with text laid out on one page."""
+    texts = {"title": title, "subtitle": subtitle, "summary": "\n".join(page.paragraphs)}
+    size = f'sz="{page.font_size * 100}"'
+    
+    xml = []
+    for segment in segments:
+        if isinstance(segment, str):
+            xml.append(segment)
+            continue
+        field, prefix, suffix = segment
+        if field == "summary":
+            prefix = prefix.replace(f'sz="{SUMMARY_FONT_SIZE * 100}"', size, 1)
+        xml.append(_fill_paragraphs(texts[field], prefix, suffix))
+    return "".join(xml).encode("utf-8")
+
+
+def _fill_paragraphs(text: str, prefix: str, suffix: str) -> str:
+    """Render text as one formatted paragraph per line."""
+    lines = INVALID_XML_CHARS_RE.sub("", text).split("\n")
+    return "".join(prefix + escape(line.rstrip("\r")) + suffix for line in lines)
+
+
+@lru_cache(maxsize=8)
+def get_renderer(template_path: Optional[str] = None, slide_size: Optional[Tuple[int, int]] = None) -> SlideRenderer:
+    """Get the process-wide renderer for a template and slide size, creating it once."""
+    return SlideRenderer(template_path, slide_size)
+
+
+def write_presentation(data: bytes, output_path: Union[str, BinaryIO]) -> None:
+    """
+    Write rendered presentation content to a .pptx file or stream.
+    
+    Args:
+        data: The .pptx file content
+        output_path: Path where the presentation will be saved, or a
+            writable binary stream
+    
+    Raises:
+        ValueError: If output path is invalid
+    """
+    if hasattr(output_path, "write"):
+        output_path.write(data)
+        return
+    
+    output_path = Path(output_path)
+    
+    if output_path.suffix.lower() != ".pptx":
+        raise ValueError(f"Output file must have .pptx extension, got: {output_path.suffix}")
+    
+    # Create parent directories if needed
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    try:
+        output_path.write_bytes(data)
+    except Exception as e:
+        raise Exception(f"Failed to save presentation: {str(e)}")
+
+
 def create_summary_presentation(
     title: str,
     summary: str,
-    output_path: str,
-    subtitle: Optional[str] = None
+    output_path: Union[str, BinaryIO],
+    subtitle: Optional[str] = None,
+    template_path: Optional[str] = None,
+    sections: Optional[Sequence[str]] = None
 ) -> None:
     """
     Create a new presentation with an executive summary slide.
     
+    The template is loaded once per process and reused for every call.
+    A summary too long for one slide is shrunk to fit or continued on
+    further slides.
+    
+    Args:
+        title: The slide title
+        summary: The summary content
+        output_path: Where to save the new presentation; a path or a
+            writable binary stream such as io.BytesIO
+        subtitle: Optional subtitle
+        template_path: Optional .pptx to use as the base template
+        sections: Optional lines from layout.deck_sections() for a section
+            breakdown slide after the summary
+    """
+    data = get_renderer(template_path).render(title, summary, subtitle, sections)
+    write_presentation(data, output_path)
+
+
+def insert_summary_presentation(
+    source_path: str,
+    title: str,
+    summary: str,
+    output_path: Union[str, BinaryIO],
+    subtitle: Optional[str] = None,
+    sections: Optional[Sequence[str]] = None
+) -> None:
+    """
+    Save a copy of a presentation with the summary slides at the front.
+    
+    The deck is not loaded into python-pptx. Only the content types, the
+    presentation part and its relationships are rewritten; every other
+    entry, including embedded media, is copied through still compressed,
+    so large decks cost little more than a file copy. The summary slides
+    use the deck's blank layout and theme, and are laid out and fitted
+    for the deck's slide width and height.
+    
     Args:
+        source_path: The original .pptx presentation
         title: The slide title
         summary: The summary content
-        output_path: Where to save the new presentation
+        output_path: Where to save the presentation; a path, which may be
+            source_path itself, or a writable seekable binary stream
         subtitle: Optional subtitle
+        sections: Optional lines from layout.deck_sections() for a section
+            breakdown slide after the summary
+    
+    Raises:
+        ValueError: If a path does not have the .pptx extension or the
+            source is not a valid presentation
     """
-    generator = SlideGenerator()
-    generator.add_summary_slide(title, summary, subtitle)
-    generator.save(output_path)
+    source_path = Path(source_path)
+    if source_path.suffix.lower() != ".pptx":
+        raise ValueError(f"File must be a .pptx file, got: {source_path.suffix}")
+    
+    if not hasattr(output_path, "write"):
+        output_path = Path(output_path)
+        if output_path.suffix.lower() != ".pptx":
+            raise ValueError(f"Output file must have .pptx extension, got: {output_path.suffix}")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    try:
+        with zipfile.ZipFile(source_path) as source:
+            names = source.namelist()
+            
+            renderer = get_renderer(None, slide_size(source.read(PRESENTATION_PART)))
+            slides = renderer.render_slides(title, summary, subtitle, sections)
+            
+            slide_rels = slide_relationships(blank_layout(source.read, names))
+            parts = insert_slides(source.read, names, [(slide, slide_rels) for slide in slides], position=0)
+            
+            if hasattr(output_path, "write"):
+                write_package(source, parts, output_path)
+                return
+            
+            # Write beside the target and swap it in, so the source may be overwritten
+            partial = output_path.with_name(f".{output_path.name}.partial")
+            try:
+                write_package(source, parts, str(partial))
+            except Exception:
+                partial.unlink(missing_ok=True)
+                raise
+    except (zipfile.BadZipFile, KeyError) as e:
+        raise ValueError(f"Not a valid PowerPoint presentation: {source_path} ({e})")
+    
+    partial.replace(output_path)
@@ -1,20 +1,408 @@
 """Module for summarizing presentation content using AI."""
 
+import hashlib
+import json
 import os
-from typing import Optional
+import re
+import weakref
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import openai
 from dotenv import load_dotenv
+from response_cache import ResponseCache
+from token_budget import (
+    context_limit,
+    count_message_tokens,
+    count_tokens,
+    words_to_tokens,
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Count the tokens in a piece of text with the default tokenizer."""
+    return count_tokens(text)
+
+
+# Closing instructions for a combined title and summary response
+TITLE_AND_SUMMARY_FORMAT = """Also write a concise and impactful slide title (5-10 words) that is
+professional and captures the essence of the presentation.
+Respond only with valid JSON in this exact format:
+{"title": "<slide title>", "summary": "<executive summary>"}"""
+
+# Extra completion tokens for the title and JSON framing
+TITLE_AND_SUMMARY_OVERHEAD_TOKENS = 60
+
+
+def parse_title_and_summary(reply: str) -> Optional[Tuple[str, str]]:
+    """
+    Parse a combined title and summary response.
+    
+    Args:
+        reply: Model reply expected to contain a JSON object
+    
+    Returns:
+        Tuple of (summary, title), or None if the reply is not usable
+    """
+    json_match = re.search(r'\{.*\}', reply, re.DOTALL)
+    if not json_match:
+        return None
+    
+    try:
+        data = json.loads(json_match.group(), strict=False)
+    except json.JSONDecodeError:
+        return None
+    
+    if not isinstance(data, dict):
+        return None
+    
+    summary = data.get("summary")
+    title = data.get("title")
+    if not isinstance(summary, str) or not isinstance(title, str):
+        return None
+    if not summary.strip() or not title.strip():
+        return None
+    
+    return summary.strip(), title.strip()
+
+
+# Slide labels written by SlideRecord.text_lines(). Inserting or removing a
+# slide renumbers every later one, so grouping and section requests ignore them.
+SLIDE_LABEL_RE = re.compile(r"^Slide \d+: ", re.MULTILINE)
+
+
+def strip_slide_numbers(text: str) -> str:
+    """Replace "Slide N: " labels with a plain "Slide: " marker."""
+    return SLIDE_LABEL_RE.sub("Slide: ", text)
+
+
+def chunk_fingerprint(chunk: str) -> str:
+    """
+    Content fingerprint of one text chunk.
+    
+    Insensitive to surrounding whitespace and to slide numbers, so a slide
+    keeps its fingerprint when slides before it are added or removed.
+    """
+    return hashlib.sha256(strip_slide_numbers(chunk).strip().encode("utf-8")).hexdigest()
+
+
+def is_content_boundary(chunk: str, chunk_size: int, target_tokens: int) -> bool:
+    """
+    Decide from a chunk's own content whether a group may end after it.
+    
+    The chance is proportional to the chunk's size, so groups average
+    about target_tokens, and because it depends on nothing but the chunk,
+    the same slides always produce the same cut points.
+    """
+    position = int(chunk_fingerprint(chunk)[:16], 16) / float(1 << 64)
+    return position < chunk_size / max(1, target_tokens)
+
+
+def group_chunks(chunks: Iterable[str], chunk_tokens: int, content_defined: bool = False) -> List[str]:
+    """
+    Pack consecutive text chunks into groups that fit a token budget.
+    
+    Chunks are never split, so groups always end on a slide boundary. A
+    single chunk larger than the budget becomes a group of its own.
+    
+    With content_defined, chunks that do not fit in one group are also cut
+    at content-defined boundaries (see is_content_boundary()), so groups
+    average half the budget. Boundaries ignore slide numbers, so editing,
+    inserting or removing a slide changes only the groups around it
+    instead of shifting every later group, and the partial summaries of
+    the other groups stay cached.
+    
+    Args:
+        chunks: Text chunks in order, e.g. one per slide
+        chunk_tokens: Token budget for each group
+        content_defined: Whether to cut at content-defined boundaries
+    
+    Returns:
+        List of grouped texts in the original order
+    """
+    sized = [(chunk, estimate_tokens(chunk)) for chunk in chunks]
+    if content_defined and sum(size for _, size in sized) <= chunk_tokens:
+        content_defined = False
+    
+    target_tokens = chunk_tokens // 2
+    groups = []
+    pending = []
+    pending_tokens = 0
+    
+    for chunk, chunk_size in sized:
+        if pending and pending_tokens + chunk_size > chunk_tokens:
+            groups.append("\n".join(pending))
+            pending = []
+            pending_tokens = 0
+        pending.append(chunk)
+        pending_tokens += chunk_size
+        
+        if (
+            content_defined
+            and pending_tokens >= chunk_tokens // 4
+            and is_content_boundary(chunk, chunk_size, target_tokens)
+        ):
+            groups.append("\n".join(pending))
+            pending = []
+            pending_tokens = 0
+    
+    if pending:
+        groups.append("\n".join(pending))
+    
+    return groups
+
+
+SUMMARY_SYSTEM_PROMPT = "You are an expert at creating executive summaries for presentations."
+TITLE_SYSTEM_PROMPT = "You are an expert at creating compelling slide titles."
+FALLBACK_TITLE = "Executive Summary"
+
+
+def build_summary_prompt(content: str, max_length: int, with_title: bool = False) -> str:
+    """Build the executive summary prompt for the full presentation content."""
+    return f"""You are an executive summary expert. 
+Read the following presentation content and create a concise executive summary.
+The summary should:
+- Be approximately {max_length} words or less
+- Highlight the key points and main takeaways
+- Be suitable for a single slide presentation
+- Use clear, professional language
+- Be structured with bullet points where appropriate
+
+Presentation Content:
+{content}
+
+{TITLE_AND_SUMMARY_FORMAT if with_title else "Executive Summary:"}"""
+
+
+def build_section_prompt(content: str, max_length: int) -> str:
+    """Build the prompt that summarizes one group of slides."""
+    return f"""You are summarizing one section of a larger presentation.
+Summarize the following slides in approximately {max_length} words or less.
+Keep every key point, figure and decision; they will be merged with the
+summaries of the other sections later.
+
+Section Content:
+{content}
+
+Section Summary:"""
+
+
+def build_reduce_prompt(partials: List[str], max_length: int, with_title: bool = False) -> str:
+    """Build the prompt that combines section summaries into the final summary."""
+    sections = "\n\n".join(
+        f"Section {index}:\n{partial}" for index, partial in enumerate(partials, 1)
+    )
+    return f"""You are an executive summary expert.
+The following are summaries of consecutive sections of one presentation.
+Combine them into a single concise executive summary.
+The summary should:
+- Be approximately {max_length} words or less
+- Highlight the key points and main takeaways
+- Be suitable for a single slide presentation
+- Use clear, professional language
+- Be structured with bullet points where appropriate
+
+Section Summaries:
+{sections}
+
+{TITLE_AND_SUMMARY_FORMAT if with_title else "Executive Summary:"}"""
+
+
+def build_title_prompt(summary: str) -> str:
+    """Build the prompt that turns a summary into a slide title."""
+    return f"""Based on the following executive summary, generate a concise and impactful slide title (5-10 words).
+The title should be professional and capture the essence of the presentation.
+
+Summary:
+{summary}
+
+Title:"""
+
+
+def summary_error(error: Exception) -> Exception:
+    """Translate an API error from a final summary request into a user-facing error."""
+    if isinstance(error, openai.error.AuthenticationError):
+        return Exception("Authentication failed. Please check your OpenAI API key.")
+    if isinstance(error, openai.error.RateLimitError):
+        return Exception("Rate limit exceeded. Please wait before trying again.")
+    return Exception(f"Failed to generate summary: {str(error)}")
+
+
+def plan_groups(chunks: Iterable[str], chunk_tokens: int, max_workers: int) -> List[str]:
+    """
+    Validate map-reduce settings and pack the chunks into groups.
+    
+    Raises:
+        ValueError: If the settings are invalid or the content is empty
+    """
+    if chunk_tokens < 1 or max_workers < 1:
+        raise ValueError("chunk_tokens and max_workers must be positive")
+    
+    groups = group_chunks(chunks, chunk_tokens, content_defined=True)
+    if not groups or (len(groups) == 1 and not groups[0].strip()):
+        raise ValueError("Content cannot be empty")
+    
+    return groups
+
+
+def section_length_for(max_length: int) -> int:
+    """Word budget for each partial summary in the map step."""
+    return max(100, max_length // 2)
+
+
+def build_messages(system_prompt: str, prompt: str) -> List[Dict[str, str]]:
+    """Build the chat messages for one request."""
+    return [
+        {
+            "role": "system",
+            "content": system_prompt
+        },
+        {
+            "role": "user",
+            "content": prompt
+        }
+    ]
+
+
+def input_token_limit(model: str, max_length: int) -> int:
+    """
+    Largest group of slide text that fits the final prompt of a model.
+    
+    The model's context window, minus the completion, the prompt template
+    and the chat framing, bounds chunk_tokens so no final or section
+    request can overflow the context.
+    
+    Raises:
+        ValueError: If max_length alone exhausts the model's context
+    """
+    templates = [
+        build_summary_prompt("", max_length, with_title=True),
+        build_reduce_prompt([""], max_length, with_title=True),
+    ]
+    template_tokens = max(
+        count_message_tokens(build_messages(SUMMARY_SYSTEM_PROMPT, template), model)
+        for template in templates
+    )
+    limit = (
+        context_limit(model)
+        - template_tokens
+        - words_to_tokens(max_length)
+        - TITLE_AND_SUMMARY_OVERHEAD_TOKENS
+    )
+    
+    if limit < 1:
+        raise ValueError(f"max_length {max_length} leaves no room for content in the context of {model}")
+    
+    return limit
+
+
+class MapReducePlan:
+    """
+    Map-reduce progress of one summary, shared by the sync and async summarizers.
+    
+    The chunks are packed into groups when the plan is made. While groups
+    is not empty, the caller summarizes each of them with
+    build_section_prompt() and passes the partial summaries, in order, to
+    add_partials(), which regroups them for another round if they are
+    still too large. Content that fits in one group needs no round at all.
+    
+    Example:
+        plan = MapReducePlan(chunks, max_length, model, chunk_tokens, max_workers)
+        while plan.groups:
+            plan.add_partials([summarize(group, plan.section_length) for group in plan.groups])
+        prompt = plan.final_prompt()
+    """
+    
+    def __init__(
+        self,
+        chunks: Iterable[str],
+        max_length: int,
+        model: str,
+        chunk_tokens: int,
+        max_workers: int,
+        with_title: bool = False
+    ):
+        """
+        Plan the first map step.
+        
+        Args:
+            chunks: Text chunks in order
+            max_length: Maximum length of the final summary in words
+            model: The OpenAI model used for every request
+            chunk_tokens: Approximate token budget for each group
+            max_workers: Maximum number of groups summarized at once
+            with_title: Whether the final prompt also asks for a slide title
+        
+        Raises:
+            ValueError: If content is empty or the settings are invalid
+        """
+        self.max_length = max_length
+        self.with_title = with_title
+        self.chunk_tokens = min(chunk_tokens, input_token_limit(model, max_length))
+        self.section_length = section_length_for(max_length)
+        self.groups = plan_groups(chunks, self.chunk_tokens, max_workers)
+        self.partials = None
+        
+        # Content that fits in one group is summarized directly
+        self._content = self.groups[0] if len(self.groups) == 1 else None
+        if self._content is not None:
+            self.groups = []
+    
+    def add_partials(self, partials: Iterable[str]) -> None:
+        """
+        Record the summaries of the current groups.
+        
+        Partials that still exceed the group budget are regrouped for
+        another round, as long as regrouping shrinks the number of calls.
+        """
+        self.partials = list(partials)
+        self.groups = []
+        
+        if sum(estimate_tokens(partial) for partial in self.partials) <= self.chunk_tokens:
+            return
+        
+        regrouped = group_chunks(self.partials, self.chunk_tokens, content_defined=True)
+        if len(regrouped) < len(self.partials):
+            self.groups = regrouped
+    
+    def final_prompt(self) -> str:
+        """
+        Build the prompt for the final request.
+        
+        Raises:
+            ValueError: If groups are still waiting to be summarized
+        """
+        if self.groups:
+            raise ValueError("Every group must be summarized before the final prompt")
+        
+        if self._content is not None:
+            return build_summary_prompt(self._content, self.max_length, with_title=self.with_title)
+        return build_reduce_prompt(self.partials, self.max_length, with_title=self.with_title)
 
 
 class PresentationSummarizer:
-    """Handles AI-powered summarization of presentation content."""
+    """
+    Handles AI-powered summarization of presentation content.
+    
+    A thin synchronous wrapper over AsyncPresentationSummarizer. Requests
+    run on a process-wide event loop thread, so every caller shares one
+    pooled HTTP session and max_concurrency bounds the requests in flight
+    across all of them; calling threads only wait for their results.
+    """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        max_concurrency: int = 8
+    ):
         """
         Initialize the summarizer.
         
         Args:
             api_key: OpenAI API key. If not provided, loads from environment.
+            cache: Optional response cache. Requests whose model, prompts and
+                generation settings match an earlier request are answered
+                from the cache without calling the API.
+            max_concurrency: Maximum number of API requests in flight
         """
         load_dotenv()
         
@@ -26,11 +414,23 @@ class PresentationSummarizer:
                 "Please provide it as an argument or set OPENAI_API_KEY environment variable."
             )
         
+        from async_summarizer import AsyncPresentationSummarizer, get_event_loop_thread
+        
         openai.api_key = self.api_key
+        self.cache = cache
+        self.client = AsyncPresentationSummarizer(api_key=self.api_key, cache=cache, max_concurrency=max_concurrency)
+        self._loop = get_event_loop_thread()
+        
+        # Close the session when the summarizer is discarded or the process exits
+        self._finalizer = weakref.finalize(self, self._loop.close_client, self.client)
+    
+    def close(self) -> None:
+        """Close the shared HTTP session and its pooled connections."""
+        self._finalizer()
     
     def generate_summary(
         self,
-        content: str,
+        content: Union[str, Iterable[str]],
         max_length: int = 500,
         model: str = "gpt-3.5-turbo"
     ) -> str:
@@ -38,7 +438,8 @@ class PresentationSummarizer:
         Generate a concise summary of the presentation content.
         
         Args:
-            content: The text content to summarize
+            content: The text content to summarize, or an iterable of text
+                chunks such as PresentationReader.iter_text_chunks()
             max_length: Maximum length of the summary in words
             model: The OpenAI model to use
         
@@ -49,48 +450,7 @@ class PresentationSummarizer:
             ValueError: If content is empty
             Exception: If API call fails
         """
-        if not content or not content.strip():
-            raise ValueError("Content cannot be empty")
-        
-        prompt = f"""You are an executive summary expert. 
-Read the following presentation content and create a concise executive summary.
-The summary should:
-- Be approximately {max_length} words or less
-- Highlight the key points and main takeaways
-- Be suitable for a single slide presentation
-- Use clear, professional language
-- Be structured with bullet points where appropriate
-
-Presentation Content:
-{content}
-
-Executive Summary:"""
-        
-        try:
-            response = openai.ChatCompletion.create(
-                model=model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert at creating executive summaries for presentations."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=int(max_length / 0.75),  # Approximate conversion
-            )
-            
-            return response.choices[0].message.content.strip()
-        
-        except openai.error.AuthenticationError:
-            raise Exception("Authentication failed. Please check your OpenAI API key.")
-        except openai.error.RateLimitError:
-            raise Exception("Rate limit exceeded. Please wait before trying again.")
-        except Exception as e:
-            raise Exception(f"Failed to generate summary: {str(e)}")
+        return self._loop.run(self.client.generate_summary(content, max_length=max_length, model=model))
     
     def generate_slide_title(
         self,
@@ -107,32 +467,176 @@ Executive Summary:"""
         Returns:
             A suitable slide title
         """
-        prompt = f"""Based on the following executive summary, generate a concise and impactful slide title (5-10 words).
-The title should be professional and capture the essence of the presentation.
-
-Summary:
-{content}
-
-Title:"""
+        return self._loop.run(self.client.generate_slide_title(content, model=model))
+    
+    def generate_chunked_summary(
+        self,
+        chunks: Iterable[str],
+        max_length: int = 500,
+        model: str = "gpt-3.5-turbo",
+        chunk_tokens: int = 3000,
+        max_workers: int = 4,
+        sections: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Summarize content that may exceed the model context using map-reduce.
         
-        try:
-            response = openai.ChatCompletion.create(
-                model=model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert at creating compelling slide titles."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=30,
-            )
-            
-            return response.choices[0].message.content.strip()
+        The chunks are packed into token-budgeted groups on slide
+        boundaries, each group is summarized concurrently, and a reduce pass
+        combines the partial summaries. If the partial summaries are still
+        too large they are reduced hierarchically. Content that fits in a
+        single group is summarized with one call, exactly like
+        generate_summary().
+        
+        Groups are cut at content-defined boundaries, so with a response
+        cache a re-uploaded deck with a few edited slides only re-summarizes
+        the groups containing those slides plus the reduce pass.
+        
+        Args:
+            chunks: Text chunks in order, e.g. PresentationReader.iter_text_chunks()
+            max_length: Maximum length of the final summary in words
+            model: The OpenAI model to use
+            chunk_tokens: Approximate token budget for each group
+            max_workers: Maximum number of groups summarized at once
+            sections: Optional section summaries by chunk_fingerprint() of
+                their group, e.g. from a near-identical deck summarized with
+                the same model and length. Groups found here are not sent
+                to the API, and every new section summary is added.
+        
+        Returns:
+            The generated summary
+        
+        Raises:
+            ValueError: If content is empty or the settings are invalid
+            Exception: If an API call fails
+        """
+        return self._loop.run(self.client.generate_chunked_summary(
+            chunks,
+            max_length=max_length,
+            model=model,
+            chunk_tokens=chunk_tokens,
+            max_workers=max_workers,
+            sections=sections
+        ))
+    
+    def generate_summary_with_title(
+        self,
+        chunks: Union[str, Iterable[str]],
+        max_length: int = 500,
+        model: str = "gpt-3.5-turbo",
+        chunk_tokens: int = 3000,
+        max_workers: int = 4,
+        sections: Optional[Dict[str, str]] = None
+    ) -> Tuple[str, str]:
+        """
+        Generate the summary and the slide title in one final API call.
+        
+        Works like generate_chunked_summary(), but the final request asks
+        for a structured response holding both the summary and the title,
+        saving the separate generate_slide_title() round trip. If the reply
+        cannot be parsed, the whole reply is used as the summary and the
+        title is generated separately.
+        
+        Args:
+            chunks: Text content, or text chunks in order
+            max_length: Maximum length of the summary in words
+            model: The OpenAI model to use
+            chunk_tokens: Approximate token budget for each group
+            max_workers: Maximum number of groups summarized at once
+            sections: Optional section summaries to reuse and extend, see
+                generate_chunked_summary()
+        
+        Returns:
+            Tuple of (summary, title)
+        
+        Raises:
+            ValueError: If content is empty or the settings are invalid
+            Exception: If an API call fails
+        """
+        return self._loop.run(self.client.generate_summary_with_title(
+            chunks,
+            max_length=max_length,
+            model=model,
+            chunk_tokens=chunk_tokens,
+            max_workers=max_workers,
+            sections=sections
+        ))
+    
+    def generate_summary_stream(
+        self,
+        chunks: Union[str, Iterable[str]],
+        max_length: int = 500,
+        model: str = "gpt-3.5-turbo",
+        chunk_tokens: int = 3000,
+        max_workers: int = 4,
+        sections: Optional[Dict[str, str]] = None
+    ) -> Iterator[str]:
+        """
+        Generate a summary and yield it piece by piece as the model writes it.
+        
+        Large content is condensed first, exactly like
+        generate_chunked_summary(); only the final request is streamed.
+        Joining the yielded pieces gives the complete summary. A cached
+        summary is yielded as a single piece.
+        
+        Args:
+            chunks: Text content, or text chunks in order
+            max_length: Maximum length of the summary in words
+            model: The OpenAI model to use
+            chunk_tokens: Approximate token budget for each group
+            max_workers: Maximum number of groups summarized at once
+            sections: Optional section summaries to reuse and extend, see
+                generate_chunked_summary()
+        
+        Yields:
+            Consecutive pieces of the summary text
+        
+        Raises:
+            ValueError: If content is empty or the settings are invalid
+            Exception: If an API call fails
+        """
+        yield from self._loop.iterate(self.client.generate_summary_stream(
+            chunks,
+            max_length=max_length,
+            model=model,
+            chunk_tokens=chunk_tokens,
+            max_workers=max_workers,
+            sections=sections
+        ))
+    
+    def summarize_many(
+        self,
+        contents: List[Union[str, Iterable[str]]],
+        max_length: int = 500,
+        model: str = "gpt-3.5-turbo",
+        chunk_tokens: int = 3000,
+        max_concurrency: int = 8
+    ) -> List[Union[Tuple[str, str], Exception]]:
+        """
+        Summarize several documents concurrently without a thread per document.
+        
+        Thin synchronous wrapper around AsyncPresentationSummarizer, which
+        shares one pooled HTTP session and bounds the requests in flight.
+        
+        Args:
+            contents: Text, or text chunks, for each document
+            max_length: Maximum length of each summary in words
+            model: The OpenAI model to use
+            chunk_tokens: Approximate token budget for each slide group
+            max_concurrency: Maximum number of API requests in flight
+        
+        Returns:
+            One (summary, title) tuple per document, in order, or the
+            exception raised for a document that failed
+        """
+        from async_summarizer import summarize_many
         
-        except Exception as e:
-            return "Executive Summary"  # Fallback title
+        return summarize_many(
+            contents,
+            max_length=max_length,
+            model=model,
+            chunk_tokens=chunk_tokens,
+            api_key=self.api_key,
+            cache=self.cache,
+            max_concurrency=max_concurrency
+        )
@@ -0,0 +1,222 @@
+"""Module for counting tokens and budgeting prompts against model context limits."""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+try:
+    import tiktoken
+except ImportError:  # Optional: fall back to a character-based estimate
+    tiktoken = None
+
+
+# Rough characters-per-token ratio for English text, used without tiktoken
+CHARS_PER_TOKEN = 4
+
+# Average English words per token, used to turn word limits into max_tokens
+WORDS_PER_TOKEN = 0.75
+
+# Context window sizes in tokens; the longest matching model prefix wins
+MODEL_CONTEXT_TOKENS = {
+    "gpt-3.5-turbo": 4096,
+    "gpt-3.5-turbo-16k": 16385,
+    "gpt-3.5-turbo-1106": 16385,
+    "gpt-3.5-turbo-0125": 16385,
+    "gpt-4": 8192,
+    "gpt-4-32k": 32768,
+    "gpt-4-1106": 128000,
+    "gpt-4-0125": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4o": 128000,
+}
+DEFAULT_CONTEXT_TOKENS = 4096
+
+# Chat framing added by the API around every message and before the reply
+MESSAGE_OVERHEAD_TOKENS = 4
+REPLY_PRIMING_TOKENS = 3
+
+# Smallest completion worth requesting once the prompt is accounted for
+MIN_COMPLETION_TOKENS = 16
+
+
+def context_limit(model: str) -> int:
+    """
+    Get the context window of a model.
+    
+    Args:
+        model: Model name, e.g. "gpt-3.5-turbo" or "gpt-4-0613"
+    
+    Returns:
+        Maximum prompt plus completion tokens for the model
+    """
+    matches = [prefix for prefix in MODEL_CONTEXT_TOKENS if model.startswith(prefix)]
+    if not matches:
+        return DEFAULT_CONTEXT_TOKENS
+    return MODEL_CONTEXT_TOKENS[max(matches, key=len)]
+
+
+@lru_cache(maxsize=None)
+def _encoding_for(model: str) -> Optional[Any]:
+    """Get the tiktoken encoding for a model, or None without tiktoken."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
+    """
+    Count the tokens in a piece of text.
+    
+    Uses the model's tokenizer when tiktoken is installed and a
+    characters-per-token estimate otherwise.
+    
+    Args:
+        text: Text to measure
+        model: Model whose tokenizer applies
+    
+    Returns:
+        Number of tokens
+    """
+    encoding = _encoding_for(model)
+    if encoding is None:
+        return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages: List[Dict[str, str]], model: str = "gpt-3.5-turbo") -> int:
+    """
+    Count the prompt tokens of a chat request, including message framing.
+    
+    Args:
+        messages: Chat messages with role and content
+        model: Model whose tokenizer applies
+    
+    Returns:
+        Number of prompt tokens
+    """
+    total = REPLY_PRIMING_TOKENS
+    for message in messages:
+        total += MESSAGE_OVERHEAD_TOKENS + count_tokens(message["content"], model)
+    return total
+
+
+def words_to_tokens(words: int) -> int:
+    """Convert a word limit into a completion token limit."""
+    return int(words / WORDS_PER_TOKEN)
+
+
+def completion_budget(messages: List[Dict[str, str]], model: str, max_tokens: int) -> int:
+    """
+    Fit the completion limit of a request into the model's context window.
+    
+    Args:
+        messages: Chat messages of the request
+        model: Model the request is sent to
+        max_tokens: Desired completion limit
+    
+    Returns:
+        max_tokens, reduced if the prompt leaves less room than that
+    
+    Raises:
+        ValueError: If the prompt leaves no useful room for a completion
+    """
+    prompt_tokens = count_message_tokens(messages, model)
+    available = context_limit(model) - prompt_tokens
+    
+    if available < min(max_tokens, MIN_COMPLETION_TOKENS):
+        raise ValueError(
+            f"Prompt is {prompt_tokens} tokens, too large for the "
+            f"{context_limit(model)}-token context of {model}"
+        )
+    
+    return min(max_tokens, available)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = "gpt-3.5-turbo", marker: str = "...") -> str:
+    """
+    Shorten text to at most max_tokens tokens.
+    
+    Args:
+        text: Text to shorten
+        max_tokens: Token limit, including the marker
+        model: Model whose tokenizer applies
+        marker: Appended when the text was cut
+    
+    Returns:
+        The text unchanged if it fits, otherwise as much of its beginning
+        as fits before the marker; the marker alone if only it fits, and ""
+        if the limit is smaller than the marker
+    """
+    if count_tokens(text, model) <= max_tokens:
+        return text
+    
+    marker_tokens = count_tokens(marker, model)
+    if marker_tokens > max_tokens:
+        return ""
+    
+    keep = max_tokens - marker_tokens
+    encoding = _encoding_for(model)
+    if encoding is None:
+        return text[:keep * CHARS_PER_TOKEN] + marker
+    
+    # Tokens can merge across the join with the marker, so trim until it fits
+    tokens = encoding.encode(text, disallowed_special=())[:keep]
+    while tokens and count_tokens(encoding.decode(tokens) + marker, model) > max_tokens:
+        tokens = tokens[:-1]
+    return encoding.decode(tokens) + marker
+
+
+def fair_shares(sizes: Dict[str, int], budget: int) -> Dict[str, int]:
+    """
+    Split a token budget between sources using max-min fairness.
+    
+    Sources smaller than an equal share keep everything they need, and
+    what they leave unused is split evenly among the larger sources.
+    
+    Args:
+        sizes: Tokens each source needs
+        budget: Total tokens available
+    
+    Returns:
+        Tokens granted to each source; the grants never exceed the budget
+    """
+    shares = {}
+    remaining = max(0, budget)
+    pending = sorted(sizes, key=lambda name: sizes[name])
+    
+    while pending:
+        equal_share = remaining // len(pending)
+        name = pending[0]
+        if sizes[name] > equal_share:
+            break
+        shares[name] = sizes[name]
+        remaining -= sizes[name]
+        pending.pop(0)
+    
+    # Every remaining source needs more than an equal share
+    for index, name in enumerate(pending):
+        shares[name] = remaining // len(pending) + (1 if index < remaining % len(pending) else 0)
+    
+    return shares
+
+
+def fit_sources(sources: Dict[str, str], budget: int, model: str = "gpt-3.5-turbo") -> Dict[str, str]:
+    """
+    Truncate several texts so that together they fit a token budget.
+    
+    Args:
+        sources: Text of each source, e.g. keyed by file name
+        budget: Total tokens available for all sources
+        model: Model whose tokenizer applies
+    
+    Returns:
+        The sources in their original order, each cut to its fair share
+    """
+    sizes = {name: count_tokens(text, model) for name, text in sources.items()}
+    shares = fair_shares(sizes, budget)
+    return {
+        name: truncate_to_tokens(text, shares[name], model)
+        for name, text in sources.items()
+    }
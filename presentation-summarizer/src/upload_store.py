@@ -0,0 +1,109 @@
+"""Module for keeping uploaded presentations and their extracted content on the server."""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class UploadStore:
+    """
+    Server-side record of each upload, keyed by an opaque upload ID.
+    
+    The upload step stores the extracted slide records here, so later
+    summarize and download requests work from them instead of re-parsing
+    the deck, and clients never see server file paths. Records that have
+    not been used for ttl seconds, or that exceed max_entries, are dropped
+    least recently used first.
+    """
+    
+    def __init__(self, ttl: float = 3600, max_entries: int = 256):
+        """
+        Initialize the store.
+        
+        Args:
+            ttl: Seconds an upload is kept after it was last used
+            max_entries: Maximum number of uploads kept
+        
+        Raises:
+            ValueError: If ttl or max_entries is not positive
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._uploads = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def create(self, **fields: Any) -> str:
+        """
+        Store a new upload.
+        
+        Args:
+            **fields: Initial fields, such as file_path, file_name and digest
+        
+        Returns:
+            The new upload ID
+        """
+        upload_id = secrets.token_urlsafe(16)
+        
+        with self._lock:
+            self._purge(time.time())
+            self._uploads[upload_id] = (dict(fields, upload_id=upload_id), time.time())
+            while len(self._uploads) > self.max_entries:
+                self._uploads.popitem(last=False)
+        
+        return upload_id
+    
+    def update(self, upload_id: str, **fields: Any) -> bool:
+        """
+        Update fields of an upload.
+        
+        Returns:
+            True if the upload exists, False otherwise
+        """
+        with self._lock:
+            entry = self._uploads.get(upload_id)
+            if entry is None:
+                return False
+            
+            record, _ = entry
+            record.update(fields)
+            self._uploads[upload_id] = (record, time.time())
+            self._uploads.move_to_end(upload_id)
+            return True
+    
+    def get(self, upload_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a copy of an upload, marking it as recently used.
+        
+        Returns:
+            The upload's fields, or None if it does not exist or expired
+        """
+        with self._lock:
+            now = time.time()
+            self._purge(now)
+            
+            entry = self._uploads.get(upload_id)
+            if entry is None:
+                return None
+            
+            record, _ = entry
+            self._uploads[upload_id] = (record, now)
+            self._uploads.move_to_end(upload_id)
+            return dict(record)
+    
+    def __len__(self) -> int:
+        return len(self._uploads)
+    
+    def _purge(self, now: float) -> None:
+        """Drop uploads unused for longer than the TTL (lock held)."""
+        while self._uploads:
+            upload_id, (_, last_used) = next(iter(self._uploads.items()))
+            if now - last_used <= self.ttl:
+                break
+            del self._uploads[upload_id]
@@ -1,5 +1,5 @@
 // Global state
-let currentFilePath = null;
+let currentUploadId = null;
 let currentFileName = null;
 let currentSummary = null;
 let currentTitle = null;
@@ -124,7 +124,7 @@ function handleFileSelect() {
             return;
         }
 
-        currentFilePath = data.file_path;
+        currentUploadId = data.upload_id;
         currentFileName = data.file_name;
 
         // Update file preview
@@ -153,7 +153,7 @@ function handleFileSelect() {
 }
 
 function generateSummary() {
-    if (!currentFilePath) {
+    if (!currentUploadId) {
         showAlert('Error', 'Please upload a file first', 'error');
         return;
     }
@@ -163,46 +163,66 @@ function generateSummary() {
 
     showLoading(true, 'Generating summary with AI...');
     generateBtn.disabled = true;
+    currentSummary = null;
+    currentTitle = null;
+
+    const summaryTitle = document.getElementById('summary-title');
+    const summaryContent = document.getElementById('summary-content');
+    const params = new URLSearchParams({
+        upload_id: currentUploadId,
+        max_length: maxLength,
+        model: model
+    });
+    const source = new EventSource(`/api/summarize/stream?${params}`);
+    let streamed = '';
 
-    fetch('/api/summarize', {
-        method: 'POST',
-        headers: {
-            'Content-Type': 'application/json'
-        },
-        body: JSON.stringify({
-            file_path: currentFilePath,
-            max_length: maxLength,
-            model: model
-        })
-    })
-    .then(response => response.json())
-    .then(data => {
+    const finish = () => {
+        source.close();
         showLoading(false);
         generateBtn.disabled = false;
-
-        if (data.error) {
-            showAlert('Summarization Error', data.error, 'error');
-            return;
+    };
+
+    // Render the summary as soon as the first tokens arrive
+    source.addEventListener('token', (e) => {
+        if (!streamed) {
+            showLoading(false);
+            summaryTitle.textContent = 'Generating title...';
+            stepReview.style.display = 'block';
+            stepConfigure.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
         }
+        streamed += JSON.parse(e.data).text;
+        summaryContent.textContent = streamed;
+    });
+
+    source.addEventListener('done', (e) => {
+        finish();
+        const data = JSON.parse(e.data);
 
         currentSummary = data.summary;
         currentTitle = data.title;
 
-        // Display summary
-        document.getElementById('summary-title').textContent = currentTitle;
-        document.getElementById('summary-content').textContent = currentSummary;
-
-        // Move to review step
+        summaryTitle.textContent = currentTitle;
+        summaryContent.textContent = currentSummary;
         stepReview.style.display = 'block';
-        stepConfigure.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
 
-        showAlert('Summary Generated Successfully', 'Review and download your summary slide', 'success');
-    })
-    .catch(error => {
-        showLoading(false);
-        generateBtn.disabled = false;
-        showAlert('Error', error.message, 'error');
+        let message = 'Review and download your summary slide';
+        if (data.compression && data.compression.ratio < 1) {
+            const saved = Math.round((1 - data.compression.ratio) * 100);
+            message += ` (prompt ${saved}% smaller after removing repeated content)`;
+        }
+        showAlert('Summary Generated Successfully', message, 'success');
     });
+
+    source.addEventListener('failure', (e) => {
+        finish();
+        showAlert('Summarization Error', JSON.parse(e.data).error, 'error');
+    });
+
+    // Connection errors; close instead of letting EventSource restart the summary
+    source.onerror = () => {
+        finish();
+        showAlert('Summarization Error', 'Lost connection while generating the summary', 'error');
+    };
 }
 
 function downloadSummary() {
@@ -221,7 +241,7 @@ function downloadSummary() {
         body: JSON.stringify({
             title: currentTitle,
             summary: currentSummary,
-            file_name: currentFileName
+            upload_id: currentUploadId
         })
     })
     .then(response => {
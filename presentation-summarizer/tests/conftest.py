@@ -0,0 +1,49 @@
+"""Shared fixtures for the presentation summarizer tests."""
+
+import os
+import sys
+import pytest
+from pptx import Presentation
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import token_budget
+
+
+@pytest.fixture(autouse=True)
+def character_token_counts(monkeypatch):
+    """Count tokens with the character estimate, whether or not tiktoken is installed."""
+    monkeypatch.setattr(token_budget, "_encoding_for", lambda model: None)
+
+
+def build_deck(path, slides):
+    """
+    Write a small deck to disk.
+    
+    Args:
+        path: Where to save the .pptx file
+        slides: List of (title, [body lines], notes) tuples
+    """
+    presentation = Presentation()
+    layout = presentation.slide_layouts[1]  # Title and Content
+    
+    for title, body, notes in slides:
+        slide = presentation.slides.add_slide(layout)
+        slide.shapes.title.text = title
+        slide.placeholders[1].text = "\n".join(body)
+        if notes:
+            slide.notes_slide.notes_text_frame.text = notes
+    
+    presentation.save(str(path))
+    return path
+
+
+@pytest.fixture
+def sample_deck(tmp_path):
+    """A three-slide deck with titles, bullets and one set of notes."""
+    return build_deck(tmp_path / "sample.pptx", [
+        ("Quarterly Results", ["Revenue grew 12%", "Margins stable"], "Mention the new region"),
+        ("Roadmap", ["Launch v2 in Q3"], ""),
+        ("Next Steps", ["Hire two engineers"], ""),
+    ])
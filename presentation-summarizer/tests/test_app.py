@@ -0,0 +1,67 @@
+"""Test cases for the web application's summarize and download flow."""
+
+import io
+import time
+from unittest.mock import patch
+import sys
+import os
+
+import pytest
+from pptx import Presentation
+
+# Add the project directory to path; the app reads its settings on import
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault('OPENAI_API_KEY', 'test_key')
+
+import app as web
+
+
+def wait_for_job(client, job_id):
+    """Poll a job until it has finished and return its record."""
+    for _ in range(200):
+        job = client.get(f'/api/jobs/{job_id}').get_json()
+        if job['status'] in ('succeeded', 'failed'):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+@pytest.fixture
+def client():
+    """A test client for the app."""
+    web.app.config['TESTING'] = True
+    return web.app.test_client()
+
+
+def upload(client, deck):
+    """Upload a deck and return its upload ID."""
+    response = client.post(
+        '/api/upload',
+        data={'file': (io.BytesIO(deck.read_bytes()), 'sample.pptx')},
+        content_type='multipart/form-data'
+    )
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return response.get_json()['upload_id']
+
+
+class TestApp:
+    """Tests for the summarize job and download endpoints."""
+    
+    def test_same_deck_uploaded_twice_can_download_both(self, client, sample_deck):
+        """Test that an upload joining another upload's job gets its summary."""
+        first, second = upload(client, sample_deck), upload(client, sample_deck)
+        
+        with patch.object(web.summarizer, 'generate_summary_with_title', return_value=('Summary', 'Review')) as generate:
+            job_ids = [
+                client.post('/api/summarize', json={'upload_id': upload_id, 'max_length': 123}).get_json()['job_id']
+                for upload_id in (first, second)
+            ]
+            assert job_ids[0] == job_ids[1]
+            assert wait_for_job(client, job_ids[0])['status'] == 'succeeded'
+        assert generate.call_count == 1
+        
+        for upload_id in (first, second):
+            response = client.post('/api/download', json={'upload_id': upload_id})
+            assert response.status_code == 200
+            slide = Presentation(io.BytesIO(response.data)).slides[0]
+            assert [shape.text_frame.text for shape in slide.shapes][:3] == ['Review', 'Executive Summary', 'Summary']
@@ -0,0 +1,101 @@
+"""Test cases for the asynchronous summarizer."""
+
+import asyncio
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from async_summarizer import AsyncPresentationSummarizer
+from summarizer import PresentationSummarizer
+
+
+def make_response(content):
+    """Build a fake chat completion response."""
+    response = Mock()
+    response.choices = [Mock(message=Mock(content=content))]
+    return response
+
+
+class TestAsyncPresentationSummarizer:
+    """Tests for AsyncPresentationSummarizer class."""
+    
+    def test_init_without_api_key(self):
+        """Test initialization fails without API key."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError):
+                AsyncPresentationSummarizer()
+    
+    def test_concurrency_is_bounded_and_session_shared(self):
+        """Test that in-flight requests never exceed max_concurrency."""
+        state = {"in_flight": 0, "peak": 0, "sessions": set()}
+        
+        async def fake_acreate(**kwargs):
+            import openai
+            state["sessions"].add(id(openai.aiosession.get()))
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            return make_response('{"title": "T", "summary": "S"}')
+        
+        async def run():
+            async with AsyncPresentationSummarizer(api_key="test_key", max_concurrency=2) as summarizer:
+                return await asyncio.gather(*(
+                    summarizer.generate_summary_with_title(f"Deck {index}") for index in range(6)
+                ))
+        
+        with patch("openai.ChatCompletion.acreate", side_effect=fake_acreate):
+            results = asyncio.run(run())
+        
+        assert results == [("S", "T")] * 6
+        assert state["peak"] == 2
+        assert len(state["sessions"]) == 1
+    
+    def test_sync_callers_share_session_and_bound(self):
+        """Test that threads using the sync summarizer share one session and limit."""
+        state = {"in_flight": 0, "peak": 0, "sessions": set()}
+        lock = threading.Lock()
+        
+        async def fake_acreate(**kwargs):
+            import openai
+            with lock:
+                state["sessions"].add(id(openai.aiosession.get()))
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            with lock:
+                state["in_flight"] -= 1
+            return make_response('{"title": "T", "summary": "S"}')
+        
+        summarizer = PresentationSummarizer(api_key="test_key", max_concurrency=2)
+        with patch("openai.ChatCompletion.acreate", side_effect=fake_acreate):
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                results = list(executor.map(
+                    lambda index: summarizer.generate_summary_with_title(f"Deck {index}"), range(6)
+                ))
+        summarizer.close()
+        
+        assert results == [("S", "T")] * 6
+        assert state["peak"] == 2
+        assert len(state["sessions"]) == 1
+    
+    def test_sync_wrapper_reports_failures_per_document(self):
+        """Test that summarize_many keeps order and returns exceptions in place."""
+        async def fake_acreate(**kwargs):
+            if "Broken" in kwargs["messages"][1]["content"]:
+                raise RuntimeError("boom")
+            return make_response('{"title": "T", "summary": "S"}')
+        
+        with patch("openai.ChatCompletion.acreate", side_effect=fake_acreate):
+            summarizer = PresentationSummarizer(api_key="test_key")
+            results = summarizer.summarize_many(["Good deck", "Broken deck", ""])
+        
+        assert results[0] == ("S", "T")
+        assert isinstance(results[1], Exception)
+        assert isinstance(results[2], ValueError)
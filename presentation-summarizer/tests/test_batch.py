@@ -0,0 +1,94 @@
+"""Test cases for the batch command-line interface."""
+
+import json
+from unittest.mock import Mock, patch
+import sys
+import os
+
+from click.testing import CliRunner
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from batch import expand_inputs, main
+from conftest import build_deck
+
+
+async def fake_acreate(**kwargs):
+    """Return a structured title and summary reply."""
+    response = Mock()
+    response.choices = [Mock(message=Mock(content='{"title": "T", "summary": "S"}'))]
+    return response
+
+
+class TestBatch:
+    """Tests for the batch command."""
+    
+    def test_expand_inputs(self, tmp_path):
+        """Test that directories and globs expand to unique decks."""
+        build_deck(tmp_path / "a.pptx", [("A", ["x"], "")])
+        (tmp_path / "nested").mkdir()
+        build_deck(tmp_path / "nested" / "b.pptx", [("B", ["y"], "")])
+        (tmp_path / "notes.txt").write_text("ignored")
+        
+        found = expand_inputs([str(tmp_path), str(tmp_path / "*.pptx")])
+        assert [path.name for path in found] == ["a.pptx", "b.pptx"]
+    
+    def test_batch_writes_outputs_manifest_and_resumes(self, tmp_path):
+        """Test a full run followed by a resumed run that skips finished decks."""
+        decks = tmp_path / "decks"
+        decks.mkdir()
+        build_deck(decks / "a.pptx", [("A", ["x"], "")])
+        build_deck(decks / "b.pptx", [("B", ["y"], "")])
+        output_dir = tmp_path / "out"
+        args = [str(decks), "-o", str(output_dir), "--api-key", "test_key", "--workers", "2"]
+        
+        with patch("openai.ChatCompletion.acreate", side_effect=fake_acreate) as mock_acreate:
+            first = CliRunner().invoke(main, args)
+            assert first.exit_code == 0, first.output
+            assert mock_acreate.call_count == 2
+            
+            second = CliRunner().invoke(main, args)
+            assert second.exit_code == 0, second.output
+            assert mock_acreate.call_count == 2
+        
+        assert (output_dir / "a_summary.pptx").exists()
+        manifest = json.loads((output_dir / "manifest.json").read_text())
+        assert [row["status"] for row in manifest["files"]] == ["skipped", "skipped"]
+        assert all(row["digest"] and row["title"] == "T" for row in manifest["files"])
+    
+    def test_resume_redoes_decks_when_settings_change(self, tmp_path):
+        """Test that a resumed run with different options summarizes again."""
+        build_deck(tmp_path / "a.pptx", [("A", ["x"], "")])
+        output_dir = tmp_path / "out"
+        args = [str(tmp_path / "a.pptx"), "-o", str(output_dir), "--api-key", "test_key", "--workers", "1"]
+        
+        with patch("openai.ChatCompletion.acreate", side_effect=fake_acreate) as mock_acreate:
+            assert CliRunner().invoke(main, args).exit_code == 0
+            assert CliRunner().invoke(main, args + ["--workers", "2"]).exit_code == 0
+            assert mock_acreate.call_count == 1
+            
+            result = CliRunner().invoke(main, args + ["--max-length", "150"])
+            assert result.exit_code == 0, result.output
+            assert mock_acreate.call_count == 2
+        
+        row = json.loads((output_dir / "manifest.json").read_text())["files"][0]
+        assert row["status"] == "ok"
+        assert json.loads(row["settings"])["max_length"] == 150
+    
+    def test_batch_records_failures(self, tmp_path):
+        """Test that a broken deck is recorded without stopping the batch."""
+        build_deck(tmp_path / "good.pptx", [("A", ["x"], "")])
+        (tmp_path / "broken.pptx").write_bytes(b"not a zip")
+        manifest_path = tmp_path / "out" / "manifest.csv"
+        
+        with patch("openai.ChatCompletion.acreate", side_effect=fake_acreate):
+            result = CliRunner().invoke(main, [
+                str(tmp_path / "*.pptx"), "-o", str(tmp_path / "out"),
+                "--manifest", str(manifest_path), "--api-key", "test_key"
+            ])
+        
+        assert result.exit_code == 1
+        rows = manifest_path.read_text().splitlines()
+        assert rows[0].startswith("input,output,status")
+        assert ",failed," in rows[1] and ",ok," in rows[2]
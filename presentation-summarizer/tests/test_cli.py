@@ -0,0 +1,49 @@
+"""Test cases for the single-deck command-line interface."""
+
+from unittest.mock import Mock, patch
+import sys
+import os
+
+from click.testing import CliRunner
+from pptx import Presentation
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cli import main
+
+
+def fake_create(**kwargs):
+    """Return a structured title and summary reply."""
+    response = Mock()
+    response.choices = [Mock(message=Mock(content='{"title": "Review", "summary": "Summary"}'))]
+    return response
+
+
+class TestCli:
+    """Tests for the summarize command."""
+    
+    def test_include_original_keeps_the_source(self, sample_deck):
+        """Test that the combined deck is written beside the input by default."""
+        with patch("openai.ChatCompletion.acreate", side_effect=fake_create):
+            result = CliRunner().invoke(main, [str(sample_deck), "--include-original", "--api-key", "test_key"])
+        
+        assert result.exit_code == 0, result.output
+        assert len(Presentation(str(sample_deck)).slides) == 3
+        
+        combined = Presentation(str(sample_deck.parent / "sample_summary.pptx")).slides
+        assert combined[0].shapes[0].text_frame.text == "Review"
+        assert [slide.shapes.title.text for slide in list(combined)[-3:]] == [
+            "Quarterly Results", "Roadmap", "Next Steps"
+        ]
+    
+    def test_include_original_overwrites_when_named(self, sample_deck):
+        """Test that the input is only replaced when --output names it."""
+        with patch("openai.ChatCompletion.acreate", side_effect=fake_create):
+            result = CliRunner().invoke(main, [
+                str(sample_deck), "--include-original", "--api-key", "test_key", "--output", str(sample_deck)
+            ])
+        
+        assert result.exit_code == 0, result.output
+        assert Presentation(str(sample_deck)).slides[0].shapes[0].text_frame.text == "Review"
+        assert not (sample_deck.parent / "sample_summary.pptx").exists()
@@ -0,0 +1,115 @@
+"""Test cases for near-duplicate slide and deck detection."""
+
+import sys
+import os
+from unittest.mock import patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from presentation_reader import PresentationReader, SlideRecord
+from dedup import DeckIndex, MinHasher, cluster_slides, estimate_similarity
+from preprocess import condense_slides
+from conftest import build_deck
+
+
+AGENDA = ("Introduction and goals", "Market overview and competitive landscape", "Financial results and outlook")
+
+
+class TestDedup:
+    """Tests for MinHash clustering and the deck index."""
+    
+    def test_similar_texts_have_similar_signatures(self):
+        """Test that signature agreement tracks text overlap."""
+        hasher = MinHasher()
+        base = hasher.text_signature("Revenue grew twelve percent across every region this quarter")
+        edited = hasher.text_signature("Revenue grew twelve percent across every region this quarter again")
+        other = hasher.text_signature("Hiring plan for the platform engineering team")
+        
+        assert estimate_similarity(base, edited) > 0.8
+        assert estimate_similarity(base, other) < 0.2
+    
+    def test_cluster_slides_groups_repeated_agendas(self):
+        """Test that repeated agenda slides share one cluster."""
+        records = [
+            SlideRecord(1, "Agenda", AGENDA, ""),
+            SlideRecord(2, "Results", ("Revenue grew 12% year over year",), ""),
+            SlideRecord(3, "Agenda", AGENDA, ""),
+            SlideRecord(4, "", (), ""),
+        ]
+        
+        assert cluster_slides(records) == [[0, 2], [1], [3]]
+        
+        chunks, report = condense_slides(records, duplicate_threshold=0.85)
+        assert report.duplicate_slides == 1
+        assert [chunk.splitlines()[0] for chunk in chunks] == ["Slide 1: Agenda", "Slide 2: Results"]
+    
+    def test_reader_collapses_near_duplicate_slides(self, tmp_path):
+        """Test that the reader keeps the first slide of each cluster."""
+        deck = build_deck(tmp_path / "deck.pptx", [
+            ("Agenda", list(AGENDA), ""),
+            ("Results", ["Revenue grew 12% year over year"], ""),
+            ("Agenda", list(AGENDA), ""),
+        ])
+        
+        records = PresentationReader(str(deck)).get_distinct_slide_records()
+        assert [record.slide_number for record in records] == [1, 2]
+    
+    def test_deck_index_matches_edited_deck(self):
+        """Test that a lightly edited deck finds the original's payload."""
+        original = [
+            SlideRecord(number, f"Section {number}", (f"Detailed findings for workstream {number} and its impact on revenue",), "")
+            for number in range(1, 21)
+        ]
+        edited = original[:-1] + [SlideRecord(20, "Section 20", ("Detailed findings for workstream 20, revised",), "")]
+        unrelated = [SlideRecord(1, "Hiring", ("Platform engineering hiring plan",), "")]
+        
+        index = DeckIndex(threshold=0.8)
+        index.add("original", index.deck_signature(original), {"gpt-4:400": {"title": "T"}})
+        
+        match = index.find(index.deck_signature(edited))
+        assert match.deck_id == "original"
+        assert match.payload == {"gpt-4:400": {"title": "T"}}
+        assert index.find(index.deck_signature(unrelated)) is None
+        assert index.get("original") == {"gpt-4:400": {"title": "T"}}
+        assert index.get("edited") is None
+    
+    def test_deck_index_without_signature_matches_exactly(self):
+        """Test that decks added without a signature are only found by ID."""
+        deck = [SlideRecord(1, "Hiring", ("Platform engineering hiring plan",), "")]
+        index = DeckIndex(threshold=0.5)
+        index.add("digest", None, {"gpt-4:400": {"title": "T"}})
+        
+        assert index.get("digest") == {"gpt-4:400": {"title": "T"}}
+        assert index.find(index.deck_signature(deck)) is None
+    
+    def test_deck_index_evicts_least_recently_used_deck(self):
+        """Test that the size limit drops the oldest deck from lookups and the LSH index."""
+        decks = {
+            name: [SlideRecord(1, name, (f"Detailed {name} findings for the {name} workstream and its budget",), "")]
+            for name in ("hiring", "pricing", "security")
+        }
+        index = DeckIndex(threshold=0.8, max_entries=2)
+        index.add("hiring", index.deck_signature(decks["hiring"]), {"gpt-4:400": {"title": "H"}})
+        index.add("pricing", index.deck_signature(decks["pricing"]), {"gpt-4:400": {"title": "P"}})
+        index.get("hiring")
+        index.add("security", index.deck_signature(decks["security"]), {"gpt-4:400": {"title": "S"}})
+        
+        assert len(index) == 2
+        assert index.get("pricing") is None
+        assert index.find(index.deck_signature(decks["pricing"])) is None
+        assert index.find(index.deck_signature(decks["hiring"])).deck_id == "hiring"
+    
+    def test_deck_index_unused_deck_expires(self):
+        """Test that decks not used within the TTL are dropped."""
+        deck = [SlideRecord(1, "Hiring", ("Platform engineering hiring plan",), "")]
+        index = DeckIndex(threshold=0.8, ttl=60)
+        with patch("dedup.time.time", return_value=1000.0):
+            index.add("digest", index.deck_signature(deck), {"gpt-4:400": {"title": "T"}})
+        
+        with patch("dedup.time.time", return_value=1030.0):
+            assert index.get("digest") is not None
+        with patch("dedup.time.time", return_value=1100.0):
+            assert index.find(index.deck_signature(deck)) is None
+            assert index.get("digest") is None
+            assert len(index) == 0
@@ -0,0 +1,63 @@
+"""Test cases for the extraction cache."""
+
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from extraction_cache import ExtractionCache
+from presentation_reader import PresentationReader
+
+
+class TestExtractionCache:
+    """Tests for ExtractionCache class."""
+    
+    def test_second_reader_skips_parsing(self, sample_deck, tmp_path):
+        """Test that a cache hit serves slides without loading the deck."""
+        cache = ExtractionCache(str(tmp_path / "cache"))
+        first = PresentationReader(str(sample_deck), cache=cache).get_slides_content()
+        
+        with patch("presentation_reader.Presentation") as mock_presentation:
+            reader = PresentationReader(str(sample_deck), cache=cache)
+            assert reader.get_slides_content() == first
+            assert reader.slide_count == 3
+            assert not mock_presentation.called
+    
+    def test_returned_slides_are_copies(self, sample_deck, tmp_path):
+        """Test that mutating returned slides does not corrupt the cache."""
+        cache = ExtractionCache(str(tmp_path / "cache"))
+        reader = PresentationReader(str(sample_deck), cache=cache)
+        reader.get_slides_content()[0]["content"].append("mutated")
+        
+        assert "mutated" not in reader.get_slides_content()[0]["content"]
+    
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used entry is evicted first."""
+        cache = ExtractionCache(str(tmp_path / "cache"), max_entries=2)
+        cache.put("a", [])
+        cache.put("b", [])
+        os.utime(cache.cache_dir / "a.json", (1, 1))
+        os.utime(cache.cache_dir / "b.json", (2, 2))
+        cache.get("a")
+        cache.put("c", [])
+        
+        assert cache.get("a") == []
+        assert cache.get("b") is None
+        assert len(cache) == 2
+    
+    def test_invalidate(self, sample_deck, tmp_path):
+        """Test that invalidate removes the entry for a file."""
+        cache = ExtractionCache(str(tmp_path / "cache"))
+        PresentationReader(str(sample_deck), cache=cache).get_slides_content()
+        
+        assert cache.invalidate(file_path=str(sample_deck))
+        assert cache.get(cache.file_digest(sample_deck)) is None
+        assert not cache.invalidate(file_path=str(sample_deck))
+    
+    def test_invalid_max_entries(self, tmp_path):
+        """Test that a non-positive size bound is rejected."""
+        with pytest.raises(ValueError):
+            ExtractionCache(str(tmp_path / "cache"), max_entries=0)
@@ -0,0 +1,93 @@
+"""Test cases for streaming slide extraction from the package XML."""
+
+import sys
+import os
+from unittest.mock import patch
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.util import Inches
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from presentation_reader import PresentationReader
+from extraction_cache import ExtractionCache
+from fast_reader import iter_package_slides
+
+
+def build_rich_deck(path):
+    """Write a deck with grouped shapes, a table, a chart and a line break."""
+    presentation = Presentation()
+    slide = presentation.slides.add_slide(presentation.slide_layouts[5])  # Title Only
+    slide.shapes.title.text = "Regional Results"
+    
+    box = slide.shapes.add_textbox(Inches(1), Inches(1.5), Inches(4), Inches(1))
+    box.text_frame.text = "North grew"
+    box.text_frame.paragraphs[0].add_line_break()
+    box.text_frame.paragraphs[0].add_run().text = "South held"
+    
+    group = slide.shapes.add_group_shape()
+    group.shapes.add_textbox(Inches(6), Inches(1.5), Inches(2), Inches(1)).text_frame.text = "Grouped callout"
+    
+    table = slide.shapes.add_table(2, 2, Inches(1), Inches(3), Inches(4), Inches(1)).table
+    for row, values in enumerate([("Region", "Revenue"), ("North", "12")]):
+        for column, value in enumerate(values):
+            table.cell(row, column).text = value
+    
+    chart_data = CategoryChartData()
+    chart_data.categories = ["Q1", "Q2"]
+    chart_data.add_series("Revenue", (1, 2))
+    chart = slide.shapes.add_chart(
+        XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(5), Inches(3), Inches(4), Inches(3), chart_data
+    ).chart
+    chart.has_title = True
+    chart.chart_title.text_frame.text = "Quarterly revenue"
+    
+    slide.notes_slide.notes_text_frame.text = "Stress the north"
+    presentation.save(str(path))
+    return path
+
+
+class TestFastReader:
+    """Tests for the lxml iterparse extraction path."""
+    
+    def test_matches_object_model_records(self, sample_deck):
+        """Test that plain decks produce the same records on both paths."""
+        expected = PresentationReader(str(sample_deck)).get_slide_records()
+        
+        assert tuple(iter_package_slides(str(sample_deck))) == expected
+        assert PresentationReader(str(sample_deck), fast=True).get_slide_records() == expected
+    
+    def test_extracts_groups_tables_and_charts(self, tmp_path):
+        """Test that text the object-model walk skips is included."""
+        deck = build_rich_deck(tmp_path / "rich.pptx")
+        expected = PresentationReader(str(deck)).get_slide_records()[0]
+        record = next(iter_package_slides(str(deck)))
+        
+        assert record.title == expected.title == "Regional Results"
+        assert record.notes == expected.notes == "Stress the north"
+        assert record.content[0] == expected.content[0] == "North grew\vSouth held"
+        assert "Grouped callout" in record.content
+        assert "Region | Revenue\nNorth | 12" in record.content
+        assert "Quarterly revenue" in record.content
+    
+    def test_fast_reader_skips_python_pptx(self, sample_deck):
+        """Test that the fast path never loads the presentation object model."""
+        with patch("presentation_reader.Presentation") as load:
+            reader = PresentationReader(str(sample_deck), fast=True)
+            assert reader.slide_count == 3
+            assert [record.title for record in reader.iter_slides()] == [
+                "Quarterly Results", "Roadmap", "Next Steps"
+            ]
+        load.assert_not_called()
+    
+    def test_fast_records_are_cached_separately(self, sample_deck, tmp_path):
+        """Test that records from the two paths do not share a cache entry."""
+        cache = ExtractionCache(str(tmp_path / "cache"))
+        PresentationReader(str(sample_deck), cache=cache).get_slide_records()
+        
+        reader = PresentationReader(str(sample_deck), cache=cache, fast=True)
+        assert reader._records is None
+        reader.get_slide_records()
+        assert len(cache) == 2
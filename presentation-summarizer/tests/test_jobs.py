@@ -0,0 +1,107 @@
+"""Test cases for the background job queue."""
+
+import threading
+import pytest
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from jobs import JobQueue, MemoryJobStore, RedisJobStore
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for a Redis client."""
+    
+    def __init__(self):
+        self.data = {}
+    
+    def get(self, key):
+        return self.data.get(key)
+    
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value.encode("utf-8") if isinstance(value, str) else value
+        return True
+
+
+def wait_for(queue, job_id, status):
+    """Poll a job until it reaches the given status."""
+    for _ in range(200):
+        job = queue.get(job_id)
+        if job["status"] == status:
+            return job
+        threading.Event().wait(0.01)
+    raise AssertionError(f"Job never reached {status}: {queue.get(job_id)}")
+
+
+@pytest.fixture(params=["memory", "redis"])
+def store(request):
+    """Each job store backend."""
+    if request.param == "memory":
+        return MemoryJobStore()
+    return RedisJobStore(FakeRedis())
+
+
+class TestJobQueue:
+    """Tests for JobQueue class."""
+    
+    def test_job_reports_progress_and_result(self, store):
+        """Test that a job publishes its stage and then its result."""
+        release = threading.Event()
+        
+        def job(value, report):
+            report("working", step=1)
+            release.wait(5)
+            return value * 2
+        
+        queue = JobQueue(store=store, max_workers=1)
+        job_id = queue.submit(job, 21)
+        
+        running = wait_for(queue, job_id, "running")
+        for _ in range(200):
+            if queue.get(job_id)["stage"] == "working":
+                break
+            threading.Event().wait(0.01)
+        assert queue.get(job_id)["progress"] == {"step": 1}
+        assert running["result"] is None
+        
+        release.set()
+        assert wait_for(queue, job_id, "succeeded")["result"] == 42
+        queue.shutdown()
+    
+    def test_duplicate_submissions_share_one_job(self, store):
+        """Test that in-flight jobs with the same key are deduplicated."""
+        release = threading.Event()
+        calls = []
+        
+        def job(report):
+            calls.append(1)
+            release.wait(5)
+            return "done"
+        
+        queue = JobQueue(store=store, max_workers=2)
+        first = queue.submit(job, dedupe_key="deck:model")
+        second = queue.submit(job, dedupe_key="deck:model")
+        other = queue.submit(job, dedupe_key="deck:other-model")
+        release.set()
+        
+        assert first == second != other
+        wait_for(queue, first, "succeeded")
+        wait_for(queue, other, "succeeded")
+        assert len(calls) == 2
+        queue.shutdown()
+    
+    def test_failed_job_is_retried_on_resubmit(self, store):
+        """Test that a failure is reported and does not block a new attempt."""
+        def job(report):
+            raise RuntimeError("boom")
+        
+        queue = JobQueue(store=store, max_workers=1)
+        first = queue.submit(job, dedupe_key="deck")
+        assert wait_for(queue, first, "failed")["error"] == "boom"
+        
+        assert queue.submit(job, dedupe_key="deck") != first
+        queue.shutdown()
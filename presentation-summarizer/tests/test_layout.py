@@ -0,0 +1,115 @@
+"""Test cases for fitting summary text onto slides."""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from presentation_reader import SlideRecord
+from layout import (
+    PAGINATED_FONT_SIZE,
+    deck_sections,
+    fit_text,
+    paragraph_height,
+    text_width,
+    wrap_lines,
+)
+
+
+def record(number, title):
+    return SlideRecord(number, title, (), "")
+
+
+class TestLayout:
+    """Tests for text measurement, fitting and section breakdowns."""
+    
+    def test_wide_characters_measure_wider(self):
+        """Test that widths follow the font metrics rather than character counts."""
+        assert text_width("WWWW", 16) > text_width("iiii", 16) * 3
+        assert text_width("abc", 32) == 2 * text_width("abc", 16)
+    
+    def test_wrap_lines_fits_width(self):
+        """Test that wrapped lines stay within the box and keep every word."""
+        text = "Revenue grew twelve percent across every region this quarter " * 6
+        lines = wrap_lines(text, 16, 4.0)
+        
+        assert len(lines) > 1
+        assert all(text_width(line, 16) <= 4.0 for line in lines)
+        assert " ".join(lines).split() == text.split()
+    
+    def test_wrap_lines_breaks_long_words(self):
+        """Test that a word wider than the box is split across lines."""
+        lines = wrap_lines("x" * 200, 16, 2.0)
+        
+        assert "".join(lines) == "x" * 200
+        assert all(text_width(line, 16) <= 2.0 for line in lines)
+        assert wrap_lines("", 16, 2.0) == [""]
+    
+    def test_short_text_keeps_largest_font(self):
+        """Test that text that fits is left on one page at the first size."""
+        pages = fit_text("First point\nSecond point", 8.2, 4.7)
+        
+        assert len(pages) == 1
+        assert pages[0].font_size == 16
+        assert pages[0].paragraphs == ("First point", "Second point")
+    
+    def test_font_shrinks_before_paginating(self):
+        """Test that a smaller font is chosen when it avoids a second page."""
+        text = "\n".join(["Revenue grew across every region"] * 11)
+        pages = fit_text(text, 8.2, 4.7)
+        
+        assert len(pages) == 1
+        assert pages[0].font_size < 16
+    
+    def test_long_text_is_paginated(self):
+        """Test that long text is split across pages that each fit."""
+        paragraphs = [f"Point {index}: " + "margins improved as costs declined " * 5 for index in range(30)]
+        pages = fit_text("\n".join(paragraphs), 8.2, 4.7)
+        
+        assert len(pages) > 1
+        for page in pages:
+            assert page.font_size == PAGINATED_FONT_SIZE
+            used = sum(
+                paragraph_height(len(wrap_lines(paragraph, page.font_size, 8.2)), page.font_size)
+                for paragraph in page.paragraphs
+            )
+            assert used <= 4.7
+        assert [paragraph for page in pages for paragraph in page.paragraphs] == paragraphs
+    
+    def test_tall_paragraph_is_split(self):
+        """Test that a paragraph taller than a page continues on the next page."""
+        text = "word " * 2000
+        pages = fit_text(text, 8.2, 4.7)
+        
+        assert len(pages) > 1
+        assert " ".join(paragraph for page in pages for paragraph in page.paragraphs).split() == text.split()
+    
+    def test_deck_sections_groups_titles(self):
+        """Test that repeated and missing titles extend the section before them."""
+        records = [
+            record(1, "Introduction"),
+            record(2, "Market"),
+            record(3, "Market"),
+            record(4, ""),
+            record(5, "Outlook"),
+        ]
+        
+        assert deck_sections(records) == [
+            "Slide 1: Introduction",
+            "Slides 2–4: Market",
+            "Slide 5: Outlook",
+        ]
+    
+    def test_deck_sections_merges_to_limit(self):
+        """Test that large decks are merged into at most max_sections sections."""
+        records = [record(number, f"Topic {number}") for number in range(1, 21)]
+        sections = deck_sections(records, max_sections=4)
+        
+        assert len(sections) == 4
+        assert sections[0] == "Slides 1–5: Topic 1 (Topic 2, Topic 3, Topic 4, +1 more)"
+        assert sections[-1].startswith("Slides 16–20: Topic 16")
+    
+    def test_deck_sections_without_titles(self):
+        """Test that decks without titles get no breakdown."""
+        assert deck_sections([record(1, ""), record(2, "")]) == []
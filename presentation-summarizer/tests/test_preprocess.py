@@ -0,0 +1,104 @@
+"""Test cases for the extractive preprocessing stage."""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from presentation_reader import SlideRecord
+from preprocess import condense_slides, rank_sentences
+
+
+def make_deck():
+    """Eight slides sharing a footer, with one duplicated note and an appendix copy."""
+    records = [
+        SlideRecord(
+            number,
+            f"Region {number}",
+            (f"Revenue grew {number * 3}% in region {number}.", "Confidential - Acme Corp", str(number)),
+            "Stress the revenue trend." if number in (1, 2) else ""
+        )
+        for number in range(1, 8)
+    ]
+    records.append(SlideRecord(8, "Appendix", ("Revenue grew 3% in region 1.",), ""))
+    return records
+
+
+class TestPreprocess:
+    """Tests for condense_slides and rank_sentences."""
+    
+    def test_removes_boilerplate_and_duplicates(self):
+        """Test that footers, page numbers and repeated lines are dropped."""
+        chunks, report = condense_slides(make_deck())
+        text = "\n".join(chunks)
+        
+        assert "Confidential" not in text
+        assert text.count("Revenue grew 3% in region 1.") == 1
+        assert text.count("Stress the revenue trend.") == 1
+        assert chunks[0] == "Slide 1: Region 1\nRevenue grew 3% in region 1.\nNotes: Stress the revenue trend.\n"
+        assert chunks[-1] == "Slide 8: Appendix\n"
+        assert report.boilerplate_lines == 14
+        assert report.duplicate_lines == 2
+        assert report.dropped_sentences == 0
+        assert report.kept_tokens < report.original_tokens
+    
+    def test_repeated_takeaway_is_kept_once(self):
+        """Test that a key message on every slide reaches the prompt once."""
+        takeaway = "Enterprise revenue must double by 2026 through partner channels."
+        records = [
+            SlideRecord(number, f"Region {number}", (f"Revenue grew {number}%.", "Q3 KPIs", takeaway, "Acme Corp"), "")
+            for number in range(1, 5)
+        ]
+        chunks, report = condense_slides(records)
+        text = "\n".join(chunks)
+        
+        assert text.count(takeaway) == 1
+        assert text.count("Q3 KPIs") == 1
+        assert "Acme Corp" not in text
+        assert report.boilerplate_lines == 4
+        assert report.duplicate_lines == 6
+    
+    def test_bare_numbers_are_kept_unless_they_number_the_slides(self):
+        """Test that KPI figures survive while prefixed page numbers are dropped."""
+        records = [
+            SlideRecord(1, "Customers", ("Active customers", "1200", "Page 1"), ""),
+            SlideRecord(2, "Stores", ("Open stores", "2", "Page 2 of 3"), ""),
+            SlideRecord(3, "Margin", ("Gross margin", "38"), ""),
+        ]
+        chunks, report = condense_slides(records)
+        text = "\n".join(chunks)
+        
+        assert "1200" in text and "38" in text
+        assert "Page" not in text
+        assert report.boilerplate_lines == 2
+        
+        chunks, report = condense_slides([
+            SlideRecord(number, f"Topic {number}", (f"Point {number}", str(number)), "")
+            for number in range(1, 4)
+        ] + [SlideRecord(4, "Result", ("Units sold", "2"), "")])
+        assert report.boilerplate_lines == 3
+        assert chunks[-1] == "Slide 4: Result\nUnits sold\n2\n"
+    
+    def test_token_budget_keeps_titles_and_order(self):
+        """Test that ranking trims sentences to the budget without reordering."""
+        records = make_deck()
+        full_chunks, full_report = condense_slides(records)
+        chunks, report = condense_slides(records, token_budget=full_report.kept_tokens // 2)
+        
+        assert report.kept_tokens <= full_report.kept_tokens // 2
+        assert report.dropped_sentences > 0
+        assert [chunk.splitlines()[0] for chunk in chunks] == [chunk.splitlines()[0] for chunk in full_chunks]
+        assert report.to_dict()["ratio"] < full_report.ratio
+    
+    def test_rank_sentences_prefers_central_sentences(self):
+        """Test that sentences sharing terms outrank an isolated one."""
+        scores = rank_sentences([
+            "Cloud revenue grew strongly this quarter.",
+            "Cloud revenue growth beat the forecast.",
+            "Revenue from cloud customers grew again.",
+            "The office plants were watered.",
+        ])
+        
+        assert scores.argmin() == 3
+        assert abs(scores.sum() - 1.0) < 1e-6
@@ -0,0 +1,80 @@
+"""Test cases for the AI response cache."""
+
+import pytest
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from response_cache import MemoryResponseCache, ResponseCache, SQLiteResponseCache, make_cache_key
+from summarizer import PresentationSummarizer
+
+
+class TestResponseCache:
+    """Tests for the response cache backends."""
+    
+    def test_key_normalizes_whitespace(self):
+        """Test that cosmetic whitespace differences map to the same key."""
+        assert make_cache_key(prompt="a  \r\nb\n", model="m") == make_cache_key(prompt="a\nb", model="m")
+        assert make_cache_key(prompt="a", model="m") != make_cache_key(prompt="a", model="n")
+    
+    def test_backends_must_implement_storage(self):
+        """Test that the base class cannot be used without a storage backend."""
+        with pytest.raises(TypeError):
+            ResponseCache()
+        
+        class Partial(ResponseCache):
+            def _get(self, key, now):
+                return None
+        
+        with pytest.raises(TypeError):
+            Partial()
+    
+    @pytest.mark.parametrize("backend", ["memory", "sqlite"])
+    def test_lru_eviction_and_counters(self, backend, tmp_path):
+        """Test size-bounded eviction and hit/miss counters."""
+        if backend == "memory":
+            cache = MemoryResponseCache(max_entries=2)
+        else:
+            cache = SQLiteResponseCache(str(tmp_path / "responses.db"), max_entries=2)
+        
+        with patch("response_cache.time.time", side_effect=[1, 2, 3, 4, 5, 6]):
+            cache.set("a", "A")
+            cache.set("b", "B")
+            assert cache.get("a") == "A"
+            cache.set("c", "C")
+            assert cache.get("b") is None
+            assert cache.get("c") == "C"
+        
+        assert cache.stats() == {"hits": 2, "misses": 1, "size": 2}
+    
+    @pytest.mark.parametrize("backend", ["memory", "sqlite"])
+    def test_ttl_expiry(self, backend, tmp_path):
+        """Test that responses older than the TTL are misses."""
+        if backend == "memory":
+            cache = MemoryResponseCache(ttl=10)
+        else:
+            cache = SQLiteResponseCache(str(tmp_path / "responses.db"), ttl=10)
+        
+        with patch("response_cache.time.time", side_effect=[100, 105, 111]):
+            cache.set("a", "A")
+            assert cache.get("a") == "A"
+            assert cache.get("a") is None
+    
+    @patch('openai.ChatCompletion.acreate')
+    def test_summarizer_reuses_cached_response(self, mock_create):
+        """Test that identical requests are answered from the cache."""
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content="Test summary"))]
+        mock_create.return_value = mock_response
+        
+        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test_key'}):
+            summarizer = PresentationSummarizer(cache=MemoryResponseCache())
+            first = summarizer.generate_summary("Test content", max_length=300)
+            second = summarizer.generate_summary("Test content", max_length=300)
+            summarizer.generate_summary("Test content", max_length=400)
+        
+        assert first == second == "Test summary"
+        assert mock_create.call_count == 2
@@ -1,17 +1,29 @@
 """Test cases for the presentation summarizer."""
 
+import io
+import struct
+import zipfile
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
 import sys
 import os
+from pptx import Presentation
+from pptx.util import Inches, Pt
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from presentation_reader import PresentationReader
-from summarizer import PresentationSummarizer
-from slide_generator import SlideGenerator, create_summary_presentation
+from presentation_reader import PresentationReader, SlideRecord
+from summarizer import MapReducePlan, PresentationSummarizer, group_chunks
+from response_cache import MemoryResponseCache
+from slide_generator import (
+    SlideGenerator,
+    SlideRenderer,
+    create_summary_presentation,
+    get_renderer,
+    insert_summary_presentation,
+)
 
 
 class TestPresentationReader:
@@ -27,10 +39,58 @@ class TestPresentationReader:
         # This would need a real file to test properly
         pass
     
-    def test_extract_full_text_returns_string(self):
+    def test_extract_full_text_returns_string(self, sample_deck):
         """Test that extract_full_text returns a string."""
-        # This would need a real presentation file
-        pass
+        reader = PresentationReader(str(sample_deck))
+        text = reader.extract_full_text()
+        
+        assert isinstance(text, str)
+        assert text.startswith("Slide 1: Quarterly Results\nRevenue grew 12%\nMargins stable\n")
+        assert "Notes: Mention the new region" in text
+    
+    def test_slides_are_extracted_once(self, sample_deck):
+        """Test that every accessor is served from one extraction pass."""
+        reader = PresentationReader(str(sample_deck))
+        
+        with patch.object(reader, "_extract_records", wraps=reader._extract_records) as spy:
+            reader.get_presentation_summary()
+            reader.extract_full_text()
+            reader.get_slide(2)
+            reader.get_slides_content()
+            assert spy.call_count == 1
+    
+    def test_get_slide_returns_immutable_record(self, sample_deck):
+        """Test per-slide access and record immutability."""
+        reader = PresentationReader(str(sample_deck))
+        record = reader.get_slide(2)
+        
+        assert isinstance(record, SlideRecord)
+        assert record.title == "Roadmap"
+        assert record.content == ("Launch v2 in Q3",)
+        with pytest.raises(AttributeError):
+            record.title = "Changed"
+        with pytest.raises(IndexError):
+            reader.get_slide(4)
+    
+    def test_iter_slides_is_lazy(self, sample_deck):
+        """Test that the first record is yielded before later slides are read."""
+        reader = PresentationReader(str(sample_deck))
+        slides = reader.iter_slides()
+        
+        first = next(slides)
+        assert first.slide_number == 1
+        assert reader._records is None
+        assert [record.slide_number for record in slides] == [2, 3]
+    
+    def test_iter_text_chunks_matches_full_text(self, sample_deck):
+        """Test that joined chunks reproduce extract_full_text."""
+        reader = PresentationReader(str(sample_deck))
+        full_text = reader.extract_full_text()
+        
+        assert "\n".join(reader.iter_text_chunks()) == full_text
+        grouped = list(reader.iter_text_chunks(max_chars=80))
+        assert 1 < len(grouped) < 3
+        assert "\n".join(grouped) == full_text
 
 
 class TestPresentationSummarizer:
@@ -49,7 +109,7 @@ class TestPresentationSummarizer:
             with pytest.raises(ValueError):
                 summarizer.generate_summary("")
     
-    @patch('openai.ChatCompletion.create')
+    @patch('openai.ChatCompletion.acreate')
     def test_generate_summary_success(self, mock_create):
         """Test successful summary generation."""
         mock_response = Mock()
@@ -61,7 +121,203 @@ class TestPresentationSummarizer:
             result = summarizer.generate_summary("Test content")
             assert result == "Test summary"
             assert mock_create.called
-
+    
+    def test_group_chunks_respects_budget_and_boundaries(self):
+        """Test that chunks are packed in order without being split."""
+        chunks = ["a" * 40, "b" * 40, "c" * 40, "d" * 200]
+        groups = group_chunks(chunks, chunk_tokens=25)
+        
+        assert groups == ["a" * 40 + "\n" + "b" * 40, "c" * 40, "d" * 200]
+    
+    @patch('openai.ChatCompletion.acreate')
+    def test_chunked_summary_maps_then_reduces(self, mock_create):
+        """Test that large content is summarized per group and then combined."""
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content="Partial"))]
+        mock_create.return_value = mock_response
+        
+        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test_key'}):
+            summarizer = PresentationSummarizer()
+            result = summarizer.generate_chunked_summary(
+                ["slide one " * 20, "slide two " * 20, "slide three " * 20],
+                chunk_tokens=60,
+                max_workers=2
+            )
+        
+        assert result == "Partial"
+        assert mock_create.call_count == 4
+        reduce_prompt = mock_create.call_args_list[-1][1]["messages"][1]["content"]
+        assert "Section 3:" in reduce_prompt
+    
+    def test_map_reduce_plan_reduces_hierarchically(self):
+        """Test that oversized partials get another round before the final prompt."""
+        chunks = [f"slide {n} " * 20 for n in range(12)]
+        plan = MapReducePlan(chunks, max_length=100, model="gpt-3.5-turbo", chunk_tokens=60, max_workers=2)
+        first_round = len(plan.groups)
+        assert first_round > 2
+        
+        plan.add_partials([f"partial {n} " * 4 for n in range(first_round)])
+        assert 0 < len(plan.groups) < first_round
+        with pytest.raises(ValueError):
+            plan.final_prompt()
+        
+        plan.add_partials(["short"] * len(plan.groups))
+        assert plan.groups == []
+        assert "Section 1:\nshort" in plan.final_prompt()
+    
+    def test_map_reduce_plan_small_content_needs_no_round(self):
+        """Test that content fitting one group goes straight to the summary prompt."""
+        plan = MapReducePlan(["Only slide"], max_length=100, model="gpt-3.5-turbo", chunk_tokens=60, max_workers=2)
+        
+        assert plan.groups == []
+        assert "Presentation Content:\nOnly slide" in plan.final_prompt()
+    
+    @patch('openai.ChatCompletion.acreate')
+    def test_summary_with_title_single_call(self, mock_create):
+        """Test that summary and title come back from one structured reply."""
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(
+            content='{"title": "Growth Ahead", "summary": "- Revenue up\n- Costs flat"}'
+        ))]
+        mock_create.return_value = mock_response
+        
+        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test_key'}):
+            summarizer = PresentationSummarizer()
+            summary, title = summarizer.generate_summary_with_title("Test content")
+        
+        assert title == "Growth Ahead"
+        assert summary == "- Revenue up\n- Costs flat"
+        assert mock_create.call_count == 1
+    
+    @patch('openai.ChatCompletion.acreate')
+    def test_summary_with_title_falls_back_on_plain_reply(self, mock_create):
+        """Test that an unstructured reply is used as the summary."""
+        summary_response = Mock()
+        summary_response.choices = [Mock(message=Mock(content="Plain summary"))]
+        title_response = Mock()
+        title_response.choices = [Mock(message=Mock(content="Fallback Title"))]
+        mock_create.side_effect = [summary_response, title_response]
+        
+        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test_key'}):
+            summarizer = PresentationSummarizer()
+            summary, title = summarizer.generate_summary_with_title("Test content")
+        
+        assert (summary, title) == ("Plain summary", "Fallback Title")
+    
+    @patch('openai.ChatCompletion.acreate')
+    def test_chunked_summary_small_content_single_call(self, mock_create):
+        """Test that content within budget uses a single call."""
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content="Test summary"))]
+        mock_create.return_value = mock_response
+        
+        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test_key'}):
+            summarizer = PresentationSummarizer()
+            result = summarizer.generate_chunked_summary(["Slide 1: Intro\n", "Slide 2: End\n"])
+        
+        assert result == "Test summary"
+        assert mock_create.call_count == 1
+    
+    
+    @patch('openai.ChatCompletion.acreate')
+    def test_summary_stream_yields_pieces_and_caches_reply(self, mock_create):
+        """Test that streamed pieces join into the summary and are cached."""
+        async def stream():
+            for delta in ({"role": "assistant"}, {"content": " Revenue"}, {"content": " grew."}, {}):
+                yield Mock(choices=[Mock(delta=delta)])
+        
+        mock_create.return_value = stream()
+        
+        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test_key'}):
+            summarizer = PresentationSummarizer(cache=MemoryResponseCache())
+            pieces = list(summarizer.generate_summary_stream("Test content"))
+            cached = list(summarizer.generate_summary_stream("Test content"))
+        
+        assert pieces == ["Revenue", " grew."]
+        assert cached == ["Revenue grew."]
+        assert mock_create.call_count == 1
+        assert mock_create.call_args.kwargs["stream"] is True
+    
+    @patch('openai.ChatCompletion.acreate')
+    def test_edited_deck_only_resummarizes_changed_groups(self, mock_create):
+        """Test that content-defined groups keep unchanged partial summaries cached."""
+        def reply(**kwargs):
+            prompt = kwargs["messages"][1]["content"]
+            return Mock(choices=[Mock(message=Mock(content=f"Summary {len(prompt)} {prompt[-60:]}"))])
+        mock_create.side_effect = reply
+        
+        slides = [f"Slide {n}: Workstream {n}\nFindings for workstream {n} covering scope, risks and revenue impact.\n" for n in range(1, 151)]
+        edited = list(slides)
+        edited[40] = "Slide 41: Workstream 41\nRevised findings after the steering committee review.\n"
+        edited[110] = "Slide 111: Workstream 111\nNew risk identified in the vendor contract.\n"
+        
+        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test_key'}):
+            summarizer = PresentationSummarizer(cache=MemoryResponseCache())
+            summarizer.generate_chunked_summary(slides, chunk_tokens=400)
+            first_calls = mock_create.call_count
+            summarizer.generate_chunked_summary(edited, chunk_tokens=400)
+            second_calls = mock_create.call_count - first_calls
+        
+        assert first_calls > 10
+        assert second_calls <= 5
+    
+    @patch('openai.ChatCompletion.acreate')
+    def test_seeded_sections_skip_unchanged_groups(self, mock_create):
+        """Test that section summaries from a similar deck are reused without a response cache."""
+        mock_create.side_effect = lambda **kwargs: Mock(
+            choices=[Mock(message=Mock(content='{"title": "T", "summary": "S"}'))]
+        )
+        slides = [f"Slide {n}: Workstream {n}\nFindings for workstream {n} covering scope, risks and revenue impact.\n" for n in range(1, 151)]
+        edited = list(slides)
+        edited[40] = "Slide 41: Workstream 41\nRevised findings after the steering committee review.\n"
+        
+        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test_key'}):
+            summarizer = PresentationSummarizer()
+            sections = {}
+            summarizer.generate_summary_with_title(slides, chunk_tokens=400, sections=sections)
+            first_calls = mock_create.call_count
+            summarizer.generate_summary_with_title(edited, chunk_tokens=400, sections=dict(sections))
+            second_calls = mock_create.call_count - first_calls
+        
+        assert len(sections) == first_calls - 1
+        assert second_calls <= 4
+    
+    @patch('openai.ChatCompletion.acreate')
+    def test_inserted_slide_keeps_later_groups_cached(self, mock_create):
+        """Test that renumbering the slides after an insertion does not miss the cache."""
+        mock_create.side_effect = lambda **kwargs: Mock(
+            choices=[Mock(message=Mock(content=f"Summary of {len(kwargs['messages'][1]['content'])}"))]
+        )
+        records = [
+            SlideRecord(n, f"Workstream {n}", (f"Findings for workstream {n} covering scope, risks and revenue impact.",), "")
+            for n in range(1, 151)
+        ]
+        inserted = records[:60] + [SlideRecord(61, "Vendor risk", ("A new risk in the vendor contract.",), "")] + [
+            record._replace(slide_number=record.slide_number + 1) for record in records[60:]
+        ]
+        
+        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test_key'}):
+            summarizer = PresentationSummarizer(cache=MemoryResponseCache())
+            chunks = ["\n".join(record.text_lines()) for record in records]
+            summarizer.generate_chunked_summary(chunks, chunk_tokens=400)
+            first_calls = mock_create.call_count
+            chunks = ["\n".join(record.text_lines()) for record in inserted]
+            summarizer.generate_chunked_summary(chunks, chunk_tokens=400)
+            second_calls = mock_create.call_count - first_calls
+        
+        assert first_calls > 10
+        assert second_calls <= 4
+    
+    def test_content_defined_groups_are_stable_around_edits(self):
+        """Test that inserting a slide leaves groups away from it unchanged."""
+        slides = [f"Slide {n}: Topic {n}\nDetails about topic {n} and its outcomes.\n" for n in range(1, 121)]
+        inserted = slides[:60] + ["Slide 60b: Extra\nA newly inserted backup slide.\n"] + slides[60:]
+        
+        before = group_chunks(slides, chunk_tokens=200, content_defined=True)
+        after = group_chunks(inserted, chunk_tokens=200, content_defined=True)
+        
+        assert len(set(before) - set(after)) <= 2
+        assert group_chunks(slides[:3], chunk_tokens=200, content_defined=True) == ["\n".join(slides[:3])]
 
 class TestSlideGenerator:
     """Tests for SlideGenerator class."""
@@ -97,6 +353,221 @@ class TestSlideGenerator:
         generator.save(str(output_path))
         
         assert output_path.exists()
+    
+    def test_save_to_stream(self):
+        """Test that save writes a complete presentation to a binary stream."""
+        generator = SlideGenerator()
+        generator.add_summary_slide(title="Test", summary="Summary")
+        
+        buffer = io.BytesIO()
+        generator.save(buffer)
+        
+        assert len(Presentation(io.BytesIO(buffer.getvalue())).slides) == 1
+
+
+
+class TestSlideRenderer:
+    """Tests for SlideRenderer class."""
+    
+    def test_render_matches_generated_slide(self):
+        """Test that the rendered slide has the text and styling of SlideGenerator."""
+        data = SlideRenderer().render(
+            "Q3 <Review> & Plan", "First point\nSecond & final point", "Executive Summary"
+        )
+        
+        slide = Presentation(io.BytesIO(data)).slides[0]
+        title, subtitle, body = slide.shapes
+        
+        assert title.text_frame.text == "Q3 <Review> & Plan"
+        assert title.text_frame.paragraphs[0].font.size == Pt(44)
+        assert subtitle.text_frame.text == "Executive Summary"
+        assert body.text_frame.text == "First point\nSecond & final point"
+        assert all(paragraph.font.size == Pt(16) for paragraph in body.text_frame.paragraphs)
+    
+    def test_render_without_subtitle(self):
+        """Test that the subtitle box is omitted when there is no subtitle."""
+        slide = Presentation(io.BytesIO(SlideRenderer().render("Title", "Summary"))).slides[0]
+        
+        assert [shape.text_frame.text for shape in slide.shapes] == ["Title", "Summary"]
+    
+    def test_template_slides_are_dropped(self, tmp_path):
+        """Test that a template's own slides do not appear in the output."""
+        template = Presentation()
+        template.slides.add_slide(template.slide_layouts[0]).shapes.title.text = "Company intro"
+        template_path = tmp_path / "corporate.pptx"
+        template.save(str(template_path))
+        
+        data = SlideRenderer(str(template_path)).render("Title", "Summary")
+        slides = Presentation(io.BytesIO(data)).slides
+        
+        assert len(slides) == 1
+        assert "Company intro" not in [shape.text_frame.text for shape in slides[0].shapes]
+    
+    def test_blank_layout_is_found_by_type(self, tmp_path):
+        """Test that a template whose layouts are reordered still gets a blank slide."""
+        template = Presentation()
+        layout_ids = template.slide_masters[0].slide_layouts._sldLayoutIdLst
+        layout_ids.insert(0, layout_ids[6])
+        template_path = tmp_path / "reordered.pptx"
+        template.save(str(template_path))
+        
+        slide = Presentation(io.BytesIO(SlideRenderer(str(template_path)).render("Title", "Summary"))).slides[0]
+        
+        assert slide.slide_layout.name == "Blank"
+        assert [shape.text_frame.text for shape in slide.shapes] == ["Title", "Summary"]
+    
+    def test_template_slide_size_is_kept(self, tmp_path):
+        """Test that a widescreen template keeps its size and the summary fits it."""
+        template = Presentation()
+        template.slide_width, template.slide_height = Inches(13.333), Inches(7.5)
+        template_path = tmp_path / "widescreen.pptx"
+        template.save(str(template_path))
+        
+        data = SlideRenderer(str(template_path)).render("Review", "Summary", "Executive Summary")
+        presentation = Presentation(io.BytesIO(data))
+        body = presentation.slides[0].shapes[2]
+        
+        assert (presentation.slide_width, presentation.slide_height) == (Inches(13.333), Inches(7.5))
+        assert body.left + body.width == presentation.slide_width - Inches(0.8)
+    
+    def test_create_summary_presentation_reuses_renderer(self, tmp_path):
+        """Test that the template is only loaded once per process."""
+        get_renderer.cache_clear()
+        with patch("slide_generator.SlideGenerator", wraps=SlideGenerator) as build:
+            for index in range(3):
+                create_summary_presentation("Title", "Summary", str(tmp_path / f"out{index}.pptx"), subtitle="Sub")
+        
+        assert build.call_count == 1
+        assert len(Presentation(str(tmp_path / "out2.pptx")).slides) == 1
+    
+    def test_create_summary_presentation_to_stream(self):
+        """Test that a summary presentation can be written to memory."""
+        buffer = io.BytesIO()
+        create_summary_presentation("Title", "Summary", buffer, subtitle="Sub")
+        
+        slide = Presentation(io.BytesIO(buffer.getvalue())).slides[0]
+        assert [shape.text_frame.text for shape in slide.shapes] == ["Title", "Sub", "Summary"]
+    
+    def test_long_summary_continues_on_more_slides(self):
+        """Test that an overlong summary is split across continuation slides."""
+        points = [f"Point {index}: " + "margins improved as costs declined " * 5 for index in range(30)]
+        data = SlideRenderer().render("Review", "\n".join(points), "Executive Summary")
+        
+        slides = Presentation(io.BytesIO(data)).slides
+        titles = [slide.shapes[0].text_frame.text for slide in slides]
+        bodies = [slide.shapes[2].text_frame for slide in slides]
+        
+        assert len(slides) > 1
+        assert titles == ["Review"] + ["Review (continued)"] * (len(slides) - 1)
+        assert [p.text for body in bodies for p in body.paragraphs] == points
+        assert all(p.font.size == Pt(14) for body in bodies for p in body.paragraphs)
+    
+    def test_breakdown_slide_follows_summary(self):
+        """Test that section lines are rendered on a slide after the summary."""
+        sections = ["Slides 1–3: Introduction", "Slides 4–9: Market"]
+        data = SlideRenderer().render("Review", "Summary", sections=sections)
+        
+        slides = Presentation(io.BytesIO(data)).slides
+        
+        assert len(slides) == 2
+        assert [shape.text_frame.text for shape in slides[1].shapes] == [
+            "Review", "Section Breakdown", "\n".join(sections)
+        ]
+
+
+
+class TestInsertSummaryPresentation:
+    """Tests for adding summary slides to the original deck."""
+    
+    def test_summary_slides_are_inserted_first(self, sample_deck, tmp_path):
+        """Test that the summary and breakdown slides precede the original slides."""
+        output = tmp_path / "with_summary.pptx"
+        insert_summary_presentation(
+            str(sample_deck), "Review", "Summary", str(output),
+            subtitle="Executive Summary", sections=["Slides 1–3: Quarterly Results"]
+        )
+        
+        slides = Presentation(str(output)).slides
+        
+        assert len(slides) == 5
+        assert [shape.text_frame.text for shape in slides[0].shapes] == ["Review", "Executive Summary", "Summary"]
+        assert slides[1].shapes[1].text_frame.text == "Section Breakdown"
+        assert slides[0].slide_layout.name == "Blank"
+        assert [slide.shapes.title.text for slide in list(slides)[2:]] == [
+            "Quarterly Results", "Roadmap", "Next Steps"
+        ]
+    
+    def test_summary_fits_widescreen_deck_height(self, tmp_path):
+        """Test that summary text is fitted to a 16:9 deck's shorter slides."""
+        deck = Presentation()
+        deck.slide_width, deck.slide_height = Inches(10), Inches(5.625)
+        deck.slides.add_slide(deck.slide_layouts[1]).shapes.title.text = "Agenda"
+        deck_path = tmp_path / "widescreen.pptx"
+        deck.save(str(deck_path))
+        
+        points = [f"Point {index}: " + "margins improved as costs declined " * 3 for index in range(12)]
+        output = tmp_path / "with_summary.pptx"
+        insert_summary_presentation(str(deck_path), "Review", "\n".join(points), str(output), "Executive Summary")
+        
+        presentation = Presentation(str(output))
+        summary_slides = list(presentation.slides)[:-1]
+        bodies = [slide.shapes[2] for slide in summary_slides]
+        
+        assert len(summary_slides) > len(SlideRenderer().render_slides("Review", "\n".join(points), "Executive Summary"))
+        assert all(body.top + body.height <= presentation.slide_height for body in bodies)
+        assert [p.text for body in bodies for p in body.text_frame.paragraphs] == points
+    
+    def test_unchanged_parts_are_copied_compressed(self, sample_deck, tmp_path):
+        """Test that entries other than the rewritten parts are copied byte for byte."""
+        output = tmp_path / "with_summary.pptx"
+        insert_summary_presentation(str(sample_deck), "Review", "Summary", str(output))
+        
+        rewritten = {"[Content_Types].xml", "ppt/presentation.xml", "ppt/_rels/presentation.xml.rels"}
+        with zipfile.ZipFile(str(sample_deck)) as source, zipfile.ZipFile(str(output)) as copied:
+            assert copied.testzip() is None
+            for info in source.infolist():
+                if info.filename in rewritten:
+                    continue
+                copy = copied.getinfo(info.filename)
+                assert (copy.CRC, copy.compress_size, copy.compress_type) == (
+                    info.CRC, info.compress_size, info.compress_type
+                )
+    
+    @pytest.mark.parametrize("raw_copy", [True, False])
+    def test_zip64_entries_are_copied(self, sample_deck, tmp_path, raw_copy):
+        """Test that entries with ZIP64 and other extra records copy intact on both paths."""
+        timestamp = struct.pack("<HHBI", 0x5455, 5, 1, 1700000000)
+        zip64_deck = tmp_path / "zip64.pptx"
+        with zipfile.ZipFile(str(sample_deck)) as source, zipfile.ZipFile(str(zip64_deck), "w") as target:
+            for info in source.infolist():
+                entry = zipfile.ZipInfo(info.filename, info.date_time)
+                entry.compress_type = zipfile.ZIP_DEFLATED
+                entry.extra = timestamp
+                with target.open(entry, "w", force_zip64=True) as writer:
+                    writer.write(source.read(info))
+        
+        output = tmp_path / "with_summary.pptx"
+        with patch("pptx_package.raw_copy_supported", return_value=raw_copy):
+            insert_summary_presentation(str(zip64_deck), "Review", "Summary", str(output))
+        
+        rewritten = {"[Content_Types].xml", "ppt/presentation.xml", "ppt/_rels/presentation.xml.rels"}
+        with zipfile.ZipFile(str(zip64_deck)) as source, zipfile.ZipFile(str(output)) as copied:
+            assert copied.testzip() is None
+            for info in source.infolist():
+                if info.filename in rewritten:
+                    continue
+                assert copied.read(info.filename) == source.read(info)
+                assert copied.getinfo(info.filename).extra == timestamp
+        assert len(Presentation(str(output)).slides) == 4
+    
+    def test_source_can_be_overwritten(self, sample_deck):
+        """Test that the original file can be updated in place."""
+        insert_summary_presentation(str(sample_deck), "Review", "Summary", str(sample_deck))
+        
+        slides = Presentation(str(sample_deck)).slides
+        assert len(slides) == 4
+        assert slides[0].shapes[0].text_frame.text == "Review"
+        assert sorted(path.name for path in sample_deck.parent.iterdir()) == [sample_deck.name]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+"""Test cases for token counting and prompt budgeting."""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from token_budget import (
+    completion_budget,
+    context_limit,
+    count_tokens,
+    fair_shares,
+    fit_sources,
+    truncate_to_tokens,
+)
+from summarizer import input_token_limit
+
+
+class TestTokenBudget:
+    """Tests for the token budgeting helpers."""
+    
+    def test_context_limit_uses_longest_prefix(self):
+        """Test that model variants resolve to their own context window."""
+        assert context_limit("gpt-4-0613") == 8192
+        assert context_limit("gpt-4-32k-0613") == 32768
+        assert context_limit("gpt-3.5-turbo-16k") == 16385
+        assert context_limit("unknown-model") == 4096
+    
+    def test_fair_shares_gives_small_sources_everything(self):
+        """Test max-min fair allocation of a token budget."""
+        shares = fair_shares({"small": 10, "medium": 50, "large": 500}, budget=130)
+        
+        assert shares == {"small": 10, "medium": 50, "large": 70}
+        assert fair_shares({"a": 100, "b": 100}, budget=51) == {"a": 26, "b": 25}
+    
+    def test_fit_sources_truncates_only_large_sources(self):
+        """Test that sources are cut to their share and keep their order."""
+        sources = {"notes.txt": "short", "report.pdf": "x" * 4000}
+        fitted = fit_sources(sources, budget=100)
+        
+        assert list(fitted) == ["notes.txt", "report.pdf"]
+        assert fitted["notes.txt"] == "short"
+        assert fitted["report.pdf"].endswith("...")
+        assert len(fitted["report.pdf"]) <= 98 * 4
+        assert truncate_to_tokens("fits", 10) == "fits"
+    
+    def test_truncation_marker_counts_against_the_budget(self):
+        """Test that truncated text plus its marker never exceeds the limit."""
+        text = "word " * 100
+        
+        for max_tokens in range(0, 12):
+            assert count_tokens(truncate_to_tokens(text, max_tokens)) <= max_tokens
+        assert truncate_to_tokens(text, 1) == "..."
+        assert truncate_to_tokens(text, 0) == ""
+        assert truncate_to_tokens(text, 1, marker=" [truncated]") == ""
+    
+    def test_completion_budget_shrinks_to_the_context(self):
+        """Test that max_tokens is clamped and oversized prompts are rejected."""
+        messages = [{"role": "user", "content": "x" * 4 * 4000}]
+        
+        assert completion_budget(messages, "gpt-3.5-turbo", 500) == 4096 - 4000 - 7
+        assert completion_budget(messages, "gpt-4", 500) == 500
+        with pytest.raises(ValueError):
+            completion_budget([{"role": "user", "content": "x" * 4 * 4096}], "gpt-3.5-turbo", 500)
+    
+    def test_input_token_limit_depends_on_model(self):
+        """Test that larger context windows allow larger slide groups."""
+        assert 0 < input_token_limit("gpt-3.5-turbo", 400) < input_token_limit("gpt-4", 400)
+        with pytest.raises(ValueError):
+            input_token_limit("gpt-3.5-turbo", 4000)
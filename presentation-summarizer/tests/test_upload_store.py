@@ -0,0 +1,60 @@
+"""Test cases for the server-side upload store."""
+
+import pytest
+import sys
+import os
+from unittest.mock import patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from upload_store import UploadStore
+
+
+class TestUploadStore:
+    """Tests for UploadStore class."""
+    
+    def test_create_and_update(self):
+        """Test that uploads get opaque IDs and accept later fields."""
+        store = UploadStore()
+        upload_id = store.create(file_path="/tmp/deck.pptx", file_name="deck.pptx", slides=None)
+        
+        assert "/" not in upload_id
+        assert store.update(upload_id, slides=("slide",))
+        
+        upload = store.get(upload_id)
+        assert upload["upload_id"] == upload_id
+        assert upload["file_name"] == "deck.pptx"
+        assert upload["slides"] == ("slide",)
+        assert store.get("unknown") is None
+        assert not store.update("unknown", slides=())
+    
+    def test_least_recently_used_upload_is_evicted(self):
+        """Test that the size limit drops the least recently used upload."""
+        store = UploadStore(max_entries=2)
+        first = store.create(file_name="a.pptx")
+        second = store.create(file_name="b.pptx")
+        store.get(first)
+        third = store.create(file_name="c.pptx")
+        
+        assert store.get(second) is None
+        assert store.get(first) is not None
+        assert store.get(third) is not None
+    
+    def test_unused_upload_expires(self):
+        """Test that uploads not used within the TTL are dropped."""
+        store = UploadStore(ttl=60)
+        with patch("upload_store.time.time", return_value=1000.0):
+            upload_id = store.create(file_name="a.pptx")
+        
+        with patch("upload_store.time.time", return_value=1030.0):
+            assert store.get(upload_id) is not None
+        with patch("upload_store.time.time", return_value=1100.0):
+            assert store.get(upload_id) is None
+    
+    def test_invalid_settings(self):
+        """Test that non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            UploadStore(ttl=0)
+        with pytest.raises(ValueError):
+            UploadStore(max_entries=0)